@@ -0,0 +1,63 @@
+"""Show the CPU versus bytes trade-off of each compression codec and level.
+
+For each format and codec, the data is written to a local file as in the
+step dataframe_to_local, then read back as in the step local_to_dataframe.
+The CPU time of both steps is printed with the size of the file, which is
+the number of bytes transferred by the steps local_to_bucket and
+bucket_to_local. Run from the root of the repo:
+
+    python -m benchmarks.compression --nb_rows 200000
+"""
+import os
+import time
+import argparse
+import tempfile
+from google_pandas_load import constants, utils
+from google_pandas_load.load_config import LoadConfig
+from benchmarks.formats import build_dataframe, write
+
+LEVELS = {'gzip': [1, 6, 9], 'zstd': [1, 3, 9], 'deflate': [1, 6, 9]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nb_rows', type=int, default=100000)
+    parser.add_argument('--nb_cols_per_type', type=int, default=5)
+    args = parser.parse_args()
+
+    dataframe = build_dataframe(args.nb_rows, args.nb_cols_per_type)
+    timestamp_cols = [c for c in dataframe.columns if c.startswith('t')]
+    bq_schema = LoadConfig.bq_schema_inferred_from_dataframe(
+        dataframe, timestamp_cols=timestamp_cols)
+
+    print(f'{"format":8} {"compression":12} {"level":>5} {"MB":>7} '
+          f'{"dataframe_to_local":>19} {"local_to_dataframe":>19}')
+    with tempfile.TemporaryDirectory() as dir_path:
+        for format in constants.FORMATS:
+            for compression in constants.COMPRESSIONS[format]:
+                path = os.path.join(
+                    dir_path,
+                    'data' + utils.file_extension(format, compression))
+                for level in LEVELS.get(compression, [None]):
+                    start = time.process_time()
+                    try:
+                        write(dataframe, path, format, bq_schema,
+                              compression, level)
+                    except (ImportError, ValueError) as e:
+                        # For instance, cramjam is missing for Avro snappy.
+                        print(f'{format:8} {compression:12} skipped: {e}')
+                        continue
+                    write_seconds = time.process_time() - start
+                    start = time.process_time()
+                    utils.local_file_to_dataframe(
+                        path, format, '|', None, None, None, None)
+                    read_seconds = time.process_time() - start
+                    size = os.path.getsize(path) / 2**20
+                    print(f'{format:8} {compression:12} {str(level):>5} '
+                          f'{size:7.1f} {write_seconds:18.2f}s '
+                          f'{read_seconds:18.2f}s')
+                    os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
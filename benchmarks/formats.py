@@ -0,0 +1,71 @@
+"""Compare the time spent writing and parsing a local file in each format.
+
+The data is a wide table with INTEGER, FLOAT, STRING and TIMESTAMP columns,
+written the way BigQuery would extract it. Run from the root of the repo:
+
+    python -m benchmarks.formats --nb_rows 200000
+"""
+import os
+import time
+import argparse
+import tempfile
+import numpy
+import pandas
+from google_pandas_load import constants, utils
+from google_pandas_load.load_config import LoadConfig
+
+
+def build_dataframe(nb_rows, nb_cols_per_type):
+    rng = numpy.random.default_rng(0)
+    data = dict()
+    for i in range(nb_cols_per_type):
+        data[f'i{i}'] = rng.integers(0, 10**6, nb_rows)
+        data[f'f{i}'] = rng.random(nb_rows)
+        data[f's{i}'] = rng.integers(0, 10**3, nb_rows).astype(str)
+        data[f't{i}'] = pandas.to_datetime(
+            rng.integers(0, 10**9, nb_rows), unit='s')
+    return pandas.DataFrame(data=data)
+
+
+def write(dataframe, path, format, bq_schema, compression,
+          compression_level=None):
+    if format == 'csv':
+        utils.dataframe_to_csv_file(
+            dataframe, path, '|', compression, compression_level)
+    elif format == 'parquet':
+        utils.dataframe_to_parquet_file(
+            dataframe, path, bq_schema, compression, compression_level)
+    else:
+        utils.dataframe_to_avro_file(
+            dataframe, path, bq_schema, compression, compression_level)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nb_rows', type=int, default=100000)
+    parser.add_argument('--nb_cols_per_type', type=int, default=5)
+    args = parser.parse_args()
+
+    dataframe = build_dataframe(args.nb_rows, args.nb_cols_per_type)
+    timestamp_cols = [c for c in dataframe.columns if c.startswith('t')]
+    bq_schema = LoadConfig.bq_schema_inferred_from_dataframe(
+        dataframe, timestamp_cols=timestamp_cols)
+
+    with tempfile.TemporaryDirectory() as dir_path:
+        for format in constants.FORMATS:
+            compression = constants.DEFAULT_COMPRESSIONS[format]
+            path = os.path.join(
+                dir_path, 'data' + utils.file_extension(format, compression))
+            start = time.monotonic()
+            write(dataframe, path, format, bq_schema, compression)
+            write_seconds = time.monotonic() - start
+            start = time.monotonic()
+            utils.local_file_to_dataframe(
+                path, format, '|', None, timestamp_cols, None, None)
+            parse_seconds = time.monotonic() - start
+            print(f'{format:8} size {os.path.getsize(path)/2**20:7.1f} MB '
+                  f'write {write_seconds:6.2f}s parse {parse_seconds:6.2f}s')
+
+
+if __name__ == '__main__':
+    main()
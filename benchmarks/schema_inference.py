@@ -0,0 +1,61 @@
+"""Compare the time spent inferring a BigQuery schema from a dataframe with
+and without the sampling of the object columns.
+
+The data is a tall table and a wide table, each with typed columns and
+object columns holding strings, integers and floats. Run from the root of
+the repo:
+
+    python -m benchmarks.schema_inference --nb_rows 2000000
+"""
+import time
+import argparse
+import numpy
+import pandas
+from google_pandas_load.load_config import LoadConfig
+
+
+def build_dataframe(nb_rows, nb_cols_per_type):
+    rng = numpy.random.default_rng(0)
+    data = dict()
+    for i in range(nb_cols_per_type):
+        data[f'i{i}'] = rng.integers(0, 10**6, nb_rows)
+        data[f'f{i}'] = rng.random(nb_rows)
+        data[f's{i}'] = rng.integers(0, 10**3, nb_rows).astype(str)
+        data[f'oi{i}'] = pandas.Series(
+            rng.integers(0, 10**6, nb_rows), dtype=object)
+        data[f'of{i}'] = pandas.Series(rng.random(nb_rows), dtype=object)
+    dataframe = pandas.DataFrame(data=data)
+    for i in range(nb_cols_per_type):
+        dataframe[f's{i}'] = dataframe[f's{i}'].astype(object)
+    return dataframe
+
+
+def time_inference(dataframe, strict):
+    start = time.monotonic()
+    bq_schema = LoadConfig.bq_schema_inferred_from_dataframe(
+        dataframe, strict=strict)
+    return time.monotonic() - start, bq_schema
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nb_rows', type=int, default=1000000)
+    parser.add_argument('--nb_cols_per_type', type=int, default=2)
+    args = parser.parse_args()
+
+    shapes = {
+        'tall': (args.nb_rows, args.nb_cols_per_type),
+        'wide': (args.nb_rows // 20, args.nb_cols_per_type * 20)}
+    for name, (nb_rows, nb_cols_per_type) in shapes.items():
+        dataframe = build_dataframe(nb_rows, nb_cols_per_type)
+        strict_seconds, strict_bq_schema = time_inference(dataframe, True)
+        sampled_seconds, sampled_bq_schema = time_inference(dataframe, False)
+        assert sampled_bq_schema == strict_bq_schema
+        print(f'{name:4} {dataframe.shape[0]:9} rows '
+              f'{dataframe.shape[1]:4} cols '
+              f'strict {strict_seconds:6.2f}s '
+              f'sampled {sampled_seconds:6.2f}s')
+
+
+if __name__ == '__main__':
+    main()
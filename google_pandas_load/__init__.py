@@ -1,3 +1,6 @@
 from google_pandas_load.loader import Loader
 from google_pandas_load.loader_quick_setup import LoaderQuickSetup
 from google_pandas_load.load_config import LoadConfig
+from google_pandas_load.async_loader import AsyncLoader
+from google_pandas_load.multi_load_handle import MultiLoadHandle
+from google_pandas_load.result_cache import ResultCache
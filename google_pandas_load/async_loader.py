@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import pandas
+from functools import partial
+from typing import Literal, List, Dict, Any, Optional
+from datetime import datetime
+from google.cloud import bigquery
+from google_pandas_load import constants, load_config, utils
+from google_pandas_load.loader import Loader
+
+
+class AsyncLoader(Loader):
+    """Asyncio version of :class:`google_pandas_load.loader.Loader`.
+
+    An AsyncLoader is built with the same arguments as the base class. Its
+    methods load and multi_load are coroutines which take the same arguments
+    and return the same results as the ones of the base class.
+
+    They never block the event loop:
+
+    - The completion of the BigQuery jobs is awaited by polling them every
+      constants.JOB_POLLING_INTERVAL seconds. As with the base class, the
+      first failure is raised at once and the other jobs are cancelled.
+    - The Storage transfers of the configurations are run concurrently in
+      the default executor of the event loop.
+    - The parsing of the local files is run in the default executor of the
+      event loop. After a failure, the error is raised once the parsings
+      already running have ended.
+    - With schedule='config', the chains of the configurations run as in
+      the base class, in the default executor of the event loop.
+    """
+
+    @staticmethod
+    async def _run_in_executor(function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(function, *args))
+
+    @classmethod
+    async def _map_in_executor_until_failure(cls, function, iterable):
+        # Asyncio version of utils.map_in_threads_until_failure. The calls
+        # run in the default executor. After the first failure, the calls
+        # not started yet do not run, and the error is raised once the
+        # running calls have ended, since their threads cannot be stopped.
+        cancel_event = threading.Event()
+
+        def run(item):
+            utils.check_not_cancelled(cancel_event)
+            return function(item)
+
+        tasks = [asyncio.ensure_future(cls._run_in_executor(run, item))
+                 for item in iterable]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        except BaseException:
+            cancel_event.set()
+            await asyncio.wait(tasks)
+            raise
+        errors = [t.exception() for t in tasks
+                  if t.done() and not t.cancelled() and
+                  t.exception() is not None]
+        if len(errors) > 0:
+            cancel_event.set()
+            await asyncio.wait(tasks)
+            raise errors[0]
+        return [t.result() for t in tasks]
+
+    async def _async_wait_for_jobs(self, jobs, deadline):
+        try:
+            pending_jobs = await self._run_in_executor(utils.poll_jobs, jobs)
+            while len(pending_jobs) > 0:
+                utils.check_deadline(deadline, pending_jobs)
+                await asyncio.sleep(utils.seconds_before_next_poll(deadline))
+                pending_jobs = await self._run_in_executor(
+                    utils.poll_jobs, pending_jobs)
+        except BaseException:
+            await self._run_in_executor(utils.cancel_jobs, jobs)
+            raise
+
+    async def _async_execute_bq_client_loads(self, atomic_configs, deadline):
+        configs = atomic_configs
+        jobs = await self._run_in_executor(
+            self._launch_bq_client_jobs, configs)
+        await self._async_wait_for_jobs(jobs, deadline)
+        return jobs
+
+    async def _async_execute_local_loads(self, atomic_configs):
+        configs = atomic_configs
+        if configs[0].destination == 'bucket':
+            return await self._run_in_executor(
+                self._execute_local_loads, configs)
+        return await self._map_in_executor_until_failure(
+            self._execute_local_load, configs)
+
+    async def _async_execute_same_type_loads(self, atomic_configs, deadline):
+        configs = atomic_configs
+        source, destination = self._same_type_loads_locations(configs)
+        atomic_function_name = f'{source}_to_{destination}'
+        self._log(f'Starting {source} to {destination}...')
+        start_timestamp = datetime.now()
+        await self._run_in_executor(self._prepare_same_type_loads, configs)
+        try:
+            if atomic_function_name in \
+                    constants.BQ_CLIENT_ATOMIC_FUNCTION_NAMES:
+                res = await self._async_execute_bq_client_loads(
+                    configs, deadline)
+            else:
+                res = await self._async_execute_local_loads(configs)
+        finally:
+            self._invalidate_destinations(configs)
+            await self._run_in_executor(self._clear_sources, configs)
+        self._log_end_of_same_type_loads(configs, start_timestamp, res)
+        return res
+
+    async def multi_load(
+            self,
+            configs: List[load_config.LoadConfig],
+            deadline: Optional[float] = None):
+        """See :meth:`google_pandas_load.loader.Loader.multi_load`."""
+        absolute_deadline = utils.compute_deadline(deadline)
+        sliced_configs = await self._run_in_executor(
+            self._prepare_sliced_configs, configs)
+        if self._schedule == 'config':
+            res = await self._run_in_executor(
+                self._execute_chains, sliced_configs, absolute_deadline)
+            self._log_saved_metadata_calls(sliced_configs)
+            return res
+        res = dict()
+        for n, indexed_atomic_configs in self._iter_stages(sliced_configs):
+            atomic_configs = [iac[1] for iac in indexed_atomic_configs]
+            n_res = await self._async_execute_same_type_loads(
+                atomic_configs, absolute_deadline)
+            self._store_results(res, n, indexed_atomic_configs, n_res)
+        res = [res.get(i) for i in range(len(sliced_configs))]
+        self._log_saved_metadata_calls(sliced_configs)
+        return res
+
+    async def load(
+            self,
+            source: Literal[
+                'query', 'dataset', 'bucket', 'local', 'dataframe'],
+            destination: Literal['dataset', 'bucket', 'local', 'dataframe'],
+
+            data_name: Optional[str] = None,
+            query: Optional[str] = None,
+            dataframe: Optional[pandas.DataFrame] = None,
+
+            write_disposition: Optional[str] =
+            bigquery.WriteDisposition.WRITE_TRUNCATE,
+            dtype: Optional[Dict[str, Any]] = None,
+            parse_dates: Optional[List[str]] = None,
+            date_cols: Optional[List[str]] = None,
+            timestamp_cols: Optional[List[str]] = None,
+            bq_schema: Optional[List[bigquery.SchemaField]] = None,
+            format: Optional[Literal['csv', 'parquet', 'avro']] = None,
+            compression: Optional[str] = None,
+            compression_level: Optional[int] = None,
+            result_type: Literal['pandas', 'arrow'] = 'pandas',
+            engine: Optional[Literal['c', 'python', 'pyarrow']] = None,
+            dtype_backend: Optional[
+                Literal['numpy_nullable', 'pyarrow']] = None,
+            read_engine: Optional[Literal['extract', 'storage']] = None,
+            write_engine: Optional[Literal['load_job', 'storage']] = None,
+            columns: Optional[List[str]] = None,
+            max_rows: Optional[int] = None,
+            compact_dtypes: Optional[bool] = False,
+            strict_schema_inference: Optional[bool] = None):
+        """See :meth:`google_pandas_load.loader.Loader.load`."""
+        config = load_config.LoadConfig(
+            source=source,
+            destination=destination,
+
+            data_name=data_name,
+            query=query,
+            dataframe=dataframe,
+
+            write_disposition=write_disposition,
+            dtype=dtype,
+            parse_dates=parse_dates,
+            date_cols=date_cols,
+            timestamp_cols=timestamp_cols,
+            bq_schema=bq_schema,
+            format=format,
+            compression=compression,
+            compression_level=compression_level,
+            result_type=result_type,
+            engine=engine,
+            dtype_backend=dtype_backend,
+            read_engine=read_engine,
+            write_engine=write_engine,
+            columns=columns,
+            max_rows=max_rows,
+            compact_dtypes=compact_dtypes,
+            strict_schema_inference=strict_schema_inference)
+
+        return (await self.multi_load(configs=[config]))[0]
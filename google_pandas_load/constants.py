@@ -3,10 +3,38 @@ REVERSED_LOCATIONS = list(reversed(LOCATIONS))
 SOURCE_LOCATIONS = LOCATIONS
 DESTINATION_LOCATIONS = LOCATIONS[1:]
 MIDDLE_LOCATIONS = LOCATIONS[1: -1]
+FORMATS = ['csv', 'parquet', 'avro']
+RESULT_TYPES = ['pandas', 'arrow']
+READ_ENGINES = ['extract', 'storage']
+WRITE_ENGINES = ['load_job', 'storage']
+CSV_ENGINES = ['c', 'python', 'pyarrow']
+DTYPE_BACKENDS = ['numpy_nullable', 'pyarrow']
+FILE_EXTENSIONS = {'csv': '.csv', 'parquet': '.parquet', 'avro': '.avro'}
+COMPRESSIONS = {
+    'csv': ['none', 'gzip'],
+    'parquet': ['none', 'snappy', 'gzip', 'zstd'],
+    'avro': ['none', 'deflate', 'snappy']}
+DEFAULT_COMPRESSIONS = {'csv': 'gzip', 'parquet': 'snappy', 'avro': 'deflate'}
 DESTINATIONS_TO_ALWAYS_CLEAR = ['bucket', 'local']
+FUSED_FUNCTION_NAMES = [
+    'query_to_dataframe', 'dataset_to_dataframe', 'bucket_to_dataframe',
+    'dataframe_to_bucket', 'dataframe_to_dataset']
 ATOMIC_FUNCTION_NAMES = [
-    'query_to_dataset', 'dataset_to_bucket', 'bucket_to_local',
+    'query_to_dataframe', 'query_to_dataset', 'dataset_to_dataframe',
+    'dataset_to_bucket', 'bucket_to_local', 'bucket_to_dataframe',
     'local_to_dataframe', 'dataframe_to_local', 'local_to_bucket',
-    'bucket_to_dataset']
+    'dataframe_to_bucket', 'bucket_to_dataset', 'dataframe_to_dataset']
 BQ_CLIENT_ATOMIC_FUNCTION_NAMES = [
-    'query_to_dataset', 'dataset_to_bucket', 'bucket_to_dataset']
+    'query_to_dataset', 'dataset_to_bucket', 'bucket_to_dataset',
+    'dataframe_to_dataset']
+PIPELINE_QUEUE_SIZE = 2
+STREAM_UPLOAD_NB_ROWS = 100000
+STORAGE_WRITE_NB_ROWS = 10000
+STORAGE_WRITE_MAX_REQUEST_BYTES = 9 * 10**6
+COMPACT_CATEGORY_MAX_RATIO = 0.5
+COMPACT_CATEGORY_SAMPLE_SIZE = 10000
+CHECKSUM_CHUNK_SIZE = 2**20
+SCHEMA_INFERENCE_SAMPLE_SIZE = 10000
+JOB_POLLING_INTERVAL = 1
+MAX_CHAIN_WORKERS = 16
+SCHEDULES = ['stage', 'config']
@@ -9,8 +9,10 @@ class LoadConfig:
     """Configuration for a load job.
 
     This class has the same parameters as
-    :meth:`google_pandas_load.loader.Loader.load`. It is used to launch
-    simultaneously load jobs as follows:
+    :meth:`google_pandas_load.loader.Loader.load`, plus the chunksize
+    parameter of :meth:`google_pandas_load.loader.Loader.iter_load`, which
+    :meth:`google_pandas_load.loader.Loader.multi_load` rejects. It is used
+    to launch simultaneously load jobs as follows:
 
     - A list of LoadConfig is built.
     - The list is passed
@@ -32,7 +34,21 @@ class LoadConfig:
             parse_dates: Optional[List[str]] = None,
             date_cols: Optional[List[str]] = None,
             timestamp_cols: Optional[List[str]] = None,
-            bq_schema: Optional[List[bigquery.SchemaField]] = None):
+            bq_schema: Optional[List[bigquery.SchemaField]] = None,
+            chunksize: Optional[int] = None,
+            format: Optional[Literal['csv', 'parquet', 'avro']] = None,
+            compression: Optional[str] = None,
+            compression_level: Optional[int] = None,
+            result_type: Literal['pandas', 'arrow'] = 'pandas',
+            engine: Optional[Literal['c', 'python', 'pyarrow']] = None,
+            dtype_backend: Optional[
+                Literal['numpy_nullable', 'pyarrow']] = None,
+            read_engine: Optional[Literal['extract', 'storage']] = None,
+            write_engine: Optional[Literal['load_job', 'storage']] = None,
+            columns: Optional[List[str]] = None,
+            max_rows: Optional[int] = None,
+            compact_dtypes: Optional[bool] = False,
+            strict_schema_inference: Optional[bool] = None):
 
         self.source = source
         self.destination = destination
@@ -47,6 +63,19 @@ class LoadConfig:
         self._timestamp_cols = timestamp_cols
         self._date_cols = date_cols
         self._bq_schema = bq_schema
+        self._chunksize = chunksize
+        self.format = format
+        self.compression = compression
+        self.compression_level = compression_level
+        self._result_type = result_type
+        self._engine = engine
+        self._dtype_backend = dtype_backend
+        self.read_engine = read_engine
+        self.write_engine = write_engine
+        self._columns = columns
+        self._max_rows = max_rows
+        self._compact_dtypes = compact_dtypes
+        self.strict_schema_inference = strict_schema_inference
 
         if self.data_name is not None:
             self._check_data_name_not_empty_string()
@@ -57,9 +86,30 @@ class LoadConfig:
         self._check_if_data_name_missing()
         self._check_if_query_missing()
         self._check_if_dataframe_missing()
-
-        if self._bq_schema is None and self._dataframe is not None:
-            self._infer_bq_schema_from_dataframe()
+        if self._chunksize is not None:
+            self._check_chunksize_value()
+        if self.format is not None:
+            self._check_format_value()
+        if self.format is not None and self.compression is not None:
+            self._check_compression_value()
+        if self.compression_level is not None:
+            self._check_compression_level_value()
+        self._check_result_type_value()
+        if self._engine is not None:
+            self._check_engine_value()
+        if self._dtype_backend is not None:
+            self._check_dtype_backend_value()
+        if self.read_engine is not None:
+            self._check_read_engine_value()
+        if self.write_engine is not None:
+            self._check_write_engine_value()
+        if self._columns is not None:
+            self._check_columns_value()
+        if self._max_rows is not None:
+            self._check_max_rows_value()
+        self._check_compact_dtypes_value()
+        if self.strict_schema_inference is not None:
+            self._check_strict_schema_inference_value()
 
     def _check_data_name_not_empty_string(self):
         assert self.data_name is not None
@@ -105,16 +155,75 @@ class LoadConfig:
             raise ValueError(
                 "dataframe must be provided if source = 'dataframe'")
 
+    def _check_chunksize_value(self):
+        assert self._chunksize is not None
+        utils.check_positive_integer(self._chunksize, 'chunksize')
+
+    def _check_format_value(self):
+        assert self.format is not None
+        utils.check_format_value(self.format)
+
+    def _check_compression_value(self):
+        assert self.format is not None and self.compression is not None
+        utils.check_compression_value(self.format, self.compression)
+
+    def _check_compression_level_value(self):
+        assert self.compression_level is not None
+        utils.check_compression_level_value(self.compression_level)
+
+    def _check_result_type_value(self):
+        utils.check_result_type_value(self._result_type)
+
+    def _check_engine_value(self):
+        assert self._engine is not None
+        utils.check_engine_value(self._engine)
+
+    def _check_dtype_backend_value(self):
+        assert self._dtype_backend is not None
+        utils.check_dtype_backend_value(self._dtype_backend)
+
+    def _check_read_engine_value(self):
+        assert self.read_engine is not None
+        utils.check_read_engine_value(self.read_engine)
+
+    def _check_write_engine_value(self):
+        assert self.write_engine is not None
+        utils.check_write_engine_value(self.write_engine)
+
+    def _check_columns_value(self):
+        assert self._columns is not None
+        utils.check_columns_value(self._columns)
+
+    def _check_max_rows_value(self):
+        assert self._max_rows is not None
+        utils.check_positive_integer(self._max_rows, 'max_rows')
+
+    def _check_compact_dtypes_value(self):
+        utils.check_boolean(self._compact_dtypes, 'compact_dtypes')
+
+    def _check_strict_schema_inference_value(self):
+        assert self.strict_schema_inference is not None
+        utils.check_boolean(
+            self.strict_schema_inference, 'strict_schema_inference')
+
     @staticmethod
     def bq_schema_inferred_from_dataframe(
             dataframe: pandas.DataFrame,
             date_cols: Optional[List[str]] = None,
-            timestamp_cols: Optional[List[str]] = None) \
+            timestamp_cols: Optional[List[str]] = None,
+            strict: Optional[bool] = False) \
             -> List[bigquery.SchemaField]:
         """Return a BigQuery schema that is inferred from a pandas dataframe.
 
         Let infer_dtype(column) = `pandas.api.types.infer_dtype <https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.api.types.infer_dtype.html>`__ (column).
 
+        If the column has a boolean, integer or float dtype,
+        infer_dtype(column) is deduced from its dtype. If the column has the
+        object dtype and more than constants.SCHEMA_INFERENCE_SAMPLE_SIZE
+        rows, infer_dtype is applied to as many rows drawn at random, unless
+        strict is True. A value of a type which is rare in the column can
+        then be missed.
+
         In BigQuery, a column is given its type according to the following
         rule:
 
@@ -136,6 +245,8 @@ class LoadConfig:
                 receiving the BigQuery type DATE.
             timestamp_cols (list of str, optional): The names of the columns
                 receiving the BigQuery type TIMESTAMP.
+            strict (bool, optional): If True, infer_dtype is applied to all
+                the rows of the object columns. Defaults to False.
 
         Returns:
             list of google.cloud.bigquery.schema.SchemaField: A BigQuery
@@ -149,9 +260,14 @@ class LoadConfig:
             timestamp_cols = []
         if date_cols is None:
             date_cols = []
+        positions = utils.sample_positions(len(dataframe), strict)
         bq_schema = []
         for col in dataframe.columns:
-            dtype_description = pandas.api.types.infer_dtype(dataframe[col])
+            if col in date_cols or col in timestamp_cols:
+                dtype_description = None
+            else:
+                dtype_description = utils.infer_column_dtype(
+                    dataframe[col], positions)
             if col in date_cols:
                 bq_schema.append(bigquery.SchemaField(name=col,
                                                       field_type='DATE'))
@@ -176,7 +292,8 @@ class LoadConfig:
         self._bq_schema = self.bq_schema_inferred_from_dataframe(
             dataframe=self._dataframe,
             timestamp_cols=self._timestamp_cols,
-            date_cols=self._date_cols)
+            date_cols=self._date_cols,
+            strict=bool(self.strict_schema_inference))
 
     @property
     def _names_atomic_functions_to_call(self):
@@ -201,10 +318,20 @@ class LoadConfig:
     def _local_to_dataframe_config(self):
         return Namespace(
             dtype=self._dtype,
-            parse_dates=self._parse_dates)
+            parse_dates=self._parse_dates,
+            chunksize=self._chunksize,
+            result_type=self._result_type,
+            engine=self._engine,
+            dtype_backend=self._dtype_backend,
+            columns=self._columns,
+            max_rows=self._max_rows,
+            compact_dtypes=self._compact_dtypes,
+            schema=self._bq_schema)
 
     def _dataframe_to_local_config(self):
-        return Namespace(dataframe=self._dataframe)
+        return Namespace(
+            dataframe=self._dataframe,
+            schema=self._bq_schema)
 
     def _bucket_to_dataset_config(self):
         return Namespace(
@@ -213,6 +340,8 @@ class LoadConfig:
 
     @property
     def sliced(self):
+        if self._bq_schema is None and self._dataframe is not None:
+            self._infer_bq_schema_from_dataframe()
         res = dict()
         for i, n in enumerate(self._names_atomic_functions_to_call):
             atomic_config_name = f'_{n}_config'
@@ -221,6 +350,11 @@ class LoadConfig:
             else:
                 res[n] = Namespace()
             res[n].data_name = self.data_name
+            res[n].format = self.format
+            res[n].compression = self.compression
+            res[n].compression_level = self.compression_level
+            res[n].read_engine = self.read_engine
+            res[n].write_engine = self.write_engine
             source, destination = n.split('_to_')
             res[n].source = source
             res[n].destination = destination
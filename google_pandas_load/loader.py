@@ -1,11 +1,21 @@
+import io
 import os
+import gzip
 import logging
+import threading
 import pandas
-from typing import Literal, List, Dict, Any, Optional
+from functools import partial
+from typing import Literal, List, Dict, Any, Optional, Iterator
 from datetime import datetime
 from copy import deepcopy
-from google.cloud import bigquery, storage
+from argparse import Namespace
+from google.cloud import bigquery, storage, exceptions
 from google_pandas_load import constants, load_config, utils
+from google_pandas_load.metadata_cache import MetadataCache
+from google_pandas_load.multi_load_handle import MultiLoadHandle
+from google_pandas_load.result_cache import ResultCache
+from google_pandas_load.resumable_upload import ResumableUploadWriter
+from google_pandas_load.storage_write_job import StorageWriteJob
 logger = logging.getLogger(name=__name__)
 
 
@@ -40,6 +50,147 @@ class Loader:
         timeout (int, optional): The amount of time, in seconds, to wait
             for the server response when uploading a Storage blob.
             Defaults to 60.
+        max_download_workers (int, optional): The maximum number of threads
+            used to download concurrently the blobs forming the data when it
+            is loaded from 'bucket' to 'local'. Defaults to 1.
+        max_upload_workers (int, optional): The maximum number of threads
+            used to upload concurrently local files to Storage. When several
+            configurations are passed to
+            :meth:`google_pandas_load.loader.Loader.multi_load`, the threads
+            are shared by the files of all the configurations.
+            Defaults to 1.
+        max_upload_bytes_in_flight (int, optional): The maximum number of
+            bytes held in memory by the uploads running at the same time.
+            An upload holds the size of the uploaded file, bounded by
+            chunk_size. An upload bigger than this limit is started only
+            when no other upload is running. If not passed, there is no
+            limit.
+        max_parse_workers (int, optional): The maximum number of processes
+            used to parse concurrently the local files forming the data when
+            it is loaded from 'local' to 'dataframe'. The order of the files
+            is kept in the resulting dataframe. The processes are started
+            with the spawn method. Defaults to 1, in which case the files
+            are parsed in the current process.
+        pipelined (bool, optional): If True, when data is loaded from
+            'bucket' to 'dataframe' within
+            :meth:`google_pandas_load.loader.Loader.multi_load`, a blob is
+            parsed while the next ones are downloaded, instead of parsing
+            the blobs once they are all downloaded. The blobs are then
+            downloaded one at a time, at most
+            constants.PIPELINE_QUEUE_SIZE of them waiting to be parsed, and
+            each local file is deleted as soon as it is parsed. The time spent
+            in each stage is written in the logs. Defaults to False.
+        schedule (str, optional): One of 'stage' or 'config'. See
+            :meth:`google_pandas_load.loader.Loader.multi_load`.
+            Defaults to 'stage'.
+        format (str, optional): The format of the data in Storage and in
+            the local directory, one of 'csv' or 'parquet' or 'avro'.
+            Using 'parquet' requires pyarrow and using 'avro' requires
+            fastavro. With 'parquet' or 'avro', the DATE and TIMESTAMP
+            columns keep their types in the files. It can be overridden in
+            each configuration. Defaults to 'csv'.
+        compression (str, optional): The compression codec of the files in
+            Storage and in the local directory. It must be one of
+            'none' or 'gzip' for 'csv', one of 'none' or 'snappy' or 'gzip'
+            or 'zstd' for 'parquet' and one of 'none' or 'deflate' or
+            'snappy' for 'avro', in which case cramjam is required to write
+            the files. A CSV file compressed with gzip has the extension
+            .csv.gz. If not passed, it falls back to 'gzip' for
+            'csv', 'snappy' for 'parquet' and 'deflate' for 'avro'. It can be
+            overridden in each configuration.
+        compression_level (int, optional): The compression level used when
+            a dataframe is written to the local directory. It is ignored by
+            BigQuery extract jobs. If not passed, the default level of the
+            codec is used. It can be overridden in each configuration.
+        max_direct_upload_bytes (int, optional): If passed, when a dataframe
+            is loaded to 'dataset' within
+            :meth:`google_pandas_load.loader.Loader.multi_load` and its
+            memory usage is at most max_direct_upload_bytes, it is
+            serialized in memory and sent to BigQuery by a single load job,
+            without going through 'local' and 'bucket'. A CSV is then not
+            compressed. Bigger dataframes follow the usual path. If not
+            passed, all dataframes follow the usual path.
+        stream_uploads (bool, optional): If True, when a dataframe is loaded
+            to 'bucket' or 'dataset' within
+            :meth:`google_pandas_load.loader.Loader.multi_load`, it is
+            encoded and compressed constants.STREAM_UPLOAD_NB_ROWS rows at a
+            time straight into a resumable upload to Storage, without
+            writing a local file. The blob has the same name as the one
+            uploaded from the local file. At most chunk_size bytes of the
+            upload are held in memory. Defaults to False.
+        stream_downloads (bool, optional): If True, when data is loaded
+            from 'bucket' to 'dataframe' within
+            :meth:`google_pandas_load.loader.Loader.multi_load`, each blob
+            is read as a stream, decompressed and parsed, without writing a
+            local file. The blobs are then read concurrently by at most
+            max_download_workers threads, and local_dir_path is not
+            required. It takes precedence over pipelined. Defaults to False.
+        read_engine (str, optional): How data is loaded from 'dataset' to
+            'dataframe', one of 'extract' or 'storage'. With 'extract', the
+            table is extracted to Storage by a BigQuery job, then downloaded
+            and parsed. With 'storage', the table is read directly with the
+            BigQuery Storage Read API, in Arrow format, through at most
+            max_download_workers streams read concurrently, without going
+            through 'bucket' and 'local'. Using 'storage' requires
+            google-cloud-bigquery-storage and pyarrow. It can be overridden
+            in each configuration. Defaults to 'extract'.
+        bqstorage_client (google.cloud.bigquery_storage.BigQueryReadClient, optional):
+            Client to read tables with the BigQuery Storage Read API. If not
+            passed and it is needed, it is built with the credentials of the
+            bq_client.
+        write_engine (str, optional): How a dataframe is loaded to
+            'dataset', one of 'load_job' or 'storage'. With 'load_job', it
+            goes through 'local' and 'bucket' and is loaded by a BigQuery
+            load job. With 'storage', it is sent directly to the table with
+            the BigQuery Storage Write API, as Arrow record batches of at
+            most constants.STORAGE_WRITE_NB_ROWS rows, over the connection
+            of a single client shared by all the writes of the loader. The
+            table is created with the bq_schema if it does not exist, and
+            an existing table keeps its schema. With WRITE_APPEND, the
+            rows are written to a committed stream and are visible as soon
+            as they are sent. With WRITE_EMPTY, they are written to a
+            pending stream and are all committed at the end. With
+            WRITE_TRUNCATE, they are written the same way to a staging
+            table created with the bq_schema, which then replaces the table
+            at once, schema included, by a copy job. Using
+            'storage' requires google-cloud-bigquery-storage and pyarrow.
+            It can be overridden in each configuration.
+            Defaults to 'load_job'.
+        bqwrite_client (google.cloud.bigquery_storage.BigQueryWriteClient, optional):
+            Client to write tables with the BigQuery Storage Write API. If
+            not passed and it is needed, it is built with the credentials of
+            the bq_client.
+        result_cache (google_pandas_load.result_cache.ResultCache, optional):
+            If passed, the results of the loads from 'query' to 'dataframe'
+            are stored in it. When a result is found there, the query, the
+            extraction, the download and the parsing are all skipped. A
+            result is found if the query, normalized, the project of the
+            bq_client, the dataset_id and the options dtype, parse_dates,
+            format, result_type, engine, read_engine, dtype_backend,
+            columns, max_rows and compact_dtypes are the same. If not
+            passed, no result is cached.
+        sync_downloads (bool, optional): If True, when data is loaded from
+            'bucket' to 'local', the local files are not deleted first.
+            Only the blobs whose generation, crc32c or md5 hash differ from
+            the ones recorded when they were last downloaded, or whose local
+            file is missing or has been modified since, are downloaded.
+            The local files of the data whose blob no longer exists are
+            deleted. The versions are recorded in a manifest, the hidden
+            file .data_name.manifest.json of local_dir_path. It has no
+            effect on a load from 'bucket' to 'dataframe' with pipelined or
+            stream_downloads. Defaults to False.
+        skip_unchanged_uploads (bool, optional): If True, when data is loaded
+            from 'local' to 'bucket', the blobs are not deleted first. A
+            local file is not uploaded if a blob with the same name and the
+            same crc32c already exists. The crc32c of the local file is
+            computed chunk by chunk. The blobs of the data which have no
+            local file are deleted. Defaults to False.
+        strict_schema_inference (bool, optional): If True, when the
+            bq_schema is inferred from a dataframe, all the rows of its
+            object columns are inspected instead of a sample of
+            constants.SCHEMA_INFERENCE_SAMPLE_SIZE rows. See
+            :meth:`google_pandas_load.load_config.LoadConfig.bq_schema_inferred_from_dataframe`.
+            It can be overridden in each configuration. Defaults to False.
     """
     def __init__(
             self,
@@ -51,7 +202,28 @@ class Loader:
             local_dir_path: Optional[str] = None,
             separator: Optional[str] = '|',
             chunk_size: Optional[int] = 2**28,
-            timeout: Optional[int] = 60):
+            timeout: Optional[int] = 60,
+            max_download_workers: Optional[int] = 1,
+            max_upload_workers: Optional[int] = 1,
+            max_upload_bytes_in_flight: Optional[int] = None,
+            max_parse_workers: Optional[int] = 1,
+            pipelined: Optional[bool] = False,
+            schedule: Optional[Literal['stage', 'config']] = 'stage',
+            format: Optional[Literal['csv', 'parquet', 'avro']] = 'csv',
+            compression: Optional[str] = None,
+            compression_level: Optional[int] = None,
+            max_direct_upload_bytes: Optional[int] = None,
+            stream_uploads: Optional[bool] = False,
+            stream_downloads: Optional[bool] = False,
+            read_engine: Optional[Literal['extract', 'storage']] = 'extract',
+            bqstorage_client=None,
+            write_engine: Optional[
+                Literal['load_job', 'storage']] = 'load_job',
+            bqwrite_client=None,
+            result_cache: Optional[ResultCache] = None,
+            sync_downloads: Optional[bool] = False,
+            skip_unchanged_uploads: Optional[bool] = False,
+            strict_schema_inference: Optional[bool] = False):
         self._bq_client = bq_client
         self._dataset_id = dataset_id
         self._gs_client = gs_client
@@ -61,9 +233,51 @@ class Loader:
         self._separator = separator
         self._chunk_size = chunk_size
         self._timeout = timeout
+        self._max_download_workers = max_download_workers
+        self._max_upload_workers = max_upload_workers
+        self._max_upload_bytes_in_flight = max_upload_bytes_in_flight
+        self._max_parse_workers = max_parse_workers
+        self._pipelined = pipelined
+        self._schedule = schedule
+        self._format = format
+        self._compression = compression
+        self._compression_level = compression_level
+        self._max_direct_upload_bytes = max_direct_upload_bytes
+        self._stream_uploads = stream_uploads
+        self._stream_downloads = stream_downloads
+        self._read_engine = read_engine
+        self._bqstorage_client = bqstorage_client
+        self._write_engine = write_engine
+        self._bqwrite_client = bqwrite_client
+        self._result_cache = result_cache
+        self._sync_downloads = sync_downloads
+        self._skip_unchanged_uploads = skip_unchanged_uploads
+        self._strict_schema_inference = strict_schema_inference
 
         self._check_bq_client_dataset_id_consistency()
         self._check_gs_client_bucket_name_consistency()
+        self._check_format_value()
+        if self._compression is None:
+            self._compression = constants.DEFAULT_COMPRESSIONS[self._format]
+        self._check_compression_value()
+        if self._compression_level is not None:
+            self._check_compression_level_value()
+        self._check_max_download_workers_value()
+        self._check_max_upload_workers_value()
+        if self._max_upload_bytes_in_flight is not None:
+            self._check_max_upload_bytes_in_flight_value()
+        self._check_max_parse_workers_value()
+        self._check_pipelined_value()
+        self._check_schedule_value()
+        if self._max_direct_upload_bytes is not None:
+            self._check_max_direct_upload_bytes_value()
+        self._check_stream_uploads_value()
+        self._check_stream_downloads_value()
+        self._check_read_engine_value()
+        self._check_write_engine_value()
+        self._check_sync_downloads_value()
+        self._check_skip_unchanged_uploads_value()
+        self._check_strict_schema_inference_value()
 
         if self._dataset_id is not None:
             self._check_dataset_id_format()
@@ -157,6 +371,69 @@ class Loader:
             msg = 'bucket_dir_path must not end with /'
             raise ValueError(msg)
 
+    def _check_format_value(self):
+        utils.check_format_value(self._format)
+
+    def _check_compression_value(self):
+        utils.check_compression_value(self._format, self._compression)
+
+    def _check_compression_level_value(self):
+        assert self._compression_level is not None
+        utils.check_compression_level_value(self._compression_level)
+
+    def _check_max_download_workers_value(self):
+        utils.check_positive_integer(
+            self._max_download_workers, 'max_download_workers')
+
+    def _check_max_upload_workers_value(self):
+        utils.check_positive_integer(
+            self._max_upload_workers, 'max_upload_workers')
+
+    def _check_max_upload_bytes_in_flight_value(self):
+        assert self._max_upload_bytes_in_flight is not None
+        utils.check_positive_integer(
+            self._max_upload_bytes_in_flight, 'max_upload_bytes_in_flight')
+
+    def _check_max_parse_workers_value(self):
+        utils.check_positive_integer(
+            self._max_parse_workers, 'max_parse_workers')
+
+    def _check_pipelined_value(self):
+        utils.check_boolean(self._pipelined, 'pipelined')
+
+    def _check_skip_unchanged_uploads_value(self):
+        utils.check_boolean(
+            self._skip_unchanged_uploads, 'skip_unchanged_uploads')
+
+    def _check_sync_downloads_value(self):
+        utils.check_boolean(self._sync_downloads, 'sync_downloads')
+
+    def _check_stream_downloads_value(self):
+        utils.check_boolean(self._stream_downloads, 'stream_downloads')
+
+    def _check_stream_uploads_value(self):
+        utils.check_boolean(self._stream_uploads, 'stream_uploads')
+
+    def _check_strict_schema_inference_value(self):
+        utils.check_boolean(
+            self._strict_schema_inference, 'strict_schema_inference')
+
+    def _check_schedule_value(self):
+        if self._schedule not in constants.SCHEDULES:
+            msg = "schedule must be one of 'stage' or 'config'"
+            raise ValueError(msg)
+
+    def _check_max_direct_upload_bytes_value(self):
+        assert self._max_direct_upload_bytes is not None
+        utils.check_positive_integer(
+            self._max_direct_upload_bytes, 'max_direct_upload_bytes')
+
+    def _check_read_engine_value(self):
+        utils.check_read_engine_value(self._read_engine)
+
+    def _check_write_engine_value(self):
+        utils.check_write_engine_value(self._write_engine)
+
     @staticmethod
     def _check_data_name_not_contain_slash(data_name):
         utils.check_data_name_not_contain_slash(data_name)
@@ -171,6 +448,22 @@ class Loader:
         if len(configs) == 0:
             raise ValueError('configs must be non-empty')
 
+    @staticmethod
+    def _check_no_chunksize(sliced_configs):
+        for s in sliced_configs:
+            c = s.get('local_to_dataframe')
+            if c is not None and c.chunksize is not None:
+                msg = ('chunksize is only supported by iter_load, '
+                       'not by multi_load')
+                raise ValueError(msg)
+
+    @staticmethod
+    def _check_iter_load_read_engine(sliced_config):
+        c = sliced_config.get('dataset_to_bucket')
+        if c is not None and c.read_engine == 'storage':
+            msg = "iter_load does not support read_engine='storage'"
+            raise ValueError(msg)
+
     def _check_if_bq_client_missing(self, atomic_function_names):
         names = atomic_function_names
         if self._bq_client is None and any('dataset' in n for n in names):
@@ -181,9 +474,13 @@ class Loader:
         if self._gs_client is None and any('bucket' in n for n in names):
             raise ValueError('gs_client must be provided if bucket is used')
 
-    def _check_if_local_dir_path_missing(self, atomic_function_names):
-        names = atomic_function_names
-        if self._local_dir_path is None and any('local' in n for n in names):
+    def _check_if_local_dir_path_missing(self, sliced_configs):
+        # A fused step goes through the local directory if its
+        # configuration says so.
+        uses_local = any(
+            'local' in n or vars(c).get('uses_local', False)
+            for s in sliced_configs for n, c in s.items())
+        if self._local_dir_path is None and uses_local:
             raise ValueError(
                 'local_dir_path must be provided if local is used')
 
@@ -202,9 +499,53 @@ class Loader:
             if config.data_name is None:
                 config.data_name = utils.timestamp_randint_string()
 
+    def _fill_missing_compressions(self, configs):
+        # Must be called before _fill_missing_formats: the compression of
+        # the loader is only used with the format of the loader.
+        for config in configs:
+            if config.compression is not None:
+                continue
+            if config.format is None or config.format == self._format:
+                config.compression = self._compression
+                if config.compression_level is None:
+                    config.compression_level = self._compression_level
+            else:
+                config.compression = constants.DEFAULT_COMPRESSIONS[
+                    config.format]
+
+    @staticmethod
+    def _check_compression_values(configs):
+        for config in configs:
+            utils.check_compression_value(config.format, config.compression)
+
+    def _fill_missing_read_engines(self, configs):
+        for config in configs:
+            if config.read_engine is None:
+                config.read_engine = self._read_engine
+
+    def _fill_missing_write_engines(self, configs):
+        for config in configs:
+            if config.write_engine is None:
+                config.write_engine = self._write_engine
+
+    def _fill_missing_strict_schema_inferences(self, configs):
+        for config in configs:
+            if config.strict_schema_inference is None:
+                config.strict_schema_inference = \
+                    self._strict_schema_inference
+
+    def _fill_missing_formats(self, configs):
+        for config in configs:
+            if config.format is None:
+                config.format = self._format
+
     def _build_table_id(self, table_name):
         return f'{self._dataset_id}.{table_name}'
 
+    def _build_table_path(self, table_name):
+        project, dataset = self._dataset_id.split('.')
+        return f'projects/{project}/datasets/{dataset}/tables/{table_name}'
+
     def _blob_is_considered(self, blob):
         c1 = blob.name.startswith(self._blob_name_prefix)
         c2 = '/' not in blob.name[len(self._blob_name_prefix):]
@@ -272,25 +613,66 @@ class Loader:
         for local_file_path in self.list_local_file_paths(data_name):
             os.remove(local_file_path)
 
-    def _exist(self, location, data_name):
-        return getattr(self, f'exist_in_{location}')(data_name)
-
-    def _delete(self, location, data_name):
-        return getattr(self, f'delete_in_{location}')(data_name)
+    def _list_blobs(self, atomic_config):
+        cache = vars(atomic_config).get('metadata_cache')
+        if cache is None:
+            return self.list_blobs(atomic_config.data_name)
+        return cache.blobs(atomic_config.data_name, self.list_blobs)
+
+    def _find_table(self, atomic_config):
+        table_id = self._build_table_id(atomic_config.data_name)
+        find_table = partial(utils.find_table, self._bq_client)
+        cache = vars(atomic_config).get('metadata_cache')
+        if cache is None:
+            return find_table(table_id)
+        return cache.table(table_id, find_table)
+
+    def _invalidate_metadata(self, location, atomic_config):
+        cache = vars(atomic_config).get('metadata_cache')
+        if cache is None:
+            return
+        if location == 'bucket':
+            cache.invalidate_blobs(atomic_config.data_name)
+        elif location == 'dataset':
+            cache.invalidate_table(
+                self._build_table_id(atomic_config.data_name))
+
+    def _exist(self, location, atomic_config):
+        if location == 'bucket':
+            return len(self._list_blobs(atomic_config)) > 0
+        if location == 'dataset':
+            return self._find_table(atomic_config) is not None
+        return getattr(self, f'exist_in_{location}')(atomic_config.data_name)
+
+    def _delete(self, location, atomic_config):
+        try:
+            if location == 'bucket':
+                self._bucket.delete_blobs(
+                    blobs=self._list_blobs(atomic_config))
+            else:
+                getattr(self, f'delete_in_{location}')(
+                    atomic_config.data_name)
+        finally:
+            self._invalidate_metadata(location, atomic_config)
 
     def _is_source_clear(self, atomic_config):
-        return not self._exist(atomic_config.source, atomic_config.data_name)
+        return not self._exist(atomic_config.source, atomic_config)
 
     def _clear_source(self, atomic_config):
-        self._delete(atomic_config.source, atomic_config.data_name)
+        self._delete(atomic_config.source, atomic_config)
 
     def _clear_destination(self, atomic_config):
-        self._delete(atomic_config.destination, atomic_config.data_name)
+        self._delete(atomic_config.destination, atomic_config)
 
     def _blob_to_local_file(self, blob):
         blob_basename = blob.name.split('/')[-1]
         local_file_path = os.path.join(self._local_dir_path, blob_basename)
+        start_timestamp = datetime.now()
         blob.download_to_filename(filename=local_file_path)
+        end_timestamp = datetime.now()
+        duration = round((end_timestamp - start_timestamp).total_seconds(), 3)
+        self._log(f'Downloaded {blob.name} [{duration}s]')
+        return local_file_path
 
     def _local_file_to_blob(self, local_file_path):
         local_file_basename = os.path.basename(local_file_path)
@@ -299,25 +681,87 @@ class Loader:
             name=blob_name,
             bucket=self._bucket,
             chunk_size=self._chunk_size)
+        start_timestamp = datetime.now()
         blob.upload_from_filename(
             filename=local_file_path,
             timeout=self._timeout)
+        end_timestamp = datetime.now()
+        duration = round((end_timestamp - start_timestamp).total_seconds(), 3)
+        self._log(f'Uploaded {blob_name} [{duration}s]')
 
-    def _local_file_to_dataframe(
-            self, local_file_path, dtype, parse_dates):
-        return pandas.read_csv(
-            filepath_or_buffer=local_file_path,
-            sep=self._separator,
-            dtype=dtype,
-            parse_dates=parse_dates,
-            skip_blank_lines=False)
-
-    def _dataframe_to_local_file(self, dataframe, local_file_path):
-        dataframe.to_csv(
-            path_or_buf=local_file_path,
-            sep=self._separator,
-            index=False,
-            compression='gzip')
+    def _dataframe_to_bucket(self, dataframe_to_bucket_config):
+        config = dataframe_to_bucket_config
+        extension = utils.file_extension(config.format, config.compression)
+        blob_name = self._blob_name_prefix + config.data_name + extension
+        blob = storage.Blob(
+            name=blob_name,
+            bucket=self._bucket,
+            chunk_size=self._chunk_size)
+        # The upload is finalized only if the whole dataframe is encoded, so
+        # that a failure leaves no truncated blob behind.
+        f = ResumableUploadWriter(
+            blob=blob, chunk_size=self._chunk_size, timeout=self._timeout)
+        try:
+            utils.dataframe_to_stream(
+                dataframe=config.dataframe,
+                stream=f,
+                format=config.format,
+                separator=self._separator,
+                bq_schema=config.schema,
+                compression=config.compression,
+                compression_level=config.compression_level,
+                nb_rows=constants.STREAM_UPLOAD_NB_ROWS)
+        except BaseException:
+            try:
+                f.abort()
+            except Exception as e:
+                # The session expires on its own without creating the blob,
+                # and the error which stopped the writing matters more.
+                logger.warning(
+                    f'The upload session of {blob_name} '
+                    f'could not be cancelled: {e}')
+            raise
+        f.close()
+
+    def _local_file_to_dataframe_function(self, local_to_dataframe_config):
+        config = local_to_dataframe_config
+        if config.result_type == 'arrow':
+            return partial(
+                utils.local_file_to_table,
+                format=config.format,
+                separator=self._separator,
+                dtype=config.dtype,
+                parse_dates=config.parse_dates,
+                columns=config.columns,
+                max_rows=config.max_rows)
+        return partial(
+            utils.local_file_to_dataframe,
+            format=config.format,
+            separator=self._separator,
+            dtype=config.dtype,
+            parse_dates=config.parse_dates,
+            engine=config.engine,
+            dtype_backend=config.dtype_backend,
+            columns=config.columns,
+            max_rows=config.max_rows,
+            compact=config.compact_dtypes,
+            bq_schema=config.schema)
+
+    def _dataframe_to_local_file(
+            self, dataframe, local_file_path, dataframe_to_local_config):
+        config = dataframe_to_local_config
+        if config.format == 'parquet':
+            utils.dataframe_to_parquet_file(
+                dataframe, local_file_path, config.schema,
+                config.compression, config.compression_level)
+        elif config.format == 'avro':
+            utils.dataframe_to_avro_file(
+                dataframe, local_file_path, config.schema,
+                config.compression, config.compression_level)
+        else:
+            utils.dataframe_to_csv_file(
+                dataframe, local_file_path, self._separator,
+                config.compression, config.compression_level)
 
     def _query_to_dataset_job(self, query_to_dataset_config):
         config = query_to_dataset_config
@@ -334,27 +778,50 @@ class Loader:
         config = dataset_to_bucket_config
         source = self._build_table_id(config.data_name)
         job_config = bigquery.ExtractJobConfig()
-        job_config.compression = 'GZIP'
+        job_config.compression = config.compression.upper()
+        if config.format == 'parquet':
+            job_config.destination_format = 'PARQUET'
+        elif config.format == 'avro':
+            job_config.destination_format = 'AVRO'
+            job_config.use_avro_logical_types = True
+        else:
+            job_config.destination_format = 'CSV'
+            job_config.field_delimiter = self._separator
+        extension = utils.file_extension(config.format, config.compression)
         destination_uri = (
-                self._blob_uri_prefix + config.data_name + '-*.csv.gz')
-        job_config.field_delimiter = self._separator
+                self._blob_uri_prefix + config.data_name + '-*' + extension)
         job = self._bq_client.extract_table(
             source=source,
             destination_uris=destination_uri,
             job_config=job_config)
         return job
 
-    def _bucket_to_dataset_job(self, bucket_to_dataset_config):
-        config = bucket_to_dataset_config
+    def _load_job_config(self, atomic_config):
+        config = atomic_config
         job_config = bigquery.LoadJobConfig()
-        job_config.field_delimiter = self._separator
-        if config.schema is None:
-            job_config.autodetect = True
+        if config.format == 'parquet':
+            job_config.source_format = 'PARQUET'
+            if config.schema is not None:
+                job_config.schema = config.schema
+        elif config.format == 'avro':
+            job_config.source_format = 'AVRO'
+            job_config.use_avro_logical_types = True
         else:
-            job_config.schema = config.schema
-            job_config.skip_leading_rows = 1
+            job_config.source_format = 'CSV'
+            job_config.field_delimiter = self._separator
+            if config.schema is None:
+                job_config.autodetect = True
+            else:
+                job_config.schema = config.schema
+                job_config.skip_leading_rows = 1
         job_config.write_disposition = config.write_disposition
-        source_uris = self.list_blob_uris(config.data_name)
+        return job_config
+
+    def _bucket_to_dataset_job(self, bucket_to_dataset_config):
+        config = bucket_to_dataset_config
+        job_config = self._load_job_config(config)
+        source_uris = [self._bucket_uri + '/' + blob.name
+                       for blob in self._list_blobs(config)]
         destination = self._build_table_id(config.data_name)
         job = self._bq_client.load_table_from_uri(
             source_uris=source_uris,
@@ -362,39 +829,359 @@ class Loader:
             job_config=job_config)
         return job
 
-    def _bucket_to_local(self, bucket_to_local_config):
+    def _prepare_storage_write_table(self, dataframe_to_dataset_config):
+        config = dataframe_to_dataset_config
+        if config.write_disposition == 'WRITE_TRUNCATE':
+            return
+        table = bigquery.Table(
+            self._build_table_id(config.data_name), schema=config.schema)
+        table = self._bq_client.create_table(table, exists_ok=True)
+        if config.write_disposition == 'WRITE_EMPTY' and table.num_rows:
+            raise exceptions.Conflict(
+                f'Already Exists: Table {table.full_table_id}')
+
+    def _append_rows(self, write_stream, dataframe_to_dataset_config,
+                     cancel_event):
+        from google.cloud.bigquery_storage_v1 import types, writer
+        config = dataframe_to_dataset_config
+        arrow_schema = utils.bq_schema_to_arrow_schema(config.schema)
+        template = types.AppendRowsRequest(
+            write_stream=write_stream.name,
+            arrow_rows=types.AppendRowsRequest.ArrowData(
+                writer_schema=types.ArrowSchema(
+                    serialized_schema=arrow_schema.serialize().to_pybytes())))
+        append_rows_stream = writer.AppendRowsStream(
+            self._bqwrite_client, template)
+        futures = []
+        offset = 0
+        try:
+            for record_batch in utils.iter_record_batches(
+                    dataframe=config.dataframe,
+                    arrow_schema=arrow_schema,
+                    nb_rows=constants.STORAGE_WRITE_NB_ROWS,
+                    max_bytes=constants.STORAGE_WRITE_MAX_REQUEST_BYTES):
+                utils.check_not_cancelled(cancel_event)
+                request = types.AppendRowsRequest(
+                    write_stream=write_stream.name,
+                    offset=offset,
+                    arrow_rows=types.AppendRowsRequest.ArrowData(
+                        rows=types.ArrowRecordBatch(
+                            serialized_record_batch=record_batch.serialize()
+                            .to_pybytes())))
+                futures.append(append_rows_stream.send(request))
+                offset += record_batch.num_rows
+            for f in futures:
+                f.result()
+        finally:
+            if append_rows_stream.is_active:
+                append_rows_stream.close()
+
+    def _storage_write(self, dataframe_to_dataset_config, cancel_event):
+        config = dataframe_to_dataset_config
+        if config.write_disposition != 'WRITE_TRUNCATE':
+            self._storage_write_to_table(
+                config.data_name, config, cancel_event)
+            return
+        # The rows are written to a staging table, which then replaces the
+        # table at once, schema included, like a load job would do.
+        staging_data_name = utils.timestamp_randint_string()
+        staging_table_id = self._build_table_id(staging_data_name)
+        self._bq_client.create_table(
+            bigquery.Table(staging_table_id, schema=config.schema))
+        try:
+            self._storage_write_to_table(
+                staging_data_name, config, cancel_event)
+            utils.check_not_cancelled(cancel_event)
+            job_config = bigquery.CopyJobConfig(
+                write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE)
+            self._bq_client.copy_table(
+                sources=staging_table_id,
+                destination=self._build_table_id(config.data_name),
+                job_config=job_config).result()
+        finally:
+            self.delete_in_dataset(staging_data_name)
+
+    def _storage_write_to_table(
+            self, data_name, dataframe_to_dataset_config, cancel_event):
+        from google.cloud.bigquery_storage_v1 import types
+        config = dataframe_to_dataset_config
+        parent = self._build_table_path(data_name)
+        # Appended rows are committed as soon as they are written. The other
+        # write dispositions need all the rows to be committed at once.
+        committed = config.write_disposition == 'WRITE_APPEND'
+        if committed:
+            stream_type = types.WriteStream.Type.COMMITTED
+        else:
+            stream_type = types.WriteStream.Type.PENDING
+        write_stream = self._bqwrite_client.create_write_stream(
+            parent=parent, write_stream=types.WriteStream(type_=stream_type))
+        self._append_rows(write_stream, config, cancel_event)
+        self._bqwrite_client.finalize_write_stream(name=write_stream.name)
+        if committed:
+            return
+        utils.check_not_cancelled(cancel_event)
+        response = self._bqwrite_client.batch_commit_write_streams(
+            types.BatchCommitWriteStreamsRequest(
+                parent=parent, write_streams=[write_stream.name]))
+        if len(response.stream_errors) > 0:
+            raise exceptions.GoogleCloudError(
+                response.stream_errors[0].error_message)
+
+    def _dataframe_to_dataset_job(self, dataframe_to_dataset_config):
+        config = dataframe_to_dataset_config
+        if config.write_engine == 'storage':
+            self._prepare_storage_write_table(config)
+            return StorageWriteJob(
+                partial(self._storage_write, config))
+        job_config = self._load_job_config(config)
+        buffer = io.BytesIO()
+        self._dataframe_to_local_file(config.dataframe, buffer, config)
+        buffer.seek(0)
+        destination = self._build_table_id(config.data_name)
+        job = self._bq_client.load_table_from_file(
+            file_obj=buffer,
+            destination=destination,
+            job_config=job_config)
+        return job
+
+    def _create_read_session(self, data_name, columns, max_stream_count):
+        from google.cloud.bigquery_storage import types
+        read_session = types.ReadSession(
+            table=self._build_table_path(data_name),
+            data_format=types.DataFormat.ARROW,
+            read_options=types.ReadSession.TableReadOptions(
+                selected_fields=columns))
+        return self._bqstorage_client.create_read_session(
+            parent=f'projects/{self._bq_client.project}',
+            read_session=read_session,
+            max_stream_count=max_stream_count)
+
+    def _dataset_to_dataframe(self, dataset_to_dataframe_config):
+        import pyarrow
+        config = dataset_to_dataframe_config
+        # The first max_rows rows are read from a single stream, which is
+        # left as soon as they are read.
+        if config.max_rows is None:
+            max_stream_count = self._max_download_workers
+        else:
+            max_stream_count = 1
+        session = self._create_read_session(
+            config.data_name, config.columns, max_stream_count)
+
+        def read_stream(stream):
+            reader = self._bqstorage_client.read_rows(stream.name)
+            if config.max_rows is None:
+                return [reader.to_arrow(session)]
+            stream_tables = []
+            nb_rows = 0
+            for page in reader.rows(session).pages:
+                stream_tables.append(page.to_arrow())
+                nb_rows += page.num_items
+                if nb_rows >= config.max_rows:
+                    break
+            return stream_tables
+
+        tables = sum(utils.map_in_threads(
+            read_stream, list(session.streams), max_stream_count), [])
+        if len(tables) == 0:
+            # An empty table is read through no stream.
+            schema = pyarrow.ipc.read_schema(pyarrow.py_buffer(
+                session.arrow_schema.serialized_schema))
+            tables = [schema.empty_table()]
+        table = pyarrow.concat_tables(tables)
+        table = utils.select_columns(table, config.columns)
+        table = utils.head(table, config.max_rows)
+        return utils.table_to_result(
+            table, config.result_type, config.dtype, config.parse_dates,
+            config.dtype_backend, config.compact_dtypes)
+
+    @staticmethod
+    def _query_to_dataframe(query_to_dataframe_config):
+        return query_to_dataframe_config.result
+
+    def _manifest_path(self, data_name):
+        return os.path.join(
+            self._local_dir_path, f'.{data_name}.manifest.json')
+
+    def _sync_bucket_to_local(self, bucket_to_local_config):
         data_name = bucket_to_local_config.data_name
-        blobs = self.list_blobs(data_name)
-        for b in blobs:
-            self._blob_to_local_file(b)
+        manifest_path = self._manifest_path(data_name)
+        manifest = utils.read_manifest(manifest_path)
+        blobs = self._list_blobs(bucket_to_local_config)
+        blob_basenames = [b.name.split('/')[-1] for b in blobs]
+        for local_file_path in self.list_local_file_paths(data_name):
+            if os.path.basename(local_file_path) not in blob_basenames:
+                os.remove(local_file_path)
+
+        def is_synced(blob, blob_basename):
+            local_file_path = os.path.join(
+                self._local_dir_path, blob_basename)
+            if blob_basename not in manifest or \
+                    not os.path.isfile(local_file_path):
+                return False
+            version = dict(utils.blob_version(blob))
+            version.update(utils.local_file_version(local_file_path))
+            return manifest[blob_basename] == version
+
+        blobs_to_download = [
+            b for b, n in zip(blobs, blob_basenames) if not is_synced(b, n)]
+        self._log(f'Synced {data_name} [{len(blobs_to_download)} of '
+                  f'{len(blobs)} blob(s) to download]')
+        local_file_paths = utils.map_in_threads(
+            self._blob_to_local_file,
+            blobs_to_download,
+            self._max_download_workers)
+        manifest = {n: manifest[n] for n in blob_basenames if n in manifest}
+        for blob, local_file_path in zip(blobs_to_download, local_file_paths):
+            version = dict(utils.blob_version(blob))
+            version.update(utils.local_file_version(local_file_path))
+            manifest[os.path.basename(local_file_path)] = version
+        utils.write_manifest(manifest_path, manifest)
 
-    def _local_to_bucket(self, local_to_bucket_config):
+    def _bucket_to_local(self, bucket_to_local_config):
+        if vars(bucket_to_local_config).get('incremental', False):
+            return self._sync_bucket_to_local(bucket_to_local_config)
+        blobs = self._list_blobs(bucket_to_local_config)
+        utils.map_in_threads(
+            self._blob_to_local_file, blobs, self._max_download_workers)
+
+    @staticmethod
+    def _blob_to_dataframe(blob, local_file_to_dataframe):
+        with blob.open('rb') as f:
+            if blob.name.endswith('.gz'):
+                with gzip.GzipFile(fileobj=f) as g:
+                    return local_file_to_dataframe(g)
+            return local_file_to_dataframe(f)
+
+    def _stream_bucket_to_dataframe(self, bucket_to_dataframe_config):
+        config = bucket_to_dataframe_config
+        blobs = self._list_blobs(config)
+        local_file_to_dataframe = self._local_file_to_dataframe_function(
+            config)
+        dataframes = utils.map_in_threads(
+            partial(
+                self._blob_to_dataframe,
+                local_file_to_dataframe=local_file_to_dataframe),
+            blobs,
+            self._max_download_workers)
+        return utils.concat_results(
+            dataframes, config.result_type, config.max_rows)
+
+    def _bucket_to_dataframe(self, bucket_to_dataframe_config):
+        config = bucket_to_dataframe_config
+        if not config.uses_local:
+            return self._stream_bucket_to_dataframe(config)
+        data_name = config.data_name
+        blobs = self._list_blobs(config)
+        local_file_to_dataframe = self._local_file_to_dataframe_function(
+            config)
+
+        def parse(local_file_path):
+            dataframe = local_file_to_dataframe(local_file_path)
+            os.remove(local_file_path)
+            return dataframe
+
+        self.delete_in_local(data_name)
+        try:
+            dataframes, durations = utils.run_pipeline(
+                produce=self._blob_to_local_file,
+                consume=parse,
+                items=blobs,
+                max_queue_size=constants.PIPELINE_QUEUE_SIZE)
+        finally:
+            self.delete_in_local(data_name)
+        download_duration = round(durations[0], 3)
+        parse_duration = round(durations[1], 3)
+        self._log(f'Pipelined {data_name} '
+                  f'[download {download_duration}s, parse {parse_duration}s]')
+        return utils.concat_results(
+            dataframes, config.result_type, config.max_rows)
+
+    def _upload_size(self, local_file_path):
+        size = os.path.getsize(local_file_path)
+        if self._chunk_size is None:
+            return size
+        return min(size, self._chunk_size)
+
+    def _create_upload_pool(self):
+        return utils.UploadPool(
+            self._max_upload_workers, self._max_upload_bytes_in_flight)
+
+    def _local_files_to_blobs(self, local_file_paths, upload_pool=None):
+        if upload_pool is None:
+            budget = utils.ByteBudget(self._max_upload_bytes_in_flight)
+        else:
+            budget = upload_pool.budget
+
+        def upload(local_file_path):
+            with budget.reserve(self._upload_size(local_file_path)):
+                self._local_file_to_blob(local_file_path)
+
+        if upload_pool is None:
+            utils.map_in_threads(
+                upload, local_file_paths, self._max_upload_workers)
+        else:
+            upload_pool.map(upload, local_file_paths)
+
+    def _local_file_paths_to_upload(self, local_to_bucket_config):
         data_name = local_to_bucket_config.data_name
         local_file_paths = self.list_local_file_paths(data_name)
-        for p in local_file_paths:
-            self._local_file_to_blob(p)
+        if not vars(local_to_bucket_config).get('incremental', False):
+            return local_file_paths
+        local_file_basenames = [os.path.basename(p) for p in local_file_paths]
+        crc32cs = dict()
+        stale_blobs = []
+        for blob in self._list_blobs(local_to_bucket_config):
+            blob_basename = blob.name.split('/')[-1]
+            if blob_basename in local_file_basenames:
+                crc32cs[blob_basename] = blob.crc32c
+            else:
+                stale_blobs.append(blob)
+        self._bucket.delete_blobs(blobs=stale_blobs)
+        local_crc32cs = utils.map_in_threads(
+            utils.local_file_crc32c,
+            local_file_paths,
+            self._max_upload_workers)
+        res = [p for p, c in zip(local_file_paths, local_crc32cs)
+               if crc32cs.get(os.path.basename(p)) != c]
+        self._log(f'Synced {data_name} [{len(res)} of '
+                  f'{len(local_file_paths)} file(s) to upload]')
+        return res
+
+    def _local_to_bucket(self, local_to_bucket_config):
+        local_file_paths = self._local_file_paths_to_upload(
+            local_to_bucket_config)
+        self._local_files_to_blobs(local_file_paths)
+
+    def _execute_local_to_bucket_loads(
+            self, local_to_bucket_configs, upload_pool=None):
+        configs = local_to_bucket_configs
+        local_file_paths = []
+        for c in configs:
+            local_file_paths += self._local_file_paths_to_upload(c)
+        self._local_files_to_blobs(local_file_paths, upload_pool)
+        return [None] * len(configs)
 
     def _local_to_dataframe(self, local_to_dataframe_config):
         config = local_to_dataframe_config
         data_name = config.data_name
         local_file_paths = self.list_local_file_paths(data_name)
-        dataframes = map(
-            lambda local_file_path:
-            self._local_file_to_dataframe(
-                local_file_path,
-                config.dtype,
-                config.parse_dates),
-            local_file_paths)
-        dataframe = pandas.concat(dataframes)
+        dataframes = utils.map_in_processes(
+            self._local_file_to_dataframe_function(config),
+            local_file_paths,
+            self._max_parse_workers)
+        dataframe = utils.concat_results(
+            dataframes, config.result_type, config.max_rows)
         return dataframe
 
     def _dataframe_to_local(self, dataframe_to_local_config):
         config = dataframe_to_local_config
         data_name = config.data_name
         dataframe = config.dataframe
+        extension = utils.file_extension(config.format, config.compression)
         local_file_path = os.path.join(
-            self._local_dir_path, data_name + '.csv.gz')
-        self._dataframe_to_local_file(dataframe, local_file_path)
+            self._local_dir_path, data_name + extension)
+        self._dataframe_to_local_file(dataframe, local_file_path, config)
 
     def _launch_bq_client_job(self, atomic_config):
         s = atomic_config.source
@@ -403,51 +1190,93 @@ class Loader:
         job = getattr(self, f'_{s}_to_{d}_job')(atomic_config)
         return job
 
-    def _execute_bq_client_loads(self, atomic_configs):
-        configs = atomic_configs
-        jobs = [self._launch_bq_client_job(c) for c in configs]
-        utils.wait_for_jobs(jobs)
+    def _launch_bq_client_jobs(self, atomic_configs):
+        # If a job cannot be launched, the ones already launched are
+        # cancelled.
+        jobs = []
+        try:
+            for c in atomic_configs:
+                jobs.append(self._launch_bq_client_job(c))
+        except BaseException:
+            utils.cancel_jobs(jobs)
+            raise
+        return jobs
+
+    def _execute_bq_client_loads(
+            self, atomic_configs, deadline, cancel_event):
+        jobs = self._launch_bq_client_jobs(atomic_configs)
+        utils.wait_for_jobs(jobs, deadline, cancel_event)
         return jobs
 
     def _execute_local_load(self, atomic_config):
         s = atomic_config.source
         d = atomic_config.destination
-        assert s == 'local' or d == 'local'
-        return getattr(self, f'_{s}_to_{d}')(atomic_config)
+        assert s == 'local' or d == 'local' or \
+            f'{s}_to_{d}' in constants.FUSED_FUNCTION_NAMES
+        res = getattr(self, f'_{s}_to_{d}')(atomic_config)
+        if vars(atomic_config).get('cache_key') is not None:
+            self._result_cache.put(atomic_config.cache_key, res)
+        return res
 
-    def _execute_local_loads(self, atomic_configs):
+    def _execute_dataframe_to_bucket_loads(
+            self, dataframe_to_bucket_configs, upload_pool=None):
+        if upload_pool is not None:
+            return upload_pool.map(
+                self._dataframe_to_bucket, dataframe_to_bucket_configs)
+        return utils.map_in_threads(
+            self._dataframe_to_bucket,
+            dataframe_to_bucket_configs,
+            self._max_upload_workers)
+
+    def _execute_local_loads(self, atomic_configs, upload_pool=None):
+        source, destination = self._same_type_loads_locations(atomic_configs)
+        if destination == 'bucket':
+            return getattr(self, f'_execute_{source}_to_bucket_loads')(
+                atomic_configs, upload_pool)
         return list(map(self._execute_local_load, atomic_configs))
 
-    def _execute_same_type_loads(self, atomic_configs):
+    @staticmethod
+    def _same_type_loads_locations(atomic_configs):
         assert len(atomic_configs) > 0
         configs = atomic_configs
         source = configs[0].source
         destination = configs[0].destination
         assert all([c.source == source and c.destination == destination
                     for c in configs])
-        atomic_function_name = f'{source}_to_{destination}'
-        self._log(f'Starting {source} to {destination}...')
-        start_timestamp = datetime.now()
+        return source, destination
+
+    def _prepare_same_type_loads(self, atomic_configs):
+        configs = atomic_configs
+        source, destination = self._same_type_loads_locations(configs)
         if source in constants.MIDDLE_LOCATIONS:
             for c in configs:
                 self._check_if_data_in_source(c)
+        # An incremental step only replaces the data which has changed and
+        # deletes itself the data which no longer exists.
         if destination in constants.DESTINATIONS_TO_ALWAYS_CLEAR:
             for c in configs:
-                self._clear_destination(c)
-        try:
-            if atomic_function_name in \
-                    constants.BQ_CLIENT_ATOMIC_FUNCTION_NAMES:
-                res = self._execute_bq_client_loads(configs)
-            else:
-                res = self._execute_local_loads(configs)
-        finally:
-            if source in constants.MIDDLE_LOCATIONS:
-                for c in configs:
-                    if c.clear_source:
-                        self._clear_source(c)
+                if not vars(c).get('incremental', False):
+                    self._clear_destination(c)
+
+    def _invalidate_destinations(self, atomic_configs):
+        # The data a step writes is listed again by the next steps.
+        for c in atomic_configs:
+            self._invalidate_metadata(c.destination, c)
+
+    def _clear_sources(self, atomic_configs):
+        configs = atomic_configs
+        source, _ = self._same_type_loads_locations(configs)
+        if source in constants.MIDDLE_LOCATIONS:
+            for c in configs:
+                if c.clear_source:
+                    self._clear_source(c)
+
+    def _log_end_of_same_type_loads(
+            self, atomic_configs, start_timestamp, res):
+        source, destination = self._same_type_loads_locations(atomic_configs)
         end_timestamp = datetime.now()
         duration = round((end_timestamp - start_timestamp).total_seconds())
-        if atomic_function_name != 'query_to_dataset':
+        if f'{source}_to_{destination}' != 'query_to_dataset':
             msg = f'Ended {source} to {destination} [{duration}s]'
             self._log(msg)
         else:
@@ -459,19 +1288,394 @@ class Loader:
             gb_processed = sum(gb_processed_list)
             msg = f'Ended query to dataset [{duration}s, {gb_processed}GB]'
             self._log(msg)
+
+    def _execute_same_type_loads(
+            self, atomic_configs, deadline=None, cancel_event=None,
+            upload_pool=None):
+        configs = atomic_configs
+        source, destination = self._same_type_loads_locations(configs)
+        atomic_function_name = f'{source}_to_{destination}'
+        self._log(f'Starting {source} to {destination}...')
+        start_timestamp = datetime.now()
+        self._prepare_same_type_loads(configs)
+        try:
+            if atomic_function_name in \
+                    constants.BQ_CLIENT_ATOMIC_FUNCTION_NAMES:
+                res = self._execute_bq_client_loads(
+                    configs, deadline, cancel_event)
+            else:
+                res = self._execute_local_loads(configs, upload_pool)
+        finally:
+            self._invalidate_destinations(configs)
+            self._clear_sources(configs)
+        self._log_end_of_same_type_loads(configs, start_timestamp, res)
+        return res
+
+    def _slice_configs(self, configs):
+        self._check_if_configs_is_a_list(configs)
+        self._check_if_configs_empty(configs)
+        configs = [deepcopy(config) for config in configs]
+        self._fill_missing_data_names(configs)
+        self._fill_missing_compressions(configs)
+        self._fill_missing_formats(configs)
+        self._fill_missing_read_engines(configs)
+        self._fill_missing_write_engines(configs)
+        self._fill_missing_strict_schema_inferences(configs)
+        self._check_compression_values(configs)
+        data_names = [config.data_name for config in configs]
+        utils.check_no_prefix(data_names)
+        sliced_configs = [config.sliced for config in configs]
+        return sliced_configs
+
+    def _check_if_clients_missing(self, sliced_configs):
+        names_atomic_functions_to_call = utils.union_keys(sliced_configs)
+        self._check_if_bq_client_missing(names_atomic_functions_to_call)
+        self._check_if_gs_client_missing(names_atomic_functions_to_call)
+        self._check_if_local_dir_path_missing(sliced_configs)
+
+    @staticmethod
+    def _fuse_bucket_to_dataframe(sliced_config, uses_local):
+        s = sliced_config
+        if 'bucket_to_local' not in s or 'local_to_dataframe' not in s:
+            return
+        fused_config = Namespace(**vars(s.pop('local_to_dataframe')))
+        fused_config.source = 'bucket'
+        fused_config.clear_source = s.pop('bucket_to_local').clear_source
+        fused_config.uses_local = uses_local
+        s['bucket_to_dataframe'] = fused_config
+
+    def _use_result_cache(self, sliced_config):
+        # On a hit, the whole chain is replaced by a step returning the
+        # cached result. On a miss, the step producing the result stores it.
+        s = sliced_config
+        if 'query_to_dataset' not in s or 'local_to_dataframe' not in s:
+            return
+        config = s['local_to_dataframe']
+        # The same query can give different results in another project or
+        # with another default dataset.
+        if self._bq_client is None:
+            project = None
+        else:
+            project = self._bq_client.project
+        options = {
+            'project': project,
+            'dataset_id': self._dataset_id,
+            'dtype': config.dtype,
+            'parse_dates': config.parse_dates,
+            'format': config.format,
+            'result_type': config.result_type,
+            'engine': config.engine,
+            'read_engine': config.read_engine,
+            'dtype_backend': config.dtype_backend,
+            'columns': config.columns,
+            'max_rows': config.max_rows,
+            'compact_dtypes': config.compact_dtypes}
+        key = ResultCache.key(s['query_to_dataset'].query, options)
+        result = self._result_cache.get(key, config.result_type)
+        if result is None:
+            config.cache_key = key
+            return
+        self._log(f'Found {config.data_name} in the result cache')
+        s.clear()
+        s['query_to_dataframe'] = Namespace(
+            data_name=config.data_name,
+            source='query',
+            destination='dataframe',
+            result=result)
+
+    @staticmethod
+    def _read_with_storage_api(sliced_config):
+        s = sliced_config
+        names = ['dataset_to_bucket', 'bucket_to_local', 'local_to_dataframe']
+        if any(n not in s for n in names):
+            return
+        if s['dataset_to_bucket'].read_engine != 'storage':
+            return
+        fused_config = Namespace(**vars(s.pop('local_to_dataframe')))
+        fused_config.source = 'dataset'
+        fused_config.clear_source = s.pop('dataset_to_bucket').clear_source
+        fused_config.uses_local = False
+        del s['bucket_to_local']
+        s['dataset_to_dataframe'] = fused_config
+
+    @staticmethod
+    def _write_with_storage_api(sliced_config):
+        s = sliced_config
+        names = ['dataframe_to_local', 'local_to_bucket', 'bucket_to_dataset']
+        if any(n not in s for n in names):
+            return
+        if s['bucket_to_dataset'].write_engine != 'storage':
+            return
+        fused_config = Namespace(**vars(s.pop('dataframe_to_local')))
+        fused_config.destination = 'dataset'
+        fused_config.write_disposition = s.pop(
+            'bucket_to_dataset').write_disposition
+        del s['local_to_bucket']
+        s['dataframe_to_dataset'] = fused_config
+
+    def _project(self, sliced_config):
+        # The columns and the rows kept are selected by a query, so that
+        # only those are extracted, downloaded and parsed. When the source is
+        # a table, the query writes them to a temporary table, named like
+        # the data whose name is not passed.
+        s = sliced_config
+        if 'dataset_to_bucket' not in s or 'local_to_dataframe' not in s:
+            return
+        columns = s['local_to_dataframe'].columns
+        max_rows = s['local_to_dataframe'].max_rows
+        if columns is None and max_rows is None:
+            return
+        if 'query_to_dataset' in s:
+            query_config = s['query_to_dataset']
+            query = query_config.query.rstrip().rstrip(';')
+            query_config.query = utils.projection_query(
+                f'(\n{query}\n)', columns, max_rows)
+            return
+        table_id = self._build_table_id(s['dataset_to_bucket'].data_name)
+        data_name = utils.timestamp_randint_string()
+        query_config = Namespace(**vars(s['dataset_to_bucket']))
+        query_config.query = utils.projection_query(
+            f'`{table_id}`', columns, max_rows)
+        query_config.write_disposition = \
+            bigquery.WriteDisposition.WRITE_TRUNCATE
+        query_config.source = 'query'
+        del query_config.clear_source
+        s['query_to_dataset'] = query_config
+        s['dataset_to_bucket'].clear_source = True
+        for c in s.values():
+            c.data_name = data_name
+
+    def _fill_table_schema(self, sliced_config):
+        # The types of the data extracted from BigQuery are fetched before
+        # its extraction, so that the files can be parsed into compact types.
+        s = sliced_config
+        if 'dataset_to_bucket' not in s:
+            return
+        config = [c for n, c in s.items() if n.endswith('_to_dataframe')][0]
+        if not config.compact_dtypes or config.schema is not None:
+            return
+        if 'query_to_dataset' in s:
+            job_config = bigquery.QueryJobConfig(dry_run=True)
+            job = self._bq_client.query(
+                query=s['query_to_dataset'].query, job_config=job_config)
+            config.schema = job.schema
+        else:
+            table = self._find_table(s['dataset_to_bucket'])
+            if table is not None:
+                config.schema = table.schema
+
+    def _create_bqwrite_client_if_needed(self, sliced_configs):
+        if self._bqwrite_client is not None or self._bq_client is None:
+            return
+        if all(s.get('dataframe_to_dataset') is None or
+               s['dataframe_to_dataset'].write_engine != 'storage'
+               for s in sliced_configs):
+            return
+        from google.cloud import bigquery_storage
+        self._bqwrite_client = bigquery_storage.BigQueryWriteClient(
+            credentials=self._bq_client._credentials)
+
+    def _create_bqstorage_client_if_needed(self, sliced_configs):
+        if self._bqstorage_client is not None or self._bq_client is None:
+            return
+        if all('dataset_to_dataframe' not in s for s in sliced_configs):
+            return
+        from google.cloud import bigquery_storage
+        self._bqstorage_client = bigquery_storage.BigQueryReadClient(
+            credentials=self._bq_client._credentials)
+
+    def _pipeline(self, sliced_config):
+        self._fuse_bucket_to_dataframe(sliced_config, uses_local=True)
+
+    def _stream_download(self, sliced_config):
+        self._fuse_bucket_to_dataframe(sliced_config, uses_local=False)
+
+    def _upload_directly(self, sliced_config):
+        s = sliced_config
+        names = ['dataframe_to_local', 'local_to_bucket', 'bucket_to_dataset']
+        if any(n not in s for n in names):
+            return
+        dataframe = s['dataframe_to_local'].dataframe
+        size = dataframe.memory_usage(index=False, deep=True).sum()
+        if size > self._max_direct_upload_bytes:
+            return
+        fused_config = Namespace(**vars(s.pop('dataframe_to_local')))
+        fused_config.destination = 'dataset'
+        fused_config.write_disposition = s.pop(
+            'bucket_to_dataset').write_disposition
+        # A CSV sent in a request body is not compressed, since it is not
+        # stored.
+        if fused_config.format == 'csv':
+            fused_config.compression = 'none'
+        del s['local_to_bucket']
+        s['dataframe_to_dataset'] = fused_config
+
+    @staticmethod
+    def _stream_upload(sliced_config):
+        s = sliced_config
+        if 'dataframe_to_local' not in s or 'local_to_bucket' not in s:
+            return
+        fused_config = Namespace(**vars(s.pop('dataframe_to_local')))
+        fused_config.destination = 'bucket'
+        del s['local_to_bucket']
+        s['dataframe_to_bucket'] = fused_config
+
+    def _iter_local_to_dataframe(self, local_to_dataframe_config):
+        config = local_to_dataframe_config
+        self._log('Starting local to dataframe...')
+        start_timestamp = datetime.now()
+        self._check_if_data_in_source(config)
+        try:
+            for p in self.list_local_file_paths(config.data_name):
+                yield from utils.iter_local_file_to_dataframes(
+                    local_file_path=p,
+                    format=config.format,
+                    separator=self._separator,
+                    dtype=config.dtype,
+                    parse_dates=config.parse_dates,
+                    chunksize=config.chunksize)
+        finally:
+            if config.clear_source:
+                self._clear_source(config)
+        end_timestamp = datetime.now()
+        duration = round((end_timestamp - start_timestamp).total_seconds())
+        self._log(f'Ended local to dataframe [{duration}s]')
+
+    def _iter_sliced_config(self, sliced_config):
+        local_to_dataframe_config = sliced_config['local_to_dataframe']
+        for n in constants.ATOMIC_FUNCTION_NAMES:
+            if n in sliced_config and n != 'local_to_dataframe':
+                self._execute_same_type_loads([sliced_config[n]])
+        yield from self._iter_local_to_dataframe(local_to_dataframe_config)
+
+    def _prepare_sliced_configs(self, configs):
+        sliced_configs = self._slice_configs(configs)
+        self._check_no_chunksize(sliced_configs)
+        if self._result_cache is not None:
+            for s in sliced_configs:
+                self._use_result_cache(s)
+        for s in sliced_configs:
+            self._read_with_storage_api(s)
+            self._write_with_storage_api(s)
+            self._project(s)
+        if self._stream_downloads:
+            for s in sliced_configs:
+                self._stream_download(s)
+        if self._pipelined:
+            for s in sliced_configs:
+                self._pipeline(s)
+        if self._max_direct_upload_bytes is not None:
+            for s in sliced_configs:
+                self._upload_directly(s)
+        if self._stream_uploads:
+            for s in sliced_configs:
+                self._stream_upload(s)
+        if self._sync_downloads:
+            for s in sliced_configs:
+                if 'bucket_to_local' in s:
+                    s['bucket_to_local'].incremental = True
+        if self._skip_unchanged_uploads:
+            for s in sliced_configs:
+                if 'local_to_bucket' in s:
+                    s['local_to_bucket'].incremental = True
+        self._check_if_clients_missing(sliced_configs)
+        self._create_bqstorage_client_if_needed(sliced_configs)
+        self._create_bqwrite_client_if_needed(sliced_configs)
+        metadata_cache = MetadataCache()
+        for s in sliced_configs:
+            for c in s.values():
+                c.metadata_cache = metadata_cache
+        for s in sliced_configs:
+            if any(n.endswith('_to_dataframe') for n in s):
+                self._fill_table_schema(s)
+        return sliced_configs
+
+    @staticmethod
+    def _iter_stages(sliced_configs):
+        for n in constants.ATOMIC_FUNCTION_NAMES:
+            indexed_atomic_configs = [
+                (i, s[n]) for i, s in enumerate(sliced_configs) if n in s]
+            if len(indexed_atomic_configs) > 0:
+                yield n, indexed_atomic_configs
+
+    def _log_saved_metadata_calls(self, sliced_configs):
+        # The configurations of a multi_load share the same cache.
+        atomic_config = next(iter(sliced_configs[0].values()))
+        nb_saved_calls = atomic_config.metadata_cache.nb_saved_calls
+        if nb_saved_calls > 0:
+            self._log(f'Reused metadata [{nb_saved_calls} call(s) saved]')
+
+    @staticmethod
+    def _store_results(res, n, indexed_atomic_configs, n_res):
+        if n.endswith('_to_dataframe'):
+            indexes = [iac[0] for iac in indexed_atomic_configs]
+            for i, r in zip(indexes, n_res):
+                res[i] = r
+
+    def _execute_chain(
+            self, sliced_config, cancel_event, deadline, upload_pool):
+        res = None
+        for n in constants.ATOMIC_FUNCTION_NAMES:
+            if n in sliced_config:
+                utils.check_not_cancelled(cancel_event)
+                n_res = self._execute_same_type_loads(
+                    [sliced_config[n]], deadline, cancel_event, upload_pool)
+                if n.endswith('_to_dataframe'):
+                    res = n_res[0]
         return res
 
-    def multi_load(self, configs: List[load_config.LoadConfig]):
+    def _execute_chains(self, sliced_configs, deadline):
+        # The uploads of all the chains share a single pool of
+        # max_upload_workers threads and a single max_upload_bytes_in_flight
+        # budget.
+        max_workers = min(len(sliced_configs), constants.MAX_CHAIN_WORKERS)
+        with self._create_upload_pool() as upload_pool:
+            return utils.map_in_threads_until_failure(
+                partial(
+                    self._execute_chain,
+                    deadline=deadline,
+                    upload_pool=upload_pool),
+                sliced_configs,
+                max_workers,
+                threading.Event())
+
+    def multi_load(
+            self,
+            configs: List[load_config.LoadConfig],
+            deadline: Optional[float] = None):
         """Execute several load jobs specified by the configurations.
 
         The BigQuery Client executes simultaneously the query_to_dataset parts
         (resp. the dataset_to_bucket and bucket_to_dataset parts) from the
-        configurations.
+        configurations. As soon as one of these BigQuery jobs fails, its error
+        is raised and the other jobs still running are cancelled. The local
+        files of all the local_to_bucket parts are uploaded by a single pool
+        of max_upload_workers threads.
+
+        This holds when the loader is built with schedule='stage'. With
+        schedule='config', each configuration starts its next step as soon
+        as its previous one has ended, and at most
+        constants.MAX_CHAIN_WORKERS configurations are executed at the same
+        time. The local files are still uploaded by a single pool of
+        max_upload_workers threads, within a single
+        max_upload_bytes_in_flight budget. As soon as one configuration
+        fails, the others do not start their next step, their BigQuery jobs
+        still running are cancelled and the error is raised.
+
+        During one call, the blobs of a data are listed once and a table is
+        looked up once. These metadata are reused by the next steps until
+        the loader writes to or deletes the data. The number of list and get
+        calls saved is written in the logs.
 
         Args:
             configs (list of google_pandas_load.load_config.LoadConfig):
                 See :class:`google_pandas_load.load_config.LoadConfig` for the
-                format of one configuration.
+                format of one configuration. Their chunksize must not be
+                passed.
+            deadline (float, optional): The number of seconds, counted from
+                the call, after which the BigQuery jobs still running are
+                cancelled and a TimeoutError is raised. If not passed, there
+                is no deadline.
 
         Returns:
             list of (pandas.DataFrame or NoneType): A list of load
@@ -479,35 +1683,53 @@ class Loader:
             by configs[i]. See :meth:`google_pandas_load.loader.Loader.load`
             for the format of one load result.
         """
-        self._check_if_configs_is_a_list(configs)
-        self._check_if_configs_empty(configs)
-        configs = [deepcopy(config) for config in configs]
-        nb_configs = len(configs)
-        self._fill_missing_data_names(configs)
-        data_names = [config.data_name for config in configs]
-        utils.check_no_prefix(data_names)
-        sliced_configs = [config.sliced for config in configs]
-        names_atomic_functions_to_call = utils.union_keys(sliced_configs)
-
-        self._check_if_bq_client_missing(names_atomic_functions_to_call)
-        self._check_if_gs_client_missing(names_atomic_functions_to_call)
-        self._check_if_local_dir_path_missing(names_atomic_functions_to_call)
-
+        absolute_deadline = utils.compute_deadline(deadline)
+        sliced_configs = self._prepare_sliced_configs(configs)
+        if self._schedule == 'config':
+            res = self._execute_chains(sliced_configs, absolute_deadline)
+            self._log_saved_metadata_calls(sliced_configs)
+            return res
         res = dict()
-        for n in constants.ATOMIC_FUNCTION_NAMES:
-            indexed_atomic_configs = [
-                (i, s[n]) for i, s in enumerate(sliced_configs) if n in s]
-            if len(indexed_atomic_configs) == 0:
-                continue
+        for n, indexed_atomic_configs in self._iter_stages(sliced_configs):
             atomic_configs = [iac[1] for iac in indexed_atomic_configs]
-            n_res = self._execute_same_type_loads(atomic_configs)
-            if n == 'local_to_dataframe':
-                indexes = [iac[0] for iac in indexed_atomic_configs]
-                for i in indexes:
-                    res[i] = n_res.pop(0)
-        res = [res.get(i) for i in range(nb_configs)]
+            n_res = self._execute_same_type_loads(
+                atomic_configs, absolute_deadline)
+            self._store_results(res, n, indexed_atomic_configs, n_res)
+        res = [res.get(i) for i in range(len(sliced_configs))]
+        self._log_saved_metadata_calls(sliced_configs)
         return res
 
+    def submit(
+            self,
+            configs: List[load_config.LoadConfig],
+            deadline: Optional[float] = None) -> MultiLoadHandle:
+        """Start executing several load jobs specified by the configurations
+        in a background thread and return at once.
+
+        The steps are executed as by
+        :meth:`google_pandas_load.loader.Loader.multi_load` with
+        schedule='stage', whatever the schedule of the loader.
+
+        Args:
+            configs (list of google_pandas_load.load_config.LoadConfig):
+                See :meth:`google_pandas_load.loader.Loader.multi_load`.
+            deadline (float, optional): See
+                :meth:`google_pandas_load.loader.Loader.multi_load`.
+
+        Returns:
+            google_pandas_load.multi_load_handle.MultiLoadHandle: A handle to
+            follow, wait for or cancel the execution.
+        """
+        absolute_deadline = utils.compute_deadline(deadline)
+        sliced_configs = self._prepare_sliced_configs(configs)
+        return MultiLoadHandle(
+            stages=list(self._iter_stages(sliced_configs)),
+            nb_configs=len(sliced_configs),
+            execute_same_type_loads=partial(
+                self._execute_same_type_loads, deadline=absolute_deadline),
+            store_results=self._store_results,
+            log_end=partial(self._log_saved_metadata_calls, sliced_configs))
+
     def load(
             self,
             source: Literal[
@@ -524,7 +1746,20 @@ class Loader:
             parse_dates: Optional[List[str]] = None,
             date_cols: Optional[List[str]] = None,
             timestamp_cols: Optional[List[str]] = None,
-            bq_schema: Optional[List[bigquery.SchemaField]] = None):
+            bq_schema: Optional[List[bigquery.SchemaField]] = None,
+            format: Optional[Literal['csv', 'parquet', 'avro']] = None,
+            compression: Optional[str] = None,
+            compression_level: Optional[int] = None,
+            result_type: Literal['pandas', 'arrow'] = 'pandas',
+            engine: Optional[Literal['c', 'python', 'pyarrow']] = None,
+            dtype_backend: Optional[
+                Literal['numpy_nullable', 'pyarrow']] = None,
+            read_engine: Optional[Literal['extract', 'storage']] = None,
+            write_engine: Optional[Literal['load_job', 'storage']] = None,
+            columns: Optional[List[str]] = None,
+            max_rows: Optional[int] = None,
+            compact_dtypes: Optional[bool] = False,
+            strict_schema_inference: Optional[bool] = None):
         """Execute a load job whose configuration is specified by the
         arguments. The data is loaded from source to destination.
 
@@ -627,12 +1862,86 @@ class Loader:
                 If source = 'dataframe' and the bq_schema is not passed, it
                 falls back to an inferred value from the dataframe with
                 `this method <LoadConfig.html#google_pandas_load.load_config.LoadConfig.bq_schema_inferred_from_dataframe>`__.
+            format (str, optional): The format of the data in Storage and in
+                the local directory, one of 'csv' or 'parquet' or 'avro'. If
+                not passed, falls back to the format of the loader.
+            compression (str, optional): The compression codec of the files
+                in Storage and in the local directory. See
+                :class:`google_pandas_load.loader.Loader` for the codecs
+                allowed by each format. If not passed, falls back to the
+                compression of the loader if the format is the one of the
+                loader, and to the default codec of the format otherwise.
+            compression_level (int, optional): The compression level used
+                when a dataframe is written to the local directory. If not
+                passed, falls back to the one of the loader when the
+                compression falls back to the one of the loader.
+            result_type (str, optional): The type of the result when
+                destination = 'dataframe', one of 'pandas' or 'arrow'. With
+                'arrow', the local files are read with pyarrow, dtype and
+                parse_dates give the types of the columns, and the tables
+                read are concatenated as the chunks of a pyarrow.Table,
+                without copying them. Defaults to 'pandas'.
+            engine (str, optional): When destination = 'dataframe' and the
+                format is 'csv', the parser engine of pandas.read_csv(), one
+                of 'c' or 'python' or 'pyarrow'. The 'pyarrow' engine parses
+                a file with several threads. If not passed, the default
+                engine of pandas is used.
+            dtype_backend (str, optional): When destination = 'dataframe',
+                the backend of the dtypes of the columns, one of
+                'numpy_nullable' or 'pyarrow'. With 'pyarrow', the strings
+                are stored in Arrow arrays instead of Python objects. The
+                columns listed in dtype keep their dtype and the ones listed
+                in parse_dates are timestamps. If not passed, the numpy
+                dtypes are used.
+            read_engine (str, optional): How data is loaded from 'dataset'
+                to 'dataframe', one of 'extract' or 'storage'. See
+                :class:`google_pandas_load.loader.Loader`. If not passed,
+                falls back to the read_engine of the loader.
+            write_engine (str, optional): How a dataframe is loaded to
+                'dataset', one of 'load_job' or 'storage'. See
+                :class:`google_pandas_load.loader.Loader`. If not passed,
+                falls back to the write_engine of the loader.
+            columns (list of str, optional): When destination = 'dataframe',
+                the columns kept, in this order. When source is one of
+                'query' or 'dataset' and the data is extracted, they are
+                selected by a query before the extraction, writing to a
+                temporary table when source = 'dataset'. With the
+                read_engine 'storage', only they are read. In all cases,
+                only they are parsed. If not passed, all the columns are
+                kept.
+            max_rows (int, optional): When destination = 'dataframe', the
+                maximal number of rows kept. They are selected like the
+                columns, with a limit clause or by reading a single stream,
+                and the parsing of each file stops after max_rows rows.
+                Without an order by clause in the query, the rows kept are
+                any rows of the data. If not passed, all the rows are kept.
+            compact_dtypes (bool, optional): When destination = 'dataframe'
+                and result_type = 'pandas', if True, the columns are parsed
+                into compact dtypes. The INTEGER and BOOLEAN columns of the
+                BigQuery table, whose schema is then fetched, or of the
+                bq_schema if it is passed, are parsed as nullable Int64 and
+                boolean. Its STRING columns, or without a schema the
+                string columns, are parsed as categories if their number of
+                distinct values in the first
+                constants.COMPACT_CATEGORY_SAMPLE_SIZE rows is at most
+                constants.COMPACT_CATEGORY_MAX_RATIO times the number of
+                these rows, and as objects otherwise. The dtypes are chosen
+                before the parsing, so that no second pass is made over the
+                data. The columns listed in dtype keep their dtype.
+                Defaults to False.
+            strict_schema_inference (bool, optional): If source =
+                'dataframe' and the bq_schema is not passed, whether all the
+                rows of the object columns are inspected to infer it. If not
+                passed, falls back to the strict_schema_inference of the
+                loader.
 
         Returns:
-            pandas.DataFrame or NoneType: The result of the load job:
+            pandas.DataFrame or pyarrow.Table or NoneType: The result of the
+            load job:
 
-            - When destination = 'dataframe', it returns a pandas dataframe
-              populated with the data specified by the arguments.
+            - When destination = 'dataframe', it returns a pandas dataframe,
+              or a pyarrow table if result_type = 'arrow', populated with
+              the data specified by the arguments.
             - In all other cases, it returns None.
         """
         config = load_config.LoadConfig(
@@ -648,6 +1957,84 @@ class Loader:
             parse_dates=parse_dates,
             date_cols=date_cols,
             timestamp_cols=timestamp_cols,
-            bq_schema=bq_schema)
+            bq_schema=bq_schema,
+            format=format,
+            compression=compression,
+            compression_level=compression_level,
+            result_type=result_type,
+            engine=engine,
+            dtype_backend=dtype_backend,
+            read_engine=read_engine,
+            write_engine=write_engine,
+            columns=columns,
+            max_rows=max_rows,
+            compact_dtypes=compact_dtypes,
+            strict_schema_inference=strict_schema_inference)
 
         return self.multi_load(configs=[config])[0]
+
+    def iter_load(
+            self,
+            source: Literal['query', 'dataset', 'bucket', 'local'],
+
+            data_name: Optional[str] = None,
+            query: Optional[str] = None,
+
+            dtype: Optional[Dict[str, Any]] = None,
+            parse_dates: Optional[List[str]] = None,
+            chunksize: Optional[int] = None,
+            format: Optional[Literal['csv', 'parquet', 'avro']] = None) \
+            -> Iterator[pandas.DataFrame]:
+        """Execute a load job from source to 'dataframe' and return an
+        iterator over the resulting dataframe, split in several pieces.
+
+        Unlike :meth:`google_pandas_load.loader.Loader.load`, the pieces are
+        never concatenated, so that only one of them is held in memory at a
+        time.
+
+        A table is always read by extraction, so when source is one of
+        'query' or 'dataset', the loader must not have
+        read_engine='storage'.
+
+        The steps preceding local_to_dataframe are executed when the first
+        piece is requested. The local files are deleted, unless source =
+        'local', when the iterator is exhausted or closed.
+
+        Args:
+            source (str): one of 'query', 'dataset', 'bucket', 'local'.
+
+            data_name (str, optional): See
+                :meth:`google_pandas_load.loader.Loader.load`.
+            query (str, optional): See
+                :meth:`google_pandas_load.loader.Loader.load`.
+
+            dtype (dict, optional): See
+                :meth:`google_pandas_load.loader.Loader.load`.
+            parse_dates (list of str, optional): See
+                :meth:`google_pandas_load.loader.Loader.load`.
+            chunksize (int, optional): The maximal number of rows of a piece.
+                A piece never spans several local files. If not passed, one
+                piece is yielded per local file.
+            format (str, optional): See
+                :meth:`google_pandas_load.loader.Loader.load`.
+
+        Returns:
+            iterator of pandas.DataFrame: The pieces of the result of the load
+            job, in the order of the local files.
+        """
+        config = load_config.LoadConfig(
+            source=source,
+            destination='dataframe',
+
+            data_name=data_name,
+            query=query,
+
+            dtype=dtype,
+            parse_dates=parse_dates,
+            chunksize=chunksize,
+            format=format)
+
+        sliced_configs = self._slice_configs(configs=[config])
+        self._check_iter_load_read_engine(sliced_configs[0])
+        self._check_if_clients_missing(sliced_configs)
+        return self._iter_sliced_config(sliced_configs[0])
@@ -1,7 +1,8 @@
 from google.cloud import bigquery, storage
 from google.auth.credentials import Credentials
 from google_pandas_load.loader import Loader
-from typing import Optional
+from google_pandas_load.result_cache import ResultCache
+from typing import Literal, Optional
 
 
 class LoaderQuickSetup(Loader):
@@ -22,6 +23,24 @@ class LoaderQuickSetup(Loader):
          separator=separator
          chunk_size=chunk_size
          timeout=timeout
+         max_download_workers=max_download_workers
+         max_upload_workers=max_upload_workers
+         max_upload_bytes_in_flight=max_upload_bytes_in_flight
+         max_parse_workers=max_parse_workers
+         pipelined=pipelined
+         schedule=schedule
+         format=format
+         compression=compression
+         compression_level=compression_level
+         max_direct_upload_bytes=max_direct_upload_bytes
+         stream_uploads=stream_uploads
+         stream_downloads=stream_downloads
+         read_engine=read_engine
+         write_engine=write_engine
+         result_cache=result_cache
+         sync_downloads=sync_downloads
+         skip_unchanged_uploads=skip_unchanged_uploads
+         strict_schema_inference=strict_schema_inference
 
     where
 
@@ -52,6 +71,25 @@ class LoaderQuickSetup(Loader):
         separator (str, optional): See base class.
         chunk_size (int, optional): See base class.
         timeout (int, optional): See base class.
+        max_download_workers (int, optional): See base class.
+        max_upload_workers (int, optional): See base class.
+        max_upload_bytes_in_flight (int, optional): See base class.
+        max_parse_workers (int, optional): See base class.
+        pipelined (bool, optional): See base class.
+        schedule (str, optional): See base class.
+        format (str, optional): See base class.
+        compression (str, optional): See base class.
+        compression_level (int, optional): See base class.
+        max_direct_upload_bytes (int, optional): See base class.
+        stream_uploads (bool, optional): See base class.
+        stream_downloads (bool, optional): See base class.
+        read_engine (str, optional): See base class.
+        write_engine (str, optional): See base class.
+        result_cache (google_pandas_load.result_cache.ResultCache, optional):
+            See base class.
+        sync_downloads (bool, optional): See base class.
+        skip_unchanged_uploads (bool, optional): See base class.
+        strict_schema_inference (bool, optional): See base class.
     """
 
     def __init__(
@@ -64,7 +102,26 @@ class LoaderQuickSetup(Loader):
             local_dir_path: Optional[str] = None,
             separator: Optional[str] = '|',
             chunk_size: Optional[int] = 2**28,
-            timeout: Optional[int] = 60):
+            timeout: Optional[int] = 60,
+            max_download_workers: Optional[int] = 1,
+            max_upload_workers: Optional[int] = 1,
+            max_upload_bytes_in_flight: Optional[int] = None,
+            max_parse_workers: Optional[int] = 1,
+            pipelined: Optional[bool] = False,
+            schedule: Optional[Literal['stage', 'config']] = 'stage',
+            format: Optional[Literal['csv', 'parquet', 'avro']] = 'csv',
+            compression: Optional[str] = None,
+            compression_level: Optional[int] = None,
+            max_direct_upload_bytes: Optional[int] = None,
+            stream_uploads: Optional[bool] = False,
+            stream_downloads: Optional[bool] = False,
+            read_engine: Optional[Literal['extract', 'storage']] = 'extract',
+            write_engine: Optional[
+                Literal['load_job', 'storage']] = 'load_job',
+            result_cache: Optional[ResultCache] = None,
+            sync_downloads: Optional[bool] = False,
+            skip_unchanged_uploads: Optional[bool] = False,
+            strict_schema_inference: Optional[bool] = False):
         self._project_id = project_id
         self._check_project_id_dataset_name_bucket_name_consistency(
             dataset_name, bucket_name)
@@ -88,7 +145,25 @@ class LoaderQuickSetup(Loader):
             local_dir_path=local_dir_path,
             separator=separator,
             chunk_size=chunk_size,
-            timeout=timeout)
+            timeout=timeout,
+            max_download_workers=max_download_workers,
+            max_upload_workers=max_upload_workers,
+            max_upload_bytes_in_flight=max_upload_bytes_in_flight,
+            max_parse_workers=max_parse_workers,
+            pipelined=pipelined,
+            schedule=schedule,
+            format=format,
+            compression=compression,
+            compression_level=compression_level,
+            max_direct_upload_bytes=max_direct_upload_bytes,
+            stream_uploads=stream_uploads,
+            stream_downloads=stream_downloads,
+            read_engine=read_engine,
+            write_engine=write_engine,
+            result_cache=result_cache,
+            sync_downloads=sync_downloads,
+            skip_unchanged_uploads=skip_unchanged_uploads,
+            strict_schema_inference=strict_schema_inference)
 
     @property
     def project_id(self) -> str:
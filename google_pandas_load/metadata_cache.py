@@ -0,0 +1,58 @@
+import threading
+
+
+class MetadataCache:
+    """Metadata of the blobs and of the tables read during one execution of
+    :meth:`google_pandas_load.loader.Loader.multi_load`.
+
+    The blobs of a data are listed once and a table is looked up once. The
+    result is reused by the checks, the clears and the jobs of the next
+    steps, until the loader writes to or deletes this data itself. It should
+    not be built directly.
+    """
+    def __init__(self):
+        self._blobs = dict()
+        self._tables = dict()
+        self._lock = threading.Lock()
+        self._nb_saved_calls = 0
+
+    @property
+    def nb_saved_calls(self) -> int:
+        """int: The number of list and get calls avoided."""
+        with self._lock:
+            return self._nb_saved_calls
+
+    def _get(self, entries, key, fetch):
+        with self._lock:
+            if key in entries:
+                self._nb_saved_calls += 1
+                return entries[key]
+        # The call is made outside of the lock, so that the steps of
+        # different configurations do not wait for each other.
+        value = fetch(key)
+        with self._lock:
+            entries[key] = value
+        return value
+
+    def blobs(self, data_name, list_blobs):
+        """Return the blobs of the data named_ data_name, listed with
+        list_blobs if they are not known."""
+        return self._get(self._blobs, data_name, list_blobs)
+
+    def table(self, table_id, find_table):
+        """Return the table table_id, or None if it does not exist, looked up
+        with find_table if it is not known."""
+        return self._get(self._tables, table_id, find_table)
+
+    def invalidate_blobs(self, data_name):
+        """Forget the blobs of the data named_ data_name and of the data
+        whose listing includes them or is included in theirs."""
+        with self._lock:
+            for n in list(self._blobs):
+                if n.startswith(data_name) or data_name.startswith(n):
+                    del self._blobs[n]
+
+    def invalidate_table(self, table_id):
+        """Forget the table table_id."""
+        with self._lock:
+            self._tables.pop(table_id, None)
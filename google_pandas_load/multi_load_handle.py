@@ -0,0 +1,132 @@
+import threading
+from concurrent.futures import Future, CancelledError
+from typing import List, Optional
+from google_pandas_load import utils
+
+
+class MultiLoadHandle:
+    """Handle on load jobs executed in a background thread.
+
+    It is returned by :meth:`google_pandas_load.loader.Loader.submit` and
+    should not be built directly.
+
+    A cancellation takes effect at the next check: between two steps, or
+    while the BigQuery jobs of a step are polled, in which case they are
+    cancelled. A transfer between Storage, the local directory and the RAM
+    which has already started is not interrupted.
+    """
+    def __init__(
+            self,
+            stages,
+            nb_configs,
+            execute_same_type_loads,
+            store_results,
+            log_end):
+        self._stages = stages
+        self._execute_same_type_loads = execute_same_type_loads
+        self._store_results = store_results
+        self._log_end = log_end
+        self._futures = [Future() for _ in range(nb_configs)]
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._nb_ended_stages = 0
+        self._current_stage = None
+        self._thread = threading.Thread(target=self._run)
+        self._thread.start()
+
+    @property
+    def futures(self) -> List[Future]:
+        """list of concurrent.futures.Future: The i-th future holds the
+        result of the load job configured by configs[i]. It is resolved as
+        soon as this result is available."""
+        return self._futures
+
+    @property
+    def nb_stages(self) -> int:
+        """int: The number of steps to execute."""
+        return len(self._stages)
+
+    @property
+    def nb_ended_stages(self) -> int:
+        """int: The number of steps which have ended."""
+        with self._lock:
+            return self._nb_ended_stages
+
+    @property
+    def current_stage(self) -> Optional[str]:
+        """str: The name of the step being executed, for instance
+        'dataset_to_bucket', or None if no step is being executed."""
+        with self._lock:
+            return self._current_stage
+
+    def done(self) -> bool:
+        """Return True if the execution has ended, successfully or not."""
+        return all(f.done() for f in self._futures)
+
+    def result(self, timeout: Optional[float] = None) -> list:
+        """Wait for the execution to end and return its results.
+
+        Args:
+            timeout (float, optional): The maximal number of seconds to wait.
+                If not passed, there is no limit.
+
+        Returns:
+            list of (pandas.DataFrame or NoneType): See
+            :meth:`google_pandas_load.loader.Loader.multi_load`.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the execution has not ended
+                within timeout seconds.
+            concurrent.futures.CancelledError: If the execution has been
+                cancelled.
+        """
+        deadline = utils.compute_deadline(timeout)
+        res = []
+        for f in self._futures:
+            remaining_seconds = utils.seconds_before_deadline(deadline)
+            res.append(f.result(timeout=remaining_seconds))
+        return res
+
+    def cancel(self) -> bool:
+        """Ask for the execution to stop.
+
+        Returns:
+            bool: False if the execution had already ended, True otherwise.
+        """
+        if self.done():
+            return False
+        self._cancel_event.set()
+        return True
+
+    def _run(self):
+        res = dict()
+        try:
+            for n, indexed_atomic_configs in self._stages:
+                utils.check_not_cancelled(self._cancel_event)
+                with self._lock:
+                    self._current_stage = n
+                atomic_configs = [iac[1] for iac in indexed_atomic_configs]
+                n_res = self._execute_same_type_loads(
+                    atomic_configs, cancel_event=self._cancel_event)
+                self._store_results(res, n, indexed_atomic_configs, n_res)
+                for i, r in res.items():
+                    if not self._futures[i].done():
+                        self._futures[i].set_result(r)
+                with self._lock:
+                    self._current_stage = None
+                    self._nb_ended_stages += 1
+        except CancelledError:
+            for f in self._futures:
+                f.cancel()
+        except BaseException as e:
+            for f in self._futures:
+                if not f.done():
+                    f.set_exception(e)
+        else:
+            self._log_end()
+            for f in self._futures:
+                if not f.done():
+                    f.set_result(None)
+        finally:
+            with self._lock:
+                self._current_stage = None
@@ -0,0 +1,171 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+import pandas
+from typing import Optional, Dict, Any
+from google_pandas_load import utils
+logger = logging.getLogger(name=__name__)
+
+
+class ResultCache:
+    """Local cache of the results of the loads from 'query' to 'dataframe'.
+
+    It is passed to :class:`google_pandas_load.loader.Loader`. A result is
+    identified by a hash of the normalized query and of the options which
+    shape the result, such as dtype and parse_dates. It is stored in a
+    Parquet file of the cache directory, so that a pandas dataframe keeps its
+    dtypes and its index.
+
+    An entry expires ttl seconds after it has been written. When the files
+    of the cache exceed max_bytes, the least recently used ones are deleted.
+
+    Using a ResultCache requires pyarrow.
+
+    Args:
+        dir_path (str): The directory where the results are stored. It is
+            created if it does not exist.
+        ttl (int, optional): The number of seconds during which an entry can
+            be read. If not passed, the entries do not expire.
+        max_bytes (int, optional): The maximal total size of the files of the
+            cache. If not passed, there is no limit.
+    """
+    def __init__(
+            self,
+            dir_path: str,
+            ttl: Optional[int] = None,
+            max_bytes: Optional[int] = None):
+        self._dir_path = dir_path
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+
+        if self._ttl is not None:
+            utils.check_positive_integer(self._ttl, 'ttl')
+        if self._max_bytes is not None:
+            utils.check_positive_integer(self._max_bytes, 'max_bytes')
+
+        os.makedirs(self._dir_path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def dir_path(self) -> str:
+        """str: The directory where the results are stored."""
+        return self._dir_path
+
+    @property
+    def hits(self) -> int:
+        """int: The number of results read from the cache."""
+        with self._lock:
+            return self._hits
+
+    @property
+    def misses(self) -> int:
+        """int: The number of results looked for and not found."""
+        with self._lock:
+            return self._misses
+
+    @staticmethod
+    def key(query: str, options: Dict[str, Any]) -> str:
+        """Return the key of the result of a query.
+
+        Args:
+            query (str): The query. Its whitespace outside of the quoted
+                strings and its final semicolons do not change the key.
+            options (dict): The options which shape the result.
+
+        Returns:
+            str: A hexadecimal hash.
+        """
+        content = json.dumps(
+            {'query': utils.normalize_query(query), 'options': options},
+            sort_keys=True,
+            default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self._dir_path, key + '.parquet')
+
+    def _is_expired(self, path):
+        if self._ttl is None:
+            return False
+        return time.time() - os.path.getmtime(path) > self._ttl
+
+    def get(self, key: str, result_type: str):
+        """Return the result stored under key, or None if there is none.
+
+        Args:
+            key (str): The key of the result.
+            result_type (str): One of 'pandas' or 'arrow'.
+
+        Returns:
+            pandas.DataFrame or pyarrow.Table or NoneType: The result.
+        """
+        import pyarrow.parquet
+        path = self._path(key)
+        with self._lock:
+            if os.path.isfile(path) and self._is_expired(path):
+                os.remove(path)
+            if not os.path.isfile(path):
+                self._misses += 1
+                return None
+            # The access time orders the entries for the eviction, the
+            # modification time is the one of the writing.
+            os.utime(path, (time.time(), os.path.getmtime(path)))
+            self._hits += 1
+            if result_type == 'arrow':
+                return pyarrow.parquet.read_table(path)
+            return pandas.read_parquet(path)
+
+    def put(self, key: str, result) -> None:
+        """Store a result under key, then evict the least recently used
+        entries if the cache is too big.
+
+        A result which cannot be written to Parquet is not stored.
+
+        Args:
+            key (str): The key of the result.
+            result (pandas.DataFrame or pyarrow.Table): The result.
+        """
+        import pyarrow
+        import pyarrow.parquet
+        path = self._path(key)
+        tmp_path = path + '.tmp'
+        try:
+            if isinstance(result, pandas.DataFrame):
+                result.to_parquet(tmp_path)
+            else:
+                pyarrow.parquet.write_table(result, tmp_path)
+        except pyarrow.ArrowException as e:
+            logger.debug(f'Result not cached: {e}')
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+            return
+        with self._lock:
+            os.replace(tmp_path, path)
+            self._evict()
+
+    def _evict(self):
+        if self._max_bytes is None:
+            return
+        entries = []
+        for basename in os.listdir(self._dir_path):
+            if basename.endswith('.parquet'):
+                stat = os.stat(os.path.join(self._dir_path, basename))
+                entries.append((stat.st_atime, stat.st_size, basename))
+        total_bytes = sum(e[1] for e in entries)
+        for _, size, basename in sorted(entries):
+            if total_bytes <= self._max_bytes:
+                return
+            os.remove(os.path.join(self._dir_path, basename))
+            total_bytes -= size
+
+    def clear(self) -> None:
+        """Delete all the entries."""
+        with self._lock:
+            for basename in os.listdir(self._dir_path):
+                if basename.endswith('.parquet'):
+                    os.remove(os.path.join(self._dir_path, basename))
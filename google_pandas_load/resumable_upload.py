@@ -0,0 +1,96 @@
+import io
+import requests
+import google.api_core.exceptions
+
+
+class ResumableUploadWriter(io.BufferedIOBase):
+    """Binary file object writing a blob through a resumable upload session.
+
+    The session is created with
+    google.cloud.storage.blob.Blob.create_resumable_upload_session. The data
+    is sent in chunks of chunk_size bytes, a multiple of 256 KiB, and the
+    blob is created when the writer is closed. It should not be built
+    directly.
+
+    Unlike close, abort cancels the session, so that no blob is created. The
+    writer is then closed and a garbage collection does not finalize the
+    upload.
+    """
+    def __init__(self, blob, chunk_size, timeout):
+        self._session_url = blob.create_resumable_upload_session(
+            timeout=timeout)
+        self._chunk_size = chunk_size
+        self._timeout = timeout
+        self._buffer = bytearray()
+        self._offset = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._offset + len(self._buffer)
+
+    def write(self, b) -> int:
+        self._checkClosed()
+        self._buffer += b
+        while len(self._buffer) >= self._chunk_size:
+            self._send(self._chunk_size, final=False)
+        return memoryview(b).nbytes
+
+    def close(self):
+        """Send the buffered data and create the blob."""
+        if self.closed:
+            return
+        try:
+            self._send(len(self._buffer), final=True)
+        finally:
+            super().close()
+
+    def abort(self):
+        """Cancel the upload session, so that no blob is created.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If the session
+                cannot be cancelled. It then expires on its own, without
+                creating a blob.
+        """
+        if self.closed:
+            return
+        super().close()
+        self._buffer = bytearray()
+        response = requests.delete(self._session_url, timeout=self._timeout)
+        # Storage answers a cancellation with the status code 499.
+        if response.status_code != 499:
+            raise google.api_core.exceptions.from_http_response(response)
+
+    def _send(self, size, final):
+        # Storage may persist only the beginning of a chunk which is not
+        # the last one, the rest is then sent again with the next chunk.
+        end = self._offset + size
+        total = str(end) if final else '*'
+        if size == 0:
+            content_range = f'bytes */{total}'
+        else:
+            content_range = f'bytes {self._offset}-{end - 1}/{total}'
+        response = requests.put(
+            self._session_url,
+            data=bytes(self._buffer[:size]),
+            headers={'Content-Range': content_range},
+            timeout=self._timeout)
+        if final and response.status_code in (200, 201):
+            persisted = end
+        elif not final and response.status_code == 308:
+            persisted = self._persisted(response)
+        else:
+            raise google.api_core.exceptions.from_http_response(response)
+        del self._buffer[:persisted - self._offset]
+        self._offset = persisted
+
+    @staticmethod
+    def _persisted(response):
+        # The Range header of a 308 response, bytes=0-n, gives the number
+        # n + 1 of bytes persisted. It is missing if none is.
+        persisted_range = response.headers.get('Range')
+        if persisted_range is None:
+            return 0
+        return int(persisted_range.split('-')[-1]) + 1
@@ -0,0 +1,53 @@
+import threading
+from concurrent.futures import Future
+
+
+class StorageWriteJob:
+    """Write to a BigQuery table with the Storage Write API, executed in a
+    background thread.
+
+    It has the interface of the BigQuery jobs polled by the loader: done,
+    result, cancel and state. It should not be built directly.
+
+    A cancellation takes effect before the next batch of rows is sent. The
+    rows already sent to a committed stream stay in the table, the ones sent
+    to a pending stream are discarded.
+    """
+    def __init__(self, write):
+        self._write = write
+        self._future = Future()
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.start()
+
+    @property
+    def state(self) -> str:
+        """str: 'DONE' if the write has ended, 'RUNNING' otherwise."""
+        return 'DONE' if self.done() else 'RUNNING'
+
+    def done(self) -> bool:
+        """Return True if the write has ended, successfully or not."""
+        return self._future.done()
+
+    def result(self):
+        """Wait for the write to end and raise its error, if any."""
+        return self._future.result()
+
+    def cancel(self) -> bool:
+        """Ask for the write to stop.
+
+        Returns:
+            bool: False if the write had already ended, True otherwise.
+        """
+        if self.done():
+            return False
+        self._cancel_event.set()
+        return True
+
+    def _run(self):
+        try:
+            self._write(self._cancel_event)
+        except BaseException as e:
+            self._future.set_exception(e)
+        else:
+            self._future.set_result(None)
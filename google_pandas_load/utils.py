@@ -1,19 +1,1047 @@
+import os
+import re
+import json
+import gzip
+import base64
+import time
 import uuid
+import itertools
+import queue
+import threading
+import multiprocessing
+import numpy
+import pandas
 import google.cloud.exceptions
+from contextlib import contextmanager
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, \
+    CancelledError, FIRST_EXCEPTION, wait
 from datetime import datetime
+from google_pandas_load import constants
 
 
-def table_exists(bq_client, table_id):
+def find_table(bq_client, table_id):
     try:
-        bq_client.get_table(table_id)
-        return True
+        return bq_client.get_table(table_id)
     except google.cloud.exceptions.NotFound:
-        return False
+        return None
+
+
+def table_exists(bq_client, table_id):
+    return find_table(bq_client, table_id) is not None
+
+
+def poll_jobs(jobs):
+    # Returns the jobs which are not done yet. Raises the error of the first
+    # failed job, if any.
+    pending_jobs = []
+    for job in jobs:
+        if job.done():
+            job.result()
+        else:
+            pending_jobs.append(job)
+    return pending_jobs
 
 
-def wait_for_jobs(jobs):
+def cancel_jobs(jobs):
     for job in jobs:
-        job.result()
+        if job.state != 'DONE':
+            try:
+                job.cancel()
+            except google.cloud.exceptions.GoogleCloudError:
+                pass
+
+
+def check_deadline(deadline, pending_jobs):
+    if deadline is not None and time.monotonic() >= deadline:
+        msg = (f'{len(pending_jobs)} BigQuery job(s) did not end '
+               f'before the deadline')
+        raise TimeoutError(msg)
+
+
+def check_not_cancelled(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        raise CancelledError('The load has been cancelled')
+
+
+def seconds_before_next_poll(deadline):
+    if deadline is None:
+        return constants.JOB_POLLING_INTERVAL
+    remaining_seconds = max(deadline - time.monotonic(), 0)
+    return min(constants.JOB_POLLING_INTERVAL, remaining_seconds)
+
+
+def wait_for_jobs(jobs, deadline=None, cancel_event=None):
+    # All the jobs are polled at each round, so that the first failure is
+    # raised as soon as it is seen. The jobs still running are then
+    # cancelled, as they are when the deadline, a time.monotonic() value,
+    # is exceeded or when cancel_event, a threading.Event, is set.
+    try:
+        pending_jobs = poll_jobs(jobs)
+        while len(pending_jobs) > 0:
+            check_deadline(deadline, pending_jobs)
+            check_not_cancelled(cancel_event)
+            time.sleep(seconds_before_next_poll(deadline))
+            pending_jobs = poll_jobs(pending_jobs)
+    except BaseException:
+        cancel_jobs(jobs)
+        raise
+
+
+def map_in_executor(executor, function, iterable):
+    # Results are collected in the order of iterable so that, if several
+    # calls fail, the error raised is always the one of the first failing
+    # item. The calls not started yet are then cancelled.
+    futures = [executor.submit(function, item) for item in iterable]
+    try:
+        return [f.result() for f in futures]
+    except BaseException:
+        for f in futures:
+            f.cancel()
+        raise
+
+
+def _map_in_executor(executor_class, function, iterable, max_workers):
+    items = list(iterable)
+    if max_workers == 1 or len(items) <= 1:
+        return [function(item) for item in items]
+    with executor_class(max_workers=max_workers) as executor:
+        return map_in_executor(executor, function, items)
+
+
+def map_in_threads(function, iterable, max_workers):
+    return _map_in_executor(
+        ThreadPoolExecutor, function, iterable, max_workers)
+
+
+def map_in_threads_until_failure(
+        function, iterable, max_workers, cancel_event):
+    # Unlike map_in_threads, the first failure in time is raised as soon as
+    # it happens: cancel_event, a threading.Event passed to the calls, is set
+    # so that the calls still running stop at their next check, and the
+    # calls not started yet are cancelled. The error is raised once the
+    # running calls have stopped.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(function, item, cancel_event)
+                   for item in iterable]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        errors = [f.exception() for f in futures
+                  if f in done and f.exception() is not None]
+        if len(errors) > 0:
+            cancel_event.set()
+            for f in futures:
+                f.cancel()
+            raise errors[0]
+        return [f.result() for f in futures]
+
+
+def map_in_processes(function, iterable, max_workers):
+    # function must be picklable, for instance a module level function or
+    # a functools.partial of it. The workers are spawned rather than forked,
+    # since forking a process whose threads may hold locks, like the ones
+    # of the clients, can deadlock the child.
+    executor_class = partial(
+        ProcessPoolExecutor,
+        mp_context=multiprocessing.get_context('spawn'))
+    return _map_in_executor(executor_class, function, iterable, max_workers)
+
+
+def cast_dataframe(dataframe, dtype, parse_dates):
+    # Gives to a dataframe read from a file which is not a CSV the types
+    # pandas.read_csv would have given with dtype and parse_dates.
+    if dtype is not None:
+        dataframe = dataframe.astype(dtype)
+    if parse_dates is not None:
+        for col in parse_dates:
+            if not pandas.api.types.is_datetime64_any_dtype(dataframe[col]):
+                dataframe[col] = pandas.to_datetime(dataframe[col])
+    return dataframe
+
+
+def csv_file_to_dataframe(
+        local_file_path, separator, dtype, parse_dates, engine,
+        dtype_backend, columns=None, max_rows=None):
+    # The pyarrow engine does not support nrows, so the whole file is then
+    # read before the first max_rows rows are kept. With a dtype_backend,
+    # pandas.read_csv leaves the columns listed in parse_dates as objects
+    # holding '<NA>' strings, so they are read with the backend and parsed
+    # afterwards.
+    kwargs = dict()
+    if engine is not None:
+        kwargs['engine'] = engine
+    if dtype_backend is not None:
+        kwargs['dtype_backend'] = dtype_backend
+    if engine != 'pyarrow':
+        kwargs['nrows'] = max_rows
+    dataframe = pandas.read_csv(
+        filepath_or_buffer=local_file_path,
+        sep=separator,
+        dtype=dtype,
+        parse_dates=parse_dates if dtype_backend is None else None,
+        skip_blank_lines=False,
+        usecols=columns,
+        **kwargs)
+    dataframe = head(select_columns(dataframe, columns), max_rows)
+    if dtype_backend is not None:
+        dataframe = parse_date_columns(dataframe, parse_dates, dtype_backend)
+    return dataframe
+
+
+def select_columns(dataframe_or_table, columns):
+    # Puts the columns in the order of the list columns, which usecols does
+    # not keep.
+    if columns is None:
+        return dataframe_or_table
+    if isinstance(dataframe_or_table, pandas.DataFrame):
+        return dataframe_or_table[columns]
+    return dataframe_or_table.select(columns)
+
+
+def restrict_to_columns(dtype, parse_dates, columns):
+    # Drops from dtype and parse_dates the columns which are not read.
+    if columns is None:
+        return dtype, parse_dates
+    if dtype is not None:
+        dtype = {col: d for col, d in dtype.items() if col in columns}
+    if parse_dates is not None:
+        parse_dates = [col for col in parse_dates if col in columns]
+    return dtype, parse_dates
+
+
+def head(result, max_rows):
+    # Keeps the first max_rows rows of a pandas.DataFrame or a
+    # pyarrow.Table.
+    if max_rows is None:
+        return result
+    if isinstance(result, pandas.DataFrame):
+        return result.head(max_rows)
+    return result.slice(0, max_rows)
+
+
+_COMPACT_DTYPES = {
+    'INTEGER': 'Int64',
+    'INT64': 'Int64',
+    'BOOLEAN': 'boolean',
+    'BOOL': 'boolean'}
+
+
+def compact_dtype(bq_schema, dtype, parse_dates, sample):
+    # The dtypes with which the columns are parsed directly into compact
+    # types: nullable integers and booleans for the INTEGER and BOOLEAN
+    # columns of bq_schema, and categories for the string columns whose
+    # values in sample, the first rows of the data, have a low cardinality.
+    # The string columns are the STRING columns of bq_schema, or without
+    # it the object columns of sample. The columns listed in dtype and
+    # parse_dates keep their types.
+    res = dict()
+    if bq_schema is None:
+        string_cols = [
+            col for col in sample.columns if sample[col].dtype == object]
+    else:
+        string_cols = [
+            field.name for field in bq_schema
+            if field.field_type == 'STRING']
+        for field in bq_schema:
+            if field.field_type in _COMPACT_DTYPES:
+                res[field.name] = _COMPACT_DTYPES[field.field_type]
+    for col in string_cols:
+        if col not in sample.columns:
+            continue
+        if has_low_cardinality(sample[col]):
+            res[col] = 'category'
+        else:
+            res[col] = object
+    for col in parse_dates or []:
+        res.pop(col, None)
+    res.update(dtype or dict())
+    return res
+
+
+def has_low_cardinality(series):
+    nb_values = series.nunique(dropna=True)
+    return nb_values <= constants.COMPACT_CATEGORY_MAX_RATIO * len(series)
+
+
+def sample_positions(nb_rows, strict):
+    # The positions of the rows whose values describe the object columns:
+    # all of them if strict, otherwise at most
+    # constants.SCHEMA_INFERENCE_SAMPLE_SIZE drawn at random, the same for
+    # every column.
+    sample_size = constants.SCHEMA_INFERENCE_SAMPLE_SIZE
+    if strict or nb_rows <= sample_size:
+        return None
+    return numpy.sort(
+        numpy.random.default_rng(0).integers(0, nb_rows, sample_size))
+
+
+def infer_column_dtype(column, positions):
+    # A typed column is described by its dtype, without inspecting its
+    # values.
+    dtype = column.dtype
+    if pandas.api.types.is_bool_dtype(dtype):
+        return 'boolean'
+    if pandas.api.types.is_integer_dtype(dtype):
+        return 'integer'
+    if pandas.api.types.is_float_dtype(dtype):
+        return 'floating'
+    if dtype != object or positions is None:
+        return pandas.api.types.infer_dtype(column)
+    return pandas.api.types.infer_dtype(column.to_numpy()[positions])
+
+
+def unify_categories(dataframes):
+    # pandas.concat gives an object column when the categories of a
+    # categorical column differ from one dataframe to another.
+    if len(dataframes) < 2:
+        return dataframes
+    dataframes = [df.copy(deep=False) for df in dataframes]
+    for col in dataframes[0].columns:
+        if not all(isinstance(df[col].dtype, pandas.CategoricalDtype)
+                   for df in dataframes if col in df.columns):
+            continue
+        categories = dataframes[0][col].cat.categories
+        for df in dataframes[1:]:
+            if col in df.columns:
+                categories = categories.union(df[col].cat.categories)
+        for df in dataframes:
+            if col in df.columns:
+                df[col] = df[col].cat.set_categories(categories)
+    return dataframes
+
+
+def convert_dtype_backend(dataframe, dtype, parse_dates, dtype_backend):
+    # The columns whose dtype is given keep it. The columns listed in
+    # parse_dates, which the pyarrow engine reads as dates when they have
+    # no time, are given a timestamp type.
+    if dtype_backend is None:
+        return dataframe
+    dataframe = dataframe.copy(deep=False)
+    converted = dataframe.drop(columns=list(dtype or [])).convert_dtypes(
+        dtype_backend=dtype_backend)
+    for col in converted.columns:
+        dataframe[col] = converted[col]
+    return parse_date_columns(dataframe, parse_dates, dtype_backend)
+
+
+def parse_date_columns(dataframe, parse_dates, dtype_backend):
+    # Gives a timestamp type to the columns listed in parse_dates of a
+    # dataframe whose other columns already have the dtype_backend.
+    if not parse_dates:
+        return dataframe
+    dataframe = dataframe.copy(deep=False)
+    if dtype_backend == 'pyarrow':
+        import pyarrow
+        for col in parse_dates:
+            col_dtype = dataframe[col].dtype
+            if isinstance(col_dtype, pandas.ArrowDtype) and \
+                    pyarrow.types.is_timestamp(col_dtype.pyarrow_dtype):
+                continue
+            column = parse_timestamps(
+                pyarrow.array(dataframe[col], from_pandas=True))
+            dataframe[col] = pandas.Series(
+                pandas.arrays.ArrowExtensionArray(column),
+                index=dataframe.index)
+    else:
+        for col in parse_dates:
+            dataframe[col] = parse_timestamp_series(dataframe[col])
+    return dataframe
+
+
+def parse_timestamp_series(series):
+    # pandas version of parse_timestamps.
+    if pandas.api.types.is_datetime64_any_dtype(series):
+        return series
+    if pandas.api.types.is_string_dtype(series) and \
+            series.str.endswith(' UTC').any():
+        return pandas.to_datetime(
+            series.str.removesuffix(' UTC'), format='ISO8601', utc=True)
+    return pandas.to_datetime(series, format='ISO8601')
+
+
+def parquet_file_to_dataframe(
+        local_file_path, dtype, parse_dates, columns=None, max_rows=None):
+    if max_rows is None:
+        dataframe = pandas.read_parquet(
+            path=local_file_path, columns=columns)
+    else:
+        table = parquet_file_head(local_file_path, columns, max_rows)
+        dataframe = table.to_pandas()
+    return cast_dataframe(dataframe, dtype, parse_dates)
+
+
+def parquet_file_head(local_file_path, columns, max_rows):
+    # Only the row groups holding the first max_rows rows are read.
+    import pyarrow
+    import pyarrow.parquet
+    parquet_file = pyarrow.parquet.ParquetFile(local_file_path)
+    batches = parquet_file.iter_batches(batch_size=max_rows, columns=columns)
+    batch = next(batches, None)
+    if batch is None:
+        schema = parquet_file.schema_arrow
+        return select_columns(schema.empty_table(), columns)
+    return pyarrow.Table.from_batches([batch])
+
+
+def avro_logical_type(avro_type):
+    # An Avro type of a nullable column is a union with 'null'.
+    if isinstance(avro_type, list):
+        avro_type = [t for t in avro_type if t != 'null'][0]
+    if isinstance(avro_type, dict):
+        return avro_type.get('logicalType')
+    return None
+
+
+def avro_column(values, avro_type):
+    # The values of a logical type, decoded by fastavro as Python objects,
+    # are converted at once to a typed column: datetime64 for the TIMESTAMP
+    # and DATE columns and float64 for the NUMERIC and BIGNUMERIC columns,
+    # like pandas.read_csv would give with parse_dates.
+    logical_type = avro_logical_type(avro_type)
+    if logical_type in ('timestamp-micros', 'timestamp-millis'):
+        return pandas.to_datetime(values, utc=True)
+    if logical_type == 'date':
+        return pandas.to_datetime(values)
+    if logical_type == 'decimal':
+        return numpy.array(values, dtype=object).astype('float64')
+    return values
+
+
+def avro_records_to_dataframe(
+        records, avro_schema, dtype, parse_dates, columns=None):
+    # The columns are built one at a time from the decoded records.
+    fields = {field['name']: field for field in avro_schema['fields']}
+    data = dict()
+    for col in columns or list(fields):
+        data[col] = avro_column(
+            [r[col] for r in records], fields[col]['type'])
+    dataframe = pandas.DataFrame(data=data)
+    return cast_dataframe(dataframe, dtype, parse_dates)
+
+
+def avro_file_to_dataframe(
+        path_or_buffer, dtype, parse_dates, columns=None, max_rows=None):
+    # path_or_buffer is a path or a binary file object, like the first
+    # argument of pandas.read_parquet.
+    import fastavro
+    if isinstance(path_or_buffer, str):
+        with open(path_or_buffer, 'rb') as f:
+            return avro_file_to_dataframe(
+                f, dtype, parse_dates, columns, max_rows)
+    reader = fastavro.reader(path_or_buffer)
+    records = list(itertools.islice(reader, max_rows))
+    return avro_records_to_dataframe(
+        records, reader.writer_schema, dtype, parse_dates, columns)
+
+
+def local_file_to_dataframe(
+        local_file_path, format, separator, dtype, parse_dates, engine,
+        dtype_backend, columns=None, max_rows=None, compact=False,
+        bq_schema=None):
+    # engine only applies to CSV files. With compact, the types of the
+    # columns are compacted while they are parsed, using bq_schema if it is
+    # passed and the first rows of the file.
+    dtype, parse_dates = restrict_to_columns(dtype, parse_dates, columns)
+    read_dtype = dtype
+    if compact:
+        sample = local_file_head(
+            local_file_path, format, separator, dtype, parse_dates, columns,
+            max_rows)
+        read_dtype, _ = restrict_to_columns(
+            compact_dtype(bq_schema, dtype, parse_dates, sample), None,
+            columns)
+    if format == 'csv':
+        # pandas.read_csv already gives the dtype_backend.
+        return csv_file_to_dataframe(
+            local_file_path, separator, read_dtype, parse_dates, engine,
+            dtype_backend, columns, max_rows)
+    if format == 'parquet':
+        dataframe = parquet_file_to_dataframe(
+            local_file_path, read_dtype, parse_dates, columns, max_rows)
+    else:
+        dataframe = avro_file_to_dataframe(
+            local_file_path, read_dtype, parse_dates, columns, max_rows)
+    return convert_dtype_backend(
+        dataframe, read_dtype, parse_dates, dtype_backend)
+
+
+def local_file_head(
+        local_file_path, format, separator, dtype, parse_dates, columns,
+        max_rows):
+    # The first rows of a local file, from which the string columns parsed
+    # as categories are chosen. A binary file object is rewound so that it
+    # can then be parsed entirely.
+    nb_rows = constants.COMPACT_CATEGORY_SAMPLE_SIZE
+    if max_rows is not None:
+        nb_rows = min(nb_rows, max_rows)
+    if format == 'parquet':
+        sample = parquet_file_to_dataframe(
+            local_file_path, dtype, parse_dates, columns, nb_rows)
+    elif format == 'avro':
+        sample = avro_file_to_dataframe(
+            local_file_path, dtype, parse_dates, columns, nb_rows)
+    else:
+        sample = csv_file_to_dataframe(
+            local_file_path, separator, dtype, parse_dates, None, None,
+            columns, nb_rows)
+    if not isinstance(local_file_path, str):
+        local_file_path.seek(0)
+    return sample
+
+
+def arrow_type(dtype):
+    import pyarrow
+    pandas_dtype = pandas.api.types.pandas_dtype(dtype)
+    if pandas.api.types.is_string_dtype(pandas_dtype):
+        return pyarrow.string()
+    return pyarrow.from_numpy_dtype(
+        getattr(pandas_dtype, 'numpy_dtype', pandas_dtype))
+
+
+def parse_timestamps(column):
+    # Arrow version of the parsing of a column listed in parse_dates by
+    # pandas.read_csv. BigQuery writes the TIMESTAMP values with a ' UTC'
+    # suffix, which gives a column in UTC, and the DATE and DATETIME values
+    # without it, which gives a naive column.
+    import pyarrow
+    import pyarrow.compute
+    if pyarrow.types.is_timestamp(column.type):
+        return column
+    if not (pyarrow.types.is_string(column.type) or
+            pyarrow.types.is_large_string(column.type)):
+        return column.cast(pyarrow.timestamp('ns'))
+    in_utc = pyarrow.compute.any(
+        pyarrow.compute.ends_with(column, ' UTC')).as_py()
+    if not in_utc:
+        return column.cast(pyarrow.timestamp('ns'))
+    column = pyarrow.compute.replace_substring_regex(column, ' UTC$', '')
+    return column.cast(pyarrow.timestamp('ns')).cast(
+        pyarrow.timestamp('ns', tz='UTC'))
+
+
+def cast_table(table, dtype, parse_dates):
+    # Arrow version of cast_dataframe.
+    import pyarrow
+    types = dict()
+    for col, d in (dtype or dict()).items():
+        types[col] = arrow_type(d)
+    if len(types) > 0:
+        schema = pyarrow.schema(
+            [f.with_type(types[f.name]) if f.name in types else f
+             for f in table.schema])
+        table = table.cast(schema)
+    for col in parse_dates or []:
+        i = table.schema.get_field_index(col)
+        table = table.set_column(i, col, parse_timestamps(table.column(i)))
+    return table
+
+
+def csv_file_to_table(
+        local_file_path, separator, dtype, parse_dates, columns=None,
+        max_rows=None):
+    # The blocks of the file are parsed until max_rows rows are read. The
+    # columns listed in parse_dates are read as strings, then parsed.
+    import pyarrow
+    import pyarrow.csv
+    column_types = dict()
+    for col, d in (dtype or dict()).items():
+        column_types[col] = arrow_type(d)
+    for col in parse_dates or []:
+        column_types[col] = pyarrow.string()
+    reader = pyarrow.csv.open_csv(
+        local_file_path,
+        parse_options=pyarrow.csv.ParseOptions(delimiter=separator),
+        convert_options=pyarrow.csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=columns,
+            strings_can_be_null=True))
+    batches = []
+    nb_rows = 0
+    for batch in reader:
+        batches.append(batch)
+        nb_rows += batch.num_rows
+        if max_rows is not None and nb_rows >= max_rows:
+            break
+    table = pyarrow.Table.from_batches(batches, schema=reader.schema)
+    return cast_table(head(table, max_rows), None, parse_dates)
+
+
+def parquet_file_to_table(
+        local_file_path, dtype, parse_dates, columns=None, max_rows=None):
+    import pyarrow.parquet
+    if max_rows is None:
+        table = pyarrow.parquet.read_table(local_file_path, columns=columns)
+    else:
+        table = parquet_file_head(local_file_path, columns, max_rows)
+    return cast_table(table, dtype, parse_dates)
+
+
+def avro_file_to_table(
+        local_file_path, dtype, parse_dates, columns=None, max_rows=None):
+    import pyarrow
+    dataframe = avro_file_to_dataframe(
+        local_file_path, None, None, columns, max_rows)
+    table = pyarrow.Table.from_pandas(dataframe, preserve_index=False)
+    return cast_table(table, dtype, parse_dates)
+
+
+def local_file_to_table(
+        local_file_path, format, separator, dtype, parse_dates, columns=None,
+        max_rows=None):
+    dtype, parse_dates = restrict_to_columns(dtype, parse_dates, columns)
+    if format == 'parquet':
+        return parquet_file_to_table(
+            local_file_path, dtype, parse_dates, columns, max_rows)
+    if format == 'avro':
+        return avro_file_to_table(
+            local_file_path, dtype, parse_dates, columns, max_rows)
+    table = csv_file_to_table(
+        local_file_path, separator, dtype, parse_dates, columns, max_rows)
+    return select_columns(table, columns)
+
+
+def concat_results(results, result_type, max_rows=None):
+    # The tables are concatenated as the chunks of a single table, without
+    # copying their columns. Only the first max_rows rows are kept.
+    if result_type == 'arrow':
+        return head(concat_tables(results), max_rows)
+    return head(pandas.concat(unify_categories(results)), max_rows)
+
+
+def concat_tables(tables):
+    # The schemas of the tables are unified, a column full of nulls in one
+    # file taking the type it has in the others. Since pyarrow 14, the
+    # numeric types are unified as well, an integer column whose values are
+    # all null in one file being written there as a double. Before, only
+    # the null columns are.
+    import pyarrow
+    if int(pyarrow.__version__.split('.')[0]) >= 14:
+        return pyarrow.concat_tables(tables, promote_options='permissive')
+    return pyarrow.concat_tables(tables, promote=True)
+
+
+def compact_types_mapper(arrow_type):
+    # Gives to the integer and boolean columns of a pyarrow.Table nullable
+    # dtypes, instead of float64 and object when they hold nulls.
+    import pyarrow
+    if pyarrow.types.is_integer(arrow_type):
+        return pandas.api.types.pandas_dtype(
+            str(arrow_type).capitalize().replace('Uint', 'UInt'))
+    if pyarrow.types.is_boolean(arrow_type):
+        return pandas.BooleanDtype()
+    return None
+
+
+def dictionary_encode_strings(table, dtype):
+    # The string columns whose values in the first rows of the table have a
+    # low cardinality are dictionary encoded, so that they are converted to
+    # categories. The columns listed in dtype are left as they are.
+    import pyarrow
+    import pyarrow.compute
+    sample = table.slice(0, constants.COMPACT_CATEGORY_SAMPLE_SIZE)
+    for i, field in enumerate(table.schema):
+        if field.name in (dtype or dict()):
+            continue
+        if not (pyarrow.types.is_string(field.type) or
+                pyarrow.types.is_large_string(field.type)):
+            continue
+        nb_values = pyarrow.compute.count_distinct(sample.column(i)).as_py()
+        if nb_values <= constants.COMPACT_CATEGORY_MAX_RATIO * len(sample):
+            table = table.set_column(
+                i, field.name,
+                pyarrow.compute.dictionary_encode(table.column(i)))
+    return table
+
+
+def table_to_result(
+        table, result_type, dtype, parse_dates, dtype_backend,
+        compact=False):
+    # Gives to a pyarrow.Table the type and the column types the parsing of
+    # a local file would have given. With compact, the types of the columns
+    # are compacted while the table is converted.
+    if result_type == 'arrow':
+        return cast_table(table, dtype, parse_dates)
+    if compact:
+        table = dictionary_encode_strings(table, dtype)
+        dataframe = table.to_pandas(types_mapper=compact_types_mapper)
+    else:
+        dataframe = table.to_pandas()
+    dataframe = cast_dataframe(dataframe, dtype, parse_dates)
+    dataframe = convert_dtype_backend(
+        dataframe, dtype, parse_dates, dtype_backend)
+    return dataframe
+
+
+def iter_csv_file_to_dataframes(
+        local_file_path, separator, dtype, parse_dates, chunksize):
+    with pandas.read_csv(
+            filepath_or_buffer=local_file_path,
+            sep=separator,
+            dtype=dtype,
+            parse_dates=parse_dates,
+            skip_blank_lines=False,
+            chunksize=chunksize) as reader:
+        yield from reader
+
+
+def iter_parquet_file_to_dataframes(
+        local_file_path, dtype, parse_dates, chunksize):
+    import pyarrow.parquet
+    parquet_file = pyarrow.parquet.ParquetFile(local_file_path)
+    for batch in parquet_file.iter_batches(batch_size=chunksize):
+        yield cast_dataframe(batch.to_pandas(), dtype, parse_dates)
+
+
+def iter_avro_file_to_dataframes(
+        local_file_path, dtype, parse_dates, chunksize):
+    import fastavro
+    with open(local_file_path, 'rb') as f:
+        reader = fastavro.reader(f)
+        avro_schema = reader.writer_schema
+        while True:
+            records = list(itertools.islice(reader, chunksize))
+            if len(records) == 0:
+                return
+            yield avro_records_to_dataframe(
+                records, avro_schema, dtype, parse_dates)
+
+
+def iter_local_file_to_dataframes(
+        local_file_path, format, separator, dtype, parse_dates, chunksize):
+    if chunksize is None:
+        yield local_file_to_dataframe(
+            local_file_path, format, separator, dtype, parse_dates, None,
+            None)
+    elif format == 'parquet':
+        yield from iter_parquet_file_to_dataframes(
+            local_file_path, dtype, parse_dates, chunksize)
+    elif format == 'avro':
+        yield from iter_avro_file_to_dataframes(
+            local_file_path, dtype, parse_dates, chunksize)
+    else:
+        yield from iter_csv_file_to_dataframes(
+            local_file_path, separator, dtype, parse_dates, chunksize)
+
+
+def dataframe_to_csv_file(
+        dataframe, local_file_path, separator, compression,
+        compression_level):
+    if compression == 'none':
+        compression = None
+    elif compression_level is not None:
+        compression = {'method': compression,
+                       'compresslevel': compression_level}
+    dataframe.to_csv(
+        path_or_buf=local_file_path,
+        sep=separator,
+        index=False,
+        compression=compression)
+
+
+def coerce_parquet_columns(dataframe, bq_schema):
+    # The DATE and TIMESTAMP columns are converted so that their Parquet
+    # types match the BigQuery ones.
+    dataframe = dataframe.copy(deep=False)
+    for field in bq_schema or []:
+        col = field.name
+        if field.field_type == 'DATE':
+            dataframe[col] = pandas.to_datetime(dataframe[col]).dt.date
+        elif field.field_type == 'TIMESTAMP':
+            dataframe[col] = pandas.to_datetime(dataframe[col], utc=True)
+    return dataframe
+
+
+def dataframe_to_parquet_file(
+        dataframe, local_file_path, bq_schema, compression,
+        compression_level):
+    dataframe = coerce_parquet_columns(dataframe, bq_schema)
+    dataframe.to_parquet(
+        path=local_file_path,
+        index=False,
+        compression=None if compression == 'none' else compression,
+        compression_level=compression_level)
+
+
+_AVRO_TYPES = {
+    'STRING': 'string',
+    'INTEGER': 'long',
+    'INT64': 'long',
+    'FLOAT': 'double',
+    'FLOAT64': 'double',
+    'BOOLEAN': 'boolean',
+    'BOOL': 'boolean',
+    'DATE': {'type': 'int', 'logicalType': 'date'},
+    'TIMESTAMP': {'type': 'long', 'logicalType': 'timestamp-micros'}}
+
+
+def bq_schema_to_avro_schema(bq_schema):
+    fields = []
+    for field in bq_schema:
+        if field.field_type not in _AVRO_TYPES:
+            msg = (f'The BigQuery type {field.field_type} of the column '
+                   f'{field.name} cannot be written to an Avro file')
+            raise ValueError(msg)
+        fields.append({
+            'name': field.name,
+            'type': ['null', _AVRO_TYPES[field.field_type]]})
+    return {'type': 'record', 'name': 'Row', 'fields': fields}
+
+
+def avro_records(dataframe, bq_schema):
+    # The columns are converted to the Python objects fastavro expects for
+    # their BigQuery type, the missing values being written as nulls.
+    columns = dict()
+    for field in bq_schema:
+        col = dataframe[field.name]
+        if field.field_type == 'DATE':
+            col = pandas.to_datetime(col).dt.date
+        elif field.field_type == 'TIMESTAMP':
+            col = pandas.to_datetime(col, utc=True)
+        col = col.astype(object).where(col.notna(), None)
+        columns[field.name] = col.tolist()
+    names = list(columns)
+    return (dict(zip(names, values)) for values in zip(*columns.values()))
+
+
+def dataframe_to_avro_file(
+        dataframe, path_or_buffer, bq_schema, compression,
+        compression_level):
+    # path_or_buffer is a path or a binary file object, like the first
+    # argument of pandas.DataFrame.to_parquet.
+    if not isinstance(path_or_buffer, str):
+        dataframe_to_avro_stream(
+            dataframe, path_or_buffer, bq_schema, compression,
+            compression_level, max(len(dataframe), 1))
+        return
+    with open(path_or_buffer, 'wb') as f:
+        dataframe_to_avro_stream(
+            dataframe, f, bq_schema, compression, compression_level,
+            max(len(dataframe), 1))
+
+
+_ARROW_TYPE_NAMES = {
+    'STRING': 'string',
+    'INTEGER': 'int64',
+    'INT64': 'int64',
+    'FLOAT': 'float64',
+    'FLOAT64': 'float64',
+    'BOOLEAN': 'bool_',
+    'BOOL': 'bool_',
+    'DATE': 'date32'}
+
+
+def bq_schema_to_arrow_schema(bq_schema):
+    import pyarrow
+    fields = []
+    for field in bq_schema:
+        if field.field_type == 'TIMESTAMP':
+            type_ = pyarrow.timestamp('us', tz='UTC')
+        elif field.field_type in _ARROW_TYPE_NAMES:
+            type_ = getattr(pyarrow, _ARROW_TYPE_NAMES[field.field_type])()
+        else:
+            msg = (f'The BigQuery type {field.field_type} of the column '
+                   f'{field.name} cannot be written with the Storage Write '
+                   f'API')
+            raise ValueError(msg)
+        fields.append(pyarrow.field(field.name, type_))
+    return pyarrow.schema(fields)
+
+
+def split_record_batch(record_batch, max_bytes):
+    # A batch of a single row is never split.
+    if record_batch.nbytes <= max_bytes or record_batch.num_rows <= 1:
+        yield record_batch
+        return
+    middle = record_batch.num_rows // 2
+    yield from split_record_batch(record_batch.slice(0, middle), max_bytes)
+    yield from split_record_batch(record_batch.slice(middle), max_bytes)
+
+
+def iter_record_batches(dataframe, arrow_schema, nb_rows, max_bytes):
+    # Yields the rows of the dataframe as record batches of arrow_schema of
+    # at most nb_rows rows and, when possible, at most max_bytes bytes.
+    import pyarrow
+    for chunk in iter_row_chunks(dataframe, nb_rows):
+        if len(chunk) == 0:
+            continue
+        chunk = chunk[arrow_schema.names]
+        table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+        table = table.cast(arrow_schema)
+        for record_batch in table.combine_chunks().to_batches():
+            yield from split_record_batch(record_batch, max_bytes)
+
+
+def iter_row_chunks(dataframe, nb_rows):
+    # An empty dataframe gives one empty chunk, so that its header is
+    # written.
+    for start in range(0, max(len(dataframe), 1), nb_rows):
+        yield dataframe.iloc[start: start + nb_rows]
+
+
+def dataframe_to_csv_stream(
+        dataframe, stream, separator, compression, compression_level,
+        nb_rows):
+    if compression == 'gzip':
+        kwargs = dict()
+        if compression_level is not None:
+            kwargs['compresslevel'] = compression_level
+        stream = gzip.GzipFile(fileobj=stream, mode='wb', **kwargs)
+    for i, chunk in enumerate(iter_row_chunks(dataframe, nb_rows)):
+        csv = chunk.to_csv(sep=separator, index=False, header=(i == 0))
+        stream.write(csv.encode())
+    if compression == 'gzip':
+        # Writes the end of the gzip stream, without closing the
+        # underlying one.
+        stream.close()
+
+
+def dataframe_to_parquet_stream(
+        dataframe, stream, bq_schema, compression, compression_level,
+        nb_rows):
+    import pyarrow
+    import pyarrow.parquet
+    schema = pyarrow.Schema.from_pandas(
+        coerce_parquet_columns(dataframe, bq_schema), preserve_index=False)
+    writer = pyarrow.parquet.ParquetWriter(
+        stream,
+        schema,
+        compression=compression,
+        compression_level=compression_level)
+    with writer:
+        for chunk in iter_row_chunks(dataframe, nb_rows):
+            chunk = coerce_parquet_columns(chunk, bq_schema)
+            writer.write_table(pyarrow.Table.from_pandas(
+                chunk, schema=schema, preserve_index=False))
+
+
+def dataframe_to_avro_stream(
+        dataframe, stream, bq_schema, compression, compression_level,
+        nb_rows):
+    import fastavro
+    records = itertools.chain.from_iterable(
+        avro_records(chunk, bq_schema)
+        for chunk in iter_row_chunks(dataframe, nb_rows))
+    fastavro.writer(
+        fo=stream,
+        schema=fastavro.parse_schema(bq_schema_to_avro_schema(bq_schema)),
+        records=records,
+        codec='null' if compression == 'none' else compression,
+        codec_compression_level=compression_level)
+
+
+def dataframe_to_stream(
+        dataframe, stream, format, separator, bq_schema, compression,
+        compression_level, nb_rows):
+    # Encodes and compresses the dataframe nb_rows rows at a time into a
+    # binary file object, so that the whole file is never held in memory.
+    if format == 'parquet':
+        dataframe_to_parquet_stream(
+            dataframe, stream, bq_schema, compression, compression_level,
+            nb_rows)
+    elif format == 'avro':
+        dataframe_to_avro_stream(
+            dataframe, stream, bq_schema, compression, compression_level,
+            nb_rows)
+    else:
+        dataframe_to_csv_stream(
+            dataframe, stream, separator, compression, compression_level,
+            nb_rows)
+
+
+_END_OF_PIPELINE = object()
+
+
+def run_pipeline(produce, consume, items, max_queue_size):
+    # produce runs on the items one after the other in a background thread
+    # and consume runs on its outputs, in the same order, in the calling
+    # thread. At most max_queue_size outputs wait to be consumed. Returns
+    # the outputs of consume and the time spent in each stage.
+    outputs = queue.Queue(maxsize=max_queue_size)
+    stop = threading.Event()
+    durations = [0., 0.]
+
+    def put(output, error):
+        while not stop.is_set():
+            try:
+                outputs.put((output, error), timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def producer():
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+                start = time.monotonic()
+                output = produce(item)
+                durations[0] += time.monotonic() - start
+                put(output, None)
+        except BaseException as e:
+            put(None, e)
+        else:
+            put(_END_OF_PIPELINE, None)
+
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+    res = []
+    try:
+        while True:
+            output, error = outputs.get()
+            if error is not None:
+                raise error
+            if output is _END_OF_PIPELINE:
+                break
+            start = time.monotonic()
+            res.append(consume(output))
+            durations[1] += time.monotonic() - start
+    finally:
+        stop.set()
+        thread.join()
+    return res, durations
+
+
+class ByteBudget:
+    # Bounds the number of bytes reserved at the same time by several
+    # threads. A reservation bigger than max_bytes is granted only when
+    # nothing else is reserved, so that it cannot wait forever.
+    def __init__(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._reserved_bytes = 0
+        self._condition = threading.Condition()
+
+    def _can_reserve(self, nb_bytes):
+        if self._max_bytes is None or self._reserved_bytes == 0:
+            return True
+        return self._reserved_bytes + nb_bytes <= self._max_bytes
+
+    @contextmanager
+    def reserve(self, nb_bytes):
+        with self._condition:
+            self._condition.wait_for(lambda: self._can_reserve(nb_bytes))
+            self._reserved_bytes += nb_bytes
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._reserved_bytes -= nb_bytes
+                self._condition.notify_all()
+
+
+class UploadPool:
+    # The threads and the ByteBudget shared by the uploads of several
+    # configurations.
+    def __init__(self, max_workers, max_bytes_in_flight):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.budget = ByteBudget(max_bytes_in_flight)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._executor.shutdown(wait=True)
+
+    def map(self, function, iterable):
+        return map_in_executor(self._executor, function, iterable)
 
 
 def timestamp_randint_string():
@@ -45,3 +1073,156 @@ def check_data_name_not_contain_slash(data_name):
     if '/' in data_name:
         msg = f'data_name={data_name} must not contain a /'
         raise ValueError(msg)
+
+
+def compute_deadline(timeout):
+    if timeout is None:
+        return None
+    return time.monotonic() + timeout
+
+
+def seconds_before_deadline(deadline):
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0)
+
+
+def check_positive_integer(value, name):
+    if type(value) != int or value < 1:
+        msg = f'{name} must be a positive integer'
+        raise ValueError(msg)
+
+
+def check_boolean(value, name):
+    if not isinstance(value, bool):
+        msg = f'{name} must be a boolean'
+        raise ValueError(msg)
+
+
+def check_read_engine_value(read_engine):
+    if read_engine not in constants.READ_ENGINES:
+        msg = "read_engine must be one of 'extract' or 'storage'"
+        raise ValueError(msg)
+
+
+def check_write_engine_value(write_engine):
+    if write_engine not in constants.WRITE_ENGINES:
+        msg = "write_engine must be one of 'load_job' or 'storage'"
+        raise ValueError(msg)
+
+
+_QUOTED = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)""")
+
+
+def normalize_query(query):
+    # Collapses the whitespace outside of the quoted strings and
+    # identifiers, and removes the final semicolons. The line breaks are
+    # kept since they end the comments.
+    parts = _QUOTED.split(query.strip().rstrip(';').strip())
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r'[ \t]+', ' ', parts[i])
+        parts[i] = re.sub(r'\s*\n\s*', '\n', parts[i])
+    return ''.join(parts)
+
+
+def read_manifest(manifest_path):
+    if not os.path.isfile(manifest_path):
+        return dict()
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def write_manifest(manifest_path, manifest):
+    # The manifest is replaced at once, so that it is never read half
+    # written.
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def blob_version(blob):
+    return {
+        'generation': blob.generation,
+        'crc32c': blob.crc32c,
+        'md5_hash': blob.md5_hash}
+
+
+def local_file_version(local_file_path):
+    stat = os.stat(local_file_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def local_file_crc32c(local_file_path):
+    import google_crc32c
+    # Encoded like the crc32c of a blob: base64 of the big-endian checksum.
+    checksum = google_crc32c.Checksum()
+    with open(local_file_path, 'rb') as f:
+        for chunk in iter(
+                lambda: f.read(constants.CHECKSUM_CHUNK_SIZE), b''):
+            checksum.update(chunk)
+    return base64.b64encode(checksum.digest()).decode('utf-8')
+
+
+def projection_query(from_item, columns, max_rows):
+    if columns is None:
+        select_list = '*'
+    else:
+        select_list = ', '.join(f'`{col}`' for col in columns)
+    query = f'select {select_list} from {from_item}'
+    if max_rows is not None:
+        query += f' limit {max_rows}'
+    return query
+
+
+def check_columns_value(columns):
+    if type(columns) != list or len(columns) == 0:
+        raise ValueError('columns must be a non-empty list')
+
+
+def check_result_type_value(result_type):
+    if result_type not in constants.RESULT_TYPES:
+        msg = "result_type must be one of 'pandas' or 'arrow'"
+        raise ValueError(msg)
+
+
+def file_extension(format, compression):
+    # Only a CSV file is compressed as a whole. The other formats compress
+    # their blocks and keep their extension.
+    extension = constants.FILE_EXTENSIONS[format]
+    if format == 'csv' and compression == 'gzip':
+        extension += '.gz'
+    return extension
+
+
+def check_compression_value(format, compression):
+    compressions = constants.COMPRESSIONS[format]
+    if compression not in compressions:
+        msg = (f'compression must be one of '
+               f'{" or ".join(repr(c) for c in compressions)} '
+               f'when format={format!r}')
+        raise ValueError(msg)
+
+
+def check_compression_level_value(compression_level):
+    if type(compression_level) != int:
+        msg = 'compression_level must be an integer'
+        raise ValueError(msg)
+
+
+def check_engine_value(engine):
+    if engine not in constants.CSV_ENGINES:
+        msg = "engine must be one of 'c' or 'python' or 'pyarrow'"
+        raise ValueError(msg)
+
+
+def check_dtype_backend_value(dtype_backend):
+    if dtype_backend not in constants.DTYPE_BACKENDS:
+        msg = "dtype_backend must be one of 'numpy_nullable' or 'pyarrow'"
+        raise ValueError(msg)
+
+
+def check_format_value(format):
+    if format not in constants.FORMATS:
+        msg = "format must be one of 'csv' or 'parquet' or 'avro'"
+        raise ValueError(msg)
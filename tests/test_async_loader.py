@@ -0,0 +1,82 @@
+import time
+import asyncio
+import pandas
+import google_pandas_load
+from tests import utils
+
+
+class AsyncLoaderTest(utils.base_class.BaseClassTest):
+    def test_load_query_to_dataframe(self):
+        expected = pandas.DataFrame(data={'x': [3, 2], 'y': ['a', 'b']})
+        gpl = utils.loader.create_async_loader()
+        computed = asyncio.run(gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, 'a' as y union all select 2 as x, 'b' as y"))
+        self.assert_pandas_equal(expected, computed)
+
+    def test_multi_load(self):
+        expected1 = pandas.DataFrame(data={'x': [3, 10]})
+        expected2 = pandas.DataFrame(data={'y': [4]})
+        utils.populate.populate()
+        config1 = google_pandas_load.LoadConfig(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected1,
+            data_name='a10')
+        config2 = google_pandas_load.LoadConfig(
+            source='query',
+            destination='dataframe',
+            query='select 4 as y')
+        gpl = utils.loader.create_async_loader(
+            bucket_dir_path=utils.constants.bucket_subdir_path)
+        load_results = asyncio.run(gpl.multi_load([config1, config2]))
+        self.assertTrue(load_results[0] is None)
+        computed1 = utils.load.dataset_to_dataframe('a10')
+        self.assert_pandas_equal(expected1, computed1)
+        self.assert_pandas_equal(expected2, load_results[1])
+
+    def test_concurrent_loads(self):
+        gpl = utils.loader.create_async_loader()
+
+        async def run():
+            return await asyncio.gather(
+                gpl.load(source='query', destination='dataframe',
+                         query='select 1 as x'),
+                gpl.load(source='query', destination='dataframe',
+                         query='select 2 as x'))
+
+        computed1, computed2 = asyncio.run(run())
+        self.assert_pandas_equal(
+            pandas.DataFrame(data={'x': [1]}), computed1)
+        self.assert_pandas_equal(
+            pandas.DataFrame(data={'x': [2]}), computed2)
+
+    def test_first_local_load_error_waits_for_the_others(self):
+        ended = []
+
+        def run(seconds):
+            if seconds == 0:
+                raise ValueError('failed')
+            time.sleep(seconds)
+            ended.append(seconds)
+
+        async def map_until_failure():
+            await google_pandas_load.AsyncLoader.\
+                _map_in_executor_until_failure(run, [0.5, 0])
+
+        with self.assertRaises(ValueError):
+            asyncio.run(map_until_failure())
+        self.assertEqual([0.5], ended)
+
+    def test_config_schedule(self):
+        gpl = utils.loader.create_async_loader(schedule='config')
+        configs = [
+            google_pandas_load.LoadConfig(
+                source='query', destination='dataframe',
+                query=f'select {i} as x')
+            for i in range(2)]
+        computed = asyncio.run(gpl.multi_load(configs))
+        for i in range(2):
+            self.assert_pandas_equal(
+                pandas.DataFrame(data={'x': [i]}), computed[i])
@@ -1,7 +1,9 @@
 import numpy
 import pandas
+import google_pandas_load
 from datetime import datetime, timezone
 from google.cloud import bigquery
+from google_pandas_load import constants
 from tests import utils
 
 
@@ -106,6 +108,49 @@ class CastTest(utils.base_class.BaseClassTest):
         self.assertEqual(('p', 'TIMESTAMP'), (f16.name, f16.field_type))
         self.assertEqual(('q', 'DATE'), (f17.name, f17.field_type))
 
+    def test_bq_schema_inferred_from_sample_of_object_column(self):
+        nb_rows = 10 * constants.SCHEMA_INFERENCE_SAMPLE_SIZE
+        df = pandas.DataFrame(data={'x': pandas.Series(
+            list(range(nb_rows - 1)) + ['a'], dtype=object)})
+        f1, = google_pandas_load.LoadConfig.bq_schema_inferred_from_dataframe(
+            dataframe=df, strict=True)
+        self.assertEqual(('x', 'STRING'), (f1.name, f1.field_type))
+        f1, = google_pandas_load.LoadConfig.bq_schema_inferred_from_dataframe(
+            dataframe=df)
+        self.assertEqual(('x', 'INTEGER'), (f1.name, f1.field_type))
+
+    def test_strict_schema_inference(self):
+        nb_rows = 10 * constants.SCHEMA_INFERENCE_SAMPLE_SIZE
+        df0 = pandas.DataFrame(data={'x': pandas.Series(
+            list(range(nb_rows - 1)) + ['a'], dtype=object)})
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_subdir_path,
+            local_dir_path=utils.constants.local_subdir_path,
+            strict_schema_inference=True)
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            dataframe=df0,
+            data_name='a100')
+        table_id = utils.ids.build_table_id('a100')
+        table = utils.constants.bq_client.get_table(table_id)
+        f1, = table.schema
+        self.assertEqual(('x', 'STRING'), (f1.name, f1.field_type))
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_subdir_path,
+            local_dir_path=utils.constants.local_subdir_path)
+        config = google_pandas_load.LoadConfig(
+            source='dataframe',
+            destination='dataset',
+            dataframe=df0,
+            data_name='a101',
+            strict_schema_inference=True)
+        gpl.multi_load([config])
+        table_id = utils.ids.build_table_id('a101')
+        table = utils.constants.bq_client.get_table(table_id)
+        f1, = table.schema
+        self.assertEqual(('x', 'STRING'), (f1.name, f1.field_type))
+
     def test_bq_schema_inferred_with_source_local(self):
         datetime1 = datetime.strptime('2012-11-14 14:32:30',
                                       '%Y-%m-%d %H:%M:%S')
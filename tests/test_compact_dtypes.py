@@ -0,0 +1,51 @@
+import pandas
+from google.cloud import bigquery
+from tests import utils
+
+
+class CompactDtypesTest(utils.base_class.BaseClassTest):
+    def test_query_to_dataframe(self):
+        gpl = utils.loader.create_loader()
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, 'a' as y, 'u1' as z union all "
+                  "select null as x, 'a' as y, 'u2' as z",
+            compact_dtypes=True)
+        self.assertEqual(pandas.Int64Dtype(), computed['x'].dtype)
+        self.assertIsInstance(computed['y'].dtype, pandas.CategoricalDtype)
+        self.assertEqual(object, computed['z'].dtype)
+
+    def test_storage_read_engine(self):
+        gpl = utils.loader.create_loader(read_engine='storage')
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 300 as x, 'a' as y union all "
+                  "select null as x, 'a' as y",
+            compact_dtypes=True)
+        self.assertEqual(pandas.Int64Dtype(), computed['x'].dtype)
+        self.assertIsInstance(computed['y'].dtype, pandas.CategoricalDtype)
+
+    def test_local_to_dataframe_with_bq_schema(self):
+        df = pandas.DataFrame(data={
+            'x': pandas.array([1, None], dtype='Int64'),
+            'y': ['a', 'a']})
+        bq_schema = [
+            bigquery.SchemaField(name='x', field_type='INTEGER'),
+            bigquery.SchemaField(name='y', field_type='STRING')]
+        gpl = utils.loader.create_loader()
+        gpl.load(
+            source='dataframe',
+            destination='local',
+            data_name='a10',
+            dataframe=df)
+        computed = gpl.load(
+            source='local',
+            destination='dataframe',
+            data_name='a10',
+            bq_schema=bq_schema,
+            dtype={'y': str},
+            compact_dtypes=True)
+        self.assertEqual(pandas.Int64Dtype(), computed['x'].dtype)
+        self.assertEqual(object, computed['y'].dtype)
@@ -36,3 +36,48 @@ class CompressTest(utils.base_class.BaseClassTest):
             data_name='b100')
         local_file_path = utils.ids.build_local_file_path_1('b100.csv.gz')
         self.assertTrue(is_gz_file(local_file_path))
+
+    def test_no_compression_query_to_bucket(self):
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_subdir_path,
+            compression='none')
+        gpl.load(
+            source='query',
+            destination='bucket',
+            query='select 5',
+            data_name='b100')
+        blob_name = utils.ids.build_blob_name_2('b100-000000000000.csv')
+        local_file_path = utils.ids.build_local_file_path_1(
+            'b100-000000000000.csv')
+        utils.load.bucket_to_local(blob_name, local_file_path)
+        self.assertFalse(is_gz_file(local_file_path))
+
+    def test_compression_level_dataframe_to_local(self):
+        gpl = utils.loader.create_loader_quick_setup(
+            project_id=None,
+            dataset_name=None,
+            bucket_name=None,
+            local_dir_path=utils.constants.local_subdir_path,
+            compression_level=1)
+        gpl.load(
+            source='dataframe',
+            destination='local',
+            dataframe=pandas.DataFrame(data={'x': [1]}),
+            data_name='b100')
+        local_file_path = utils.ids.build_local_file_path_1('b100.csv.gz')
+        self.assertTrue(is_gz_file(local_file_path))
+
+    def test_zstd_dataframe_to_dataset(self):
+        expected = pandas.DataFrame(
+            data={'x': [1, 2, 3], 'y': ['a', 'b', 'c']})
+        gpl = utils.loader.create_loader_quick_setup()
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected,
+            data_name='b100',
+            format='parquet',
+            compression='zstd',
+            compression_level=3)
+        computed = utils.load.dataset_to_dataframe('b100')
+        self.assert_pandas_equal(expected, computed)
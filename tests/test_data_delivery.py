@@ -89,6 +89,68 @@ class DataDeliveryTest(utils.base_class.BaseClassTest):
             data_name='a10')
         self.assert_pandas_equal(expected, computed)
 
+    def test_bucket_to_local_with_several_download_workers(self):
+        utils.populate.populate_bucket()
+        gpl = utils.loader.create_loader(
+            bq_client=None,
+            dataset_id=None,
+            local_dir_path=utils.constants.local_subdir_path,
+            max_download_workers=3)
+        gpl.load(
+            source='bucket',
+            destination='local',
+            data_name='a')
+        for i in range(7, 12):
+            expected = pandas.DataFrame(data={'x': [f'a{i}_bucket']})
+            local_file_path = utils.ids.build_local_file_path_1(f'a{i}')
+            computed = utils.load.local_to_dataframe(local_file_path)
+            self.assert_pandas_equal(expected, computed)
+
+    def test_bucket_to_dataframe_pipelined(self):
+        expected = pandas.DataFrame(data={
+            'x': [f'a{i}_bucket' for i in range(9, 14)]})
+        utils.populate.populate_bucket()
+        gpl = utils.loader.create_loader(
+            bq_client=None,
+            dataset_id=None,
+            bucket_dir_path=utils.constants.bucket_subdir_path,
+            local_dir_path=utils.constants.local_subdir_path,
+            pipelined=True)
+        computed = gpl.load(
+            source='bucket',
+            destination='dataframe',
+            data_name='a')
+        self.assert_pandas_equal(expected, computed)
+        self.assertFalse(gpl.exist_in_local('a'))
+
+    def test_bucket_to_dataframe_streamed(self):
+        expected = pandas.DataFrame(data={
+            'x': [f'a{i}_bucket' for i in range(9, 14)]})
+        utils.populate.populate_bucket()
+        gpl = utils.loader.create_loader(
+            bq_client=None,
+            dataset_id=None,
+            bucket_dir_path=utils.constants.bucket_subdir_path,
+            local_dir_path=None,
+            max_download_workers=3,
+            stream_downloads=True)
+        computed = gpl.load(
+            source='bucket',
+            destination='dataframe',
+            data_name='a')
+        self.assert_pandas_equal(expected, computed)
+
+    def test_query_to_dataframe_streamed(self):
+        expected = pandas.DataFrame(data={'x': [3], 'y': ['a']})
+        gpl = utils.loader.create_loader(
+            local_dir_path=None,
+            stream_downloads=True)
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, 'a' as y")
+        self.assert_pandas_equal(expected, computed)
+
     def test_local_to_bucket(self):
         expected = pandas.DataFrame(data={'y': ['c', 'a', 'b']})
         local_file_path = utils.ids.build_local_file_path_0('b')
@@ -104,6 +166,26 @@ class DataDeliveryTest(utils.base_class.BaseClassTest):
         computed = utils.load.bucket_to_dataframe(blob_name, decompress=False)
         self.assert_pandas_equal(expected, computed)
 
+    def test_multi_local_to_bucket_with_several_upload_workers(self):
+        utils.populate.populate_local()
+        configs = [
+            google_pandas_load.LoadConfig(
+                source='local', destination='bucket', data_name=n)
+            for n in ['a7', 'a8', 'a9']]
+        gpl = utils.loader.create_loader(
+            bq_client=None,
+            dataset_id=None,
+            bucket_dir_path=utils.constants.bucket_dir_path,
+            max_upload_workers=2,
+            max_upload_bytes_in_flight=1)
+        gpl.multi_load(configs)
+        for i in range(7, 10):
+            expected = pandas.DataFrame(data={'x': [f'a{i}_local']})
+            blob_name = utils.ids.build_blob_name_1(f'a{i}')
+            computed = utils.load.bucket_to_dataframe(
+                blob_name, decompress=False)
+            self.assert_pandas_equal(expected, computed)
+
     def test_local_to_dataframe(self):
         expected = pandas.DataFrame(data={'x': [
             f'a{i}_local' for i in range(10, 13)]})
@@ -117,6 +199,20 @@ class DataDeliveryTest(utils.base_class.BaseClassTest):
             data_name='a1')
         self.assert_pandas_equal(expected, computed)
 
+    def test_local_to_dataframe_with_several_parse_workers(self):
+        expected = pandas.DataFrame(data={
+            'x': [f'a{i}_local' for i in [10, 11, 7, 8, 9]]})
+        utils.populate.populate_local()
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_dir_path,
+            max_parse_workers=3)
+        computed = gpl.load(
+            source='local',
+            destination='dataframe',
+            data_name='a')
+        pandas.testing.assert_frame_equal(
+            expected, computed.reset_index(drop=True))
+
     def test_dataframe_to_dataset(self):
         expected = pandas.DataFrame(data={'x': [1, 2, 3], 'y': [1, 2, 4]})
         utils.populate.populate()
@@ -129,6 +225,32 @@ class DataDeliveryTest(utils.base_class.BaseClassTest):
         computed = utils.load.dataset_to_dataframe('a1')
         self.assert_pandas_equal(expected, computed)
 
+    def test_dataframe_to_dataset_directly(self):
+        expected = pandas.DataFrame(data={'x': [1, 2, 3], 'y': [1, 2, 4]})
+        gpl = utils.loader.create_loader(
+            gs_client=None,
+            bucket_name=None,
+            local_dir_path=None,
+            max_direct_upload_bytes=10**6)
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected,
+            data_name='a1')
+        computed = utils.load.dataset_to_dataframe('a1')
+        self.assert_pandas_equal(expected, computed)
+
+    def test_dataframe_to_dataset_above_max_direct_upload_bytes(self):
+        expected = pandas.DataFrame(data={'x': [1, 2, 3], 'y': [1, 2, 4]})
+        gpl = utils.loader.create_loader(max_direct_upload_bytes=1)
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected,
+            data_name='a1')
+        computed = utils.load.dataset_to_dataframe('a1')
+        self.assert_pandas_equal(expected, computed)
+
     def test_dataframe_to_bucket(self):
         expected = pandas.DataFrame(data={'x': [1, 2, 3], 'y': [1, 2, 4]})
         utils.populate.populate()
@@ -142,6 +264,51 @@ class DataDeliveryTest(utils.base_class.BaseClassTest):
         computed = utils.load.bucket_to_dataframe(blob_name, decompress=True)
         self.assert_pandas_equal(expected, computed)
 
+    def test_dataframe_to_bucket_streamed(self):
+        expected = pandas.DataFrame(data={'x': [1, 2, 3], 'y': [1, 2, 4]})
+        utils.populate.populate()
+        gpl = utils.loader.create_loader(
+            local_dir_path=None,
+            stream_uploads=True)
+        gpl.load(
+            source='dataframe',
+            destination='bucket',
+            dataframe=expected,
+            data_name='a1')
+        blob_name = utils.ids.build_blob_name_0('a1.csv.gz')
+        computed = utils.load.bucket_to_dataframe(blob_name, decompress=True)
+        self.assert_pandas_equal(expected, computed)
+
+    def test_dataframe_to_bucket_streamed_error_leaves_no_blob(self):
+        df = pandas.DataFrame(data={'x': [1, 'a']})
+        gpl = utils.loader.create_loader(
+            local_dir_path=None,
+            stream_uploads=True,
+            format='parquet')
+        with self.assertRaises(ValueError):
+            gpl.load(
+                source='dataframe',
+                destination='bucket',
+                dataframe=df,
+                data_name='a1',
+                bq_schema=[bigquery.SchemaField('x', 'INTEGER')])
+        self.assertFalse(gpl.exist_in_bucket('a1'))
+
+    def test_dataframe_to_dataset_streamed(self):
+        expected = pandas.DataFrame(data={'x': [1, 2, 3], 'y': [1, 2, 4]})
+        gpl = utils.loader.create_loader(
+            local_dir_path=None,
+            stream_uploads=True,
+            format='parquet')
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected,
+            data_name='a1')
+        computed = utils.load.dataset_to_dataframe('a1')
+        self.assert_pandas_equal(expected, computed)
+        self.assertFalse(gpl.exist_in_bucket('a1'))
+
     def test_upload_download(self):
         expected = pandas.DataFrame(data={'x': [1], 'y': [3]})
         utils.populate.populate()
@@ -229,6 +396,32 @@ class DataDeliveryTest(utils.base_class.BaseClassTest):
             blob_name, decompress=True)
         self.assert_pandas_equal(expected3, computed3)
 
+    def test_heterogeneous_configs_scheduled_by_config(self):
+        expected1 = pandas.DataFrame(data={'x': [3, 10]})
+        expected2 = pandas.DataFrame(data={'y': [4]})
+        utils.populate.populate()
+        config1 = google_pandas_load.LoadConfig(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected1,
+            data_name='a10')
+        config2 = google_pandas_load.LoadConfig(
+            source='query',
+            destination='dataframe',
+            query='select 4 as y')
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_subdir_path,
+            schedule='config')
+        load_results = gpl.multi_load([config1, config2])
+        self.assertEqual(len(load_results), 2)
+        self.assertTrue(load_results[0] is None)
+
+        computed1 = utils.load.dataset_to_dataframe('a10')
+        self.assert_pandas_equal(expected1, computed1)
+
+        computed2 = load_results[1]
+        self.assert_pandas_equal(expected2, computed2)
+
     def test_no_skip_blank_lines(self):
         df0 = pandas.DataFrame(data={'x': [3, numpy.nan]})
         df1 = pandas.DataFrame(data={'x': [numpy.nan, 4]})
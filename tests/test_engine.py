@@ -0,0 +1,68 @@
+import pandas
+import pyarrow
+from tests import utils
+
+
+class EngineTest(utils.base_class.BaseClassTest):
+    def test_pyarrow_engine(self):
+        expected = pandas.DataFrame(data={
+            'x': [3, 2],
+            'y': pandas.to_datetime(['2020-01-01', '2020-01-02'])})
+        gpl = utils.loader.create_loader()
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, '2020-01-01' as y "
+                  "union all select 2 as x, '2020-01-02' as y",
+            parse_dates=['y'],
+            engine='pyarrow')
+        self.assert_pandas_equal(expected, computed)
+
+    def test_pyarrow_dtype_backend(self):
+        gpl = utils.loader.create_loader()
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, 'a' as y, '2020-01-01' as z",
+            dtype={'x': 'float64'},
+            parse_dates=['z'],
+            engine='pyarrow',
+            dtype_backend='pyarrow')
+        self.assertEqual('float64', computed['x'].dtype)
+        self.assertEqual('string[pyarrow]', computed['y'].dtype)
+        self.assertTrue(
+            pyarrow.types.is_timestamp(computed['z'].dtype.pyarrow_dtype))
+
+    def test_numpy_nullable_dtype_backend_with_parse_dates(self):
+        expected = pandas.DataFrame(data={
+            'x': pandas.array([3, None], dtype='Int64'),
+            't': pandas.to_datetime(
+                ['2020-01-01 10:00:00.5', None], utc=True)})
+        gpl = utils.loader.create_loader()
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, "
+                  "timestamp '2020-01-01 10:00:00.5' as t "
+                  "union all select null as x, null as t",
+            parse_dates=['t'],
+            dtype_backend='numpy_nullable')
+        self.assertEqual('Int64', computed['x'].dtype)
+        self.assertEqual('datetime64[ns, UTC]', computed['t'].dtype)
+        self.assert_pandas_equal(expected, computed)
+
+    def test_pyarrow_engine_with_max_rows(self):
+        df = pandas.DataFrame(data={'x': [3, 2, 1], 'y': ['a', 'b', 'c']})
+        gpl = utils.loader.create_loader()
+        gpl.load(
+            source='dataframe',
+            destination='local',
+            data_name='a10',
+            dataframe=df)
+        computed = gpl.load(
+            source='local',
+            destination='dataframe',
+            data_name='a10',
+            engine='pyarrow',
+            max_rows=2)
+        self.assert_pandas_equal(df.head(2), computed)
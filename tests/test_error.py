@@ -60,6 +60,106 @@ class LoaderInitErrorTest(utils.base_class.BaseClassTest):
         msg = 'bucket_dir_path must not end with /'
         self.assertEqual(msg, str(cm.exception))
 
+    def test_raise_error_if_max_download_workers_not_positive(self):
+        msg = 'max_download_workers must be a positive integer'
+
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(max_download_workers=0)
+        self.assertEqual(msg, str(cm.exception))
+
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(max_download_workers=2.5)
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_max_upload_workers_not_positive(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(max_upload_workers=0)
+        msg = 'max_upload_workers must be a positive integer'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_max_upload_bytes_in_flight_not_positive(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(max_upload_bytes_in_flight=-1)
+        msg = 'max_upload_bytes_in_flight must be a positive integer'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_max_parse_workers_not_positive(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(max_parse_workers=0)
+        msg = 'max_parse_workers must be a positive integer'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_pipelined_not_boolean(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(pipelined='yes')
+        msg = 'pipelined must be a boolean'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_skip_unchanged_uploads_not_boolean(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(skip_unchanged_uploads='yes')
+        msg = 'skip_unchanged_uploads must be a boolean'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_sync_downloads_not_boolean(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(sync_downloads='yes')
+        msg = 'sync_downloads must be a boolean'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_stream_downloads_not_boolean(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(stream_downloads='yes')
+        msg = 'stream_downloads must be a boolean'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_stream_uploads_not_boolean(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(stream_uploads='yes')
+        msg = 'stream_uploads must be a boolean'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_max_direct_upload_bytes_not_positive(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(max_direct_upload_bytes=0)
+        msg = 'max_direct_upload_bytes must be a positive integer'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_invalid_format(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(format='json')
+        msg = "format must be one of 'csv' or 'parquet' or 'avro'"
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_invalid_compression(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(compression='zstd')
+        msg = "compression must be one of 'none' or 'gzip' when format='csv'"
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_compression_level_not_integer(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(compression_level='high')
+        msg = 'compression_level must be an integer'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_compression_invalid_for_loader_format(self):
+        gpl = utils.loader.create_loader()
+        with self.assertRaises(ValueError) as cm:
+            gpl.load(
+                source='query',
+                destination='dataframe',
+                query='select 3',
+                compression='snappy')
+        msg = "compression must be one of 'none' or 'gzip' when format='csv'"
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_invalid_schedule(self):
+        with self.assertRaises(ValueError) as cm:
+            utils.loader.create_loader(schedule='step')
+        msg = "schedule must be one of 'stage' or 'config'"
+        self.assertEqual(msg, str(cm.exception))
+
 
 class LoaderQuickSetupInitTest(utils.base_class.BaseClassTest):
     def test_raise_error_if_d_and_b_none_project_id_not_none(self):
@@ -146,6 +246,103 @@ class LoadConfigErrorTest(utils.base_class.BaseClassTest):
         msg = "dataframe must be provided if source = 'dataframe'"
         self.assertEqual(msg, str(cm.exception))
 
+    def test_raise_error_if_invalid_format(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='query', destination='dataframe',
+                query='select 3', format='json')
+        msg = "format must be one of 'csv' or 'parquet' or 'avro'"
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_invalid_result_type(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='query', destination='dataframe',
+                query='select 3', result_type='polars')
+        msg = "result_type must be one of 'pandas' or 'arrow'"
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_invalid_engine(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='query', destination='dataframe',
+                query='select 3', engine='polars')
+        msg = "engine must be one of 'c' or 'python' or 'pyarrow'"
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_invalid_dtype_backend(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='query', destination='dataframe',
+                query='select 3', dtype_backend='numpy')
+        msg = "dtype_backend must be one of 'numpy_nullable' or 'pyarrow'"
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_invalid_read_engine(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='dataset', destination='dataframe',
+                data_name='a0', read_engine='export')
+        msg = "read_engine must be one of 'extract' or 'storage'"
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_invalid_write_engine(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='dataframe', destination='dataset',
+                data_name='a0', dataframe=pandas.DataFrame({'x': [1]}),
+                write_engine='streaming')
+        msg = "write_engine must be one of 'load_job' or 'storage'"
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_invalid_columns(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='query', destination='dataframe',
+                query='select 3', columns='x')
+        self.assertEqual('columns must be a non-empty list', str(cm.exception))
+
+    def test_raise_error_if_max_rows_not_positive(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='query', destination='dataframe',
+                query='select 3', max_rows=0)
+        self.assertEqual(
+            'max_rows must be a positive integer', str(cm.exception))
+
+    def test_raise_error_if_compact_dtypes_not_boolean(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='query', destination='dataframe',
+                query='select 3', compact_dtypes='yes')
+        msg = 'compact_dtypes must be a boolean'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_chunksize_not_positive(self):
+        with self.assertRaises(ValueError) as cm:
+            google_pandas_load.LoadConfig(
+                source='query', destination='dataframe',
+                query='select 3', chunksize=0)
+        msg = 'chunksize must be a positive integer'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_chunksize_passed_to_multi_load(self):
+        config = google_pandas_load.LoadConfig(
+            source='query', destination='dataframe',
+            query='select 3', chunksize=1)
+        gpl = utils.loader.create_loader()
+        with self.assertRaises(ValueError) as cm:
+            gpl.multi_load([config])
+        msg = 'chunksize is only supported by iter_load, not by multi_load'
+        self.assertEqual(msg, str(cm.exception))
+
+    def test_raise_error_if_iter_load_with_storage_read_engine(self):
+        gpl = utils.loader.create_loader(read_engine='storage')
+        with self.assertRaises(ValueError) as cm:
+            gpl.iter_load(source='query', query='select 3')
+        msg = "iter_load does not support read_engine='storage'"
+        self.assertEqual(msg, str(cm.exception))
+
     def test_raise_error_if_infer_bq_schema_from_no_columns_dataframe(self):
         with self.assertRaises(ValueError) as cm:
             google_pandas_load.LoadConfig.bq_schema_inferred_from_dataframe(
@@ -252,6 +449,39 @@ class LoadErrorTest(utils.base_class.BaseClassTest):
                 source='query', destination='dataset',
                 query='selectt 3', data_name='a3')
 
+    def test_raise_error_of_first_failed_job(self):
+        config1 = google_pandas_load.LoadConfig(
+            source='query', destination='dataset',
+            query='select 3', data_name='a3')
+        config2 = google_pandas_load.LoadConfig(
+            source='query', destination='dataset',
+            query='selectt 4', data_name='a4')
+        with self.assertRaises(google.cloud.exceptions.BadRequest):
+            utils.loader.create_loader().multi_load(
+                configs=[config1, config2])
+
+    def test_raise_error_of_first_failed_chain(self):
+        config1 = google_pandas_load.LoadConfig(
+            source='query', destination='dataframe',
+            query='select 3', data_name='a3')
+        config2 = google_pandas_load.LoadConfig(
+            source='query', destination='dataset',
+            query='selectt 4', data_name='a4')
+        with self.assertRaises(google.cloud.exceptions.BadRequest):
+            utils.loader.create_loader(schedule='config').multi_load(
+                configs=[config1, config2])
+
+    def test_raise_error_if_deadline_exceeded(self):
+        config = google_pandas_load.LoadConfig(
+            source='query', destination='dataset',
+            query='select 3', data_name='a3')
+        with self.assertRaises(TimeoutError) as cm:
+            utils.loader.create_loader().multi_load(
+                configs=[config], deadline=0)
+        self.assertEqual(
+            '1 BigQuery job(s) did not end before the deadline',
+            str(cm.exception))
+
     def test_raise_error_if_write_empty_and_already_exists(self):
         utils.populate.populate_dataset()
         utils.populate.populate_local()
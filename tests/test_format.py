@@ -0,0 +1,120 @@
+import pandas
+from google.cloud import bigquery
+from tests import utils
+
+
+class ParquetFormatTest(utils.base_class.BaseClassTest):
+    def test_query_to_dataframe(self):
+        expected = pandas.DataFrame(data={'x': [3, 2], 'y': ['a', 'b']})
+        gpl = utils.loader.create_loader(format='parquet')
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, 'a' as y union all select 2 as x, 'b' as y")
+        self.assert_pandas_equal(expected, computed)
+
+    def test_dataset_to_bucket(self):
+        utils.populate.populate_dataset()
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_subdir_path,
+            local_dir_path=None,
+            format='parquet')
+        gpl.load(
+            source='dataset',
+            destination='bucket',
+            data_name='a8')
+        blob_name = utils.ids.build_blob_name_2('a8-000000000000.parquet')
+        self.assertTrue(utils.exist.blob_exists(blob_name))
+
+    def test_dataframe_to_dataset(self):
+        expected = pandas.DataFrame(data={
+            'x': [1, 2, 3],
+            'y': ['2020-01-01', '2020-01-02', '2020-01-03']})
+        gpl = utils.loader.create_loader_quick_setup()
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected,
+            data_name='a1',
+            date_cols=['y'],
+            format='parquet')
+        table = utils.constants.bq_client.get_table(
+            utils.ids.build_table_id('a1'))
+        self.assertEqual(
+            [bigquery.SchemaField(name='x', field_type='INTEGER'),
+             bigquery.SchemaField(name='y', field_type='DATE')],
+            [bigquery.SchemaField(name=f.name, field_type=f.field_type)
+             for f in table.schema])
+        computed = utils.load.dataset_to_dataframe('a1')
+        computed['y'] = computed['y'].astype(str)
+        self.assert_pandas_equal(expected, computed)
+
+    def test_upload_download(self):
+        expected = pandas.DataFrame(data={'x': [1.5], 'y': ['a']})
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_subdir_path,
+            format='parquet')
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected,
+            data_name='a9')
+        computed = gpl.load(
+            source='dataset',
+            destination='dataframe',
+            data_name='a9')
+        pandas.testing.assert_frame_equal(
+            expected, computed.reset_index(drop=True))
+
+
+class AvroFormatTest(utils.base_class.BaseClassTest):
+    def test_query_to_dataframe(self):
+        expected = pandas.DataFrame(data={
+            'x': [3],
+            't': pandas.to_datetime(['2020-01-01 10:00:00'], utc=True)})
+        gpl = utils.loader.create_loader(format='avro')
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, timestamp('2020-01-01 10:00:00') as t")
+        self.assert_pandas_equal(expected, computed)
+
+    def test_numeric_and_date_are_typed(self):
+        expected = pandas.DataFrame(data={
+            'n': [1.5],
+            'd': pandas.to_datetime(['2020-01-02'])})
+        gpl = utils.loader.create_loader(format='avro')
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select numeric '1.5' as n, date('2020-01-02') as d")
+        self.assert_pandas_equal(expected, computed)
+
+    def test_dataset_to_bucket(self):
+        utils.populate.populate_dataset()
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_subdir_path,
+            local_dir_path=None,
+            format='avro')
+        gpl.load(
+            source='dataset',
+            destination='bucket',
+            data_name='a8')
+        blob_name = utils.ids.build_blob_name_2('a8-000000000000.avro')
+        self.assertTrue(utils.exist.blob_exists(blob_name))
+
+    def test_dataframe_to_dataset(self):
+        expected = pandas.DataFrame(data={
+            'x': [1, 2, None],
+            'y': ['a', None, 'c']})
+        gpl = utils.loader.create_loader_quick_setup(format='avro')
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected,
+            data_name='a1')
+        computed = gpl.load(
+            source='dataset',
+            destination='dataframe',
+            data_name='a1')
+        self.assert_pandas_equal(expected, computed)
@@ -0,0 +1,49 @@
+import pandas
+from tests import utils
+
+
+class IterLoadTest(utils.base_class.BaseClassTest):
+    def test_iter_load_query(self):
+        expected = pandas.DataFrame(data={'x': [3, 2], 'y': ['a', 'b']})
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_dir_path,
+            local_dir_path=utils.constants.local_subdir_path)
+        dataframes = list(gpl.iter_load(
+            source='query',
+            query="select 3 as x, 'a' as y union all select 2 as x, 'b' as y",
+            data_name='b1'))
+        computed = pandas.concat(dataframes)
+        self.assert_pandas_equal(expected, computed)
+        local_file_path = utils.ids.build_local_file_path_1(
+            'b1-000000000000.csv.gz')
+        self.assertFalse(utils.exist.local_file_exists(local_file_path))
+
+    def test_iter_load_local_with_chunksize(self):
+        gpl = utils.loader.create_loader(
+            bq_client=None,
+            dataset_id=None,
+            gs_client=None,
+            bucket_name=None)
+        dataframe = pandas.DataFrame(data={'x': list(range(5))})
+        local_file_path = utils.ids.build_local_file_path_0('b1')
+        utils.load.dataframe_to_local(dataframe, local_file_path)
+        dataframes = list(gpl.iter_load(
+            source='local',
+            data_name='b1',
+            chunksize=2))
+        self.assertEqual([2, 2, 1], [len(df) for df in dataframes])
+        self.assert_pandas_equal(dataframe, pandas.concat(dataframes))
+        self.assertTrue(utils.exist.local_file_exists(local_file_path))
+
+    def test_iter_load_close_clears_local(self):
+        utils.populate.populate_bucket()
+        gpl = utils.loader.create_loader(
+            bq_client=None,
+            dataset_id=None,
+            local_dir_path=utils.constants.local_subdir_path)
+        iterator = gpl.iter_load(source='bucket', data_name='a')
+        next(iterator)
+        iterator.close()
+        for i in range(7, 12):
+            local_file_path = utils.ids.build_local_file_path_1(f'a{i}')
+            self.assertFalse(utils.exist.local_file_exists(local_file_path))
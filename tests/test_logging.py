@@ -61,3 +61,42 @@ class LoggingTest(utils.base_class.BaseClassTest):
             pattern = re.compile(regexp)
             log = formatter.format(records[1])
             self.assertIsNotNone(pattern.search(log))
+
+    def test_bucket_to_dataframe_pipelined(self):
+        utils.populate.populate_bucket()
+        with self.assertLogs('google_pandas_load.loader', level='DEBUG') as cm:
+            gpl = utils.loader.create_loader(
+                bq_client=None,
+                dataset_id=None,
+                bucket_dir_path=utils.constants.bucket_dir_path,
+                pipelined=True)
+            gpl.load(
+                source='bucket',
+                destination='dataframe',
+                data_name='a10')
+            records = cm.records
+            self.assertEqual(5, len(records))
+            regexp = (r'^google_pandas_load.loader # DEBUG # '
+                      r'Pipelined a10 \[download [0-9]+s, parse [0-9]+s\]$')
+            pattern = re.compile(regexp)
+            log = formatter.format(records[2])
+            self.assertIsNotNone(pattern.search(log))
+            log = formatter.format(records[4])
+            self.assertEqual(
+                'google_pandas_load.loader # DEBUG # '
+                'Reused metadata [1 call(s) saved]',
+                log)
+
+    def test_query_to_dataframe_reused_metadata(self):
+        with self.assertLogs('google_pandas_load.loader', level='DEBUG') as cm:
+            gpl = utils.loader.create_loader()
+            gpl.load(
+                source='query',
+                destination='dataframe',
+                query='select 3',
+                data_name='a0')
+            log = formatter.format(cm.records[-1])
+            self.assertEqual(
+                'google_pandas_load.loader # DEBUG # '
+                'Reused metadata [2 call(s) saved]',
+                log)
@@ -0,0 +1,87 @@
+import pandas
+import pyarrow
+from tests import utils
+
+
+class ProjectionTest(utils.base_class.BaseClassTest):
+    def test_query_to_dataframe(self):
+        gpl = utils.loader.create_loader()
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, 'a' as y, 4 as z union all "
+                  "select 3 as x, 'b' as y, 4 as z;",
+            columns=['z', 'x'],
+            max_rows=1)
+        expected = pandas.DataFrame(data={'z': [4], 'x': [3]})
+        self.assert_pandas_equal(expected, computed)
+
+    def test_dataset_to_dataframe(self):
+        utils.load.multi_query_to_dataset(
+            ["select 3 as x, 'a' as y union all select 2 as x, 'b' as y"],
+            ['a10'])
+        gpl = utils.loader.create_loader()
+        computed = gpl.load(
+            source='dataset',
+            destination='dataframe',
+            data_name='a10',
+            columns=['y'],
+            parse_dates=['x'])
+        computed = computed.sort_values('y').reset_index(drop=True)
+        expected = pandas.DataFrame(data={'y': ['a', 'b']})
+        self.assert_pandas_equal(expected, computed)
+        self.assertTrue(gpl.exist_in_dataset('a10'))
+        self.assertFalse(gpl.exist_in_bucket('a10'))
+        self.assertFalse(gpl.exist_in_local('a10'))
+
+    def test_storage_read_engine(self):
+        utils.populate.populate_dataset()
+        gpl = utils.loader.create_loader(read_engine='storage')
+        computed = gpl.load(
+            source='dataset',
+            destination='dataframe',
+            data_name='a10',
+            columns=['x'],
+            max_rows=1)
+        expected = pandas.DataFrame(data={'x': ['a10_dataset']})
+        self.assert_pandas_equal(expected, computed)
+
+    def test_local_to_dataframe(self):
+        df = pandas.DataFrame(data={'x': [1, 2, 3], 'y': ['a', 'b', 'c']})
+        for format in ['csv', 'parquet', 'avro']:
+            gpl = utils.loader.create_loader(format=format)
+            gpl.load(
+                source='dataframe',
+                destination='local',
+                data_name='a10',
+                dataframe=df)
+            computed = gpl.load(
+                source='local',
+                destination='dataframe',
+                data_name='a10',
+                columns=['y'],
+                max_rows=2)
+            expected = pandas.DataFrame(data={'y': ['a', 'b']})
+            self.assert_pandas_equal(expected, computed)
+            computed = gpl.load(
+                source='local',
+                destination='dataframe',
+                data_name='a10',
+                columns=['y', 'x'],
+                max_rows=2,
+                result_type='arrow')
+            self.assertEqual(['y', 'x'], computed.column_names)
+            self.assertEqual(2, computed.num_rows)
+            gpl.delete_in_local('a10')
+
+    def test_max_rows_across_files(self):
+        utils.populate.populate_local()
+        gpl = utils.loader.create_loader(max_parse_workers=2)
+        computed = gpl.load(
+            source='local',
+            destination='dataframe',
+            data_name='a1',
+            max_rows=1,
+            result_type='arrow')
+        self.assertTrue(
+            pyarrow.table({'x': ['a10_local']}).equals(computed))
@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import pandas
+import google.cloud.exceptions
+import google_pandas_load
+from tests import utils
+
+
+class ResultCacheTest(utils.base_class.BaseClassTest):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir_path)
+        super().tearDown()
+
+    def test_hit_and_miss(self):
+        cache = google_pandas_load.ResultCache(self.cache_dir_path)
+        gpl = utils.loader.create_loader(result_cache=cache)
+        expected = pandas.DataFrame(data={'x': [3]})
+        computed = gpl.load(
+            source='query', destination='dataframe', query='select 3 as x')
+        self.assert_pandas_equal(expected, computed)
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+        gpl = utils.loader.create_loader(
+            gs_client=None, bucket_name=None, local_dir_path=None,
+            result_cache=cache)
+        computed = gpl.load(
+            source='query', destination='dataframe',
+            query='select  3 as x;')
+        self.assert_pandas_equal(expected, computed)
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_parse_options_are_part_of_the_key(self):
+        cache = google_pandas_load.ResultCache(self.cache_dir_path)
+        gpl = utils.loader.create_loader(result_cache=cache)
+        gpl.load(
+            source='query', destination='dataframe', query='select 3 as x')
+        computed = gpl.load(
+            source='query', destination='dataframe', query='select 3 as x',
+            dtype={'x': 'float64'})
+        self.assertEqual('float64', computed['x'].dtype)
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_dataset_is_part_of_the_key(self):
+        cache = google_pandas_load.ResultCache(self.cache_dir_path)
+        gpl = utils.loader.create_loader(result_cache=cache)
+        gpl.load(
+            source='query', destination='dataframe', query='select 3 as x')
+        gpl = utils.loader.create_loader(
+            dataset_id=f'{utils.constants.project_id}.missing_dataset',
+            result_cache=cache)
+        with self.assertRaises(google.cloud.exceptions.NotFound):
+            gpl.load(
+                source='query', destination='dataframe',
+                query='select 3 as x')
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_engines_are_part_of_the_key(self):
+        cache = google_pandas_load.ResultCache(self.cache_dir_path)
+        gpl = utils.loader.create_loader(result_cache=cache)
+        gpl.load(
+            source='query', destination='dataframe', query='select 3 as x')
+        gpl.load(
+            source='query', destination='dataframe', query='select 3 as x',
+            engine='python')
+        gpl.load(
+            source='query', destination='dataframe', query='select 3 as x',
+            read_engine='storage')
+        self.assertEqual((0, 3), (cache.hits, cache.misses))
+
+    def test_ttl(self):
+        cache = google_pandas_load.ResultCache(self.cache_dir_path, ttl=1)
+        cache.put('k', pandas.DataFrame(data={'x': [3]}))
+        os.utime(os.path.join(self.cache_dir_path, 'k.parquet'), (0, 0))
+        self.assertIsNone(cache.get('k', 'pandas'))
+        self.assertEqual([], os.listdir(self.cache_dir_path))
+
+    def test_lru_eviction(self):
+        df = pandas.DataFrame(data={'x': list(range(100))})
+        cache = google_pandas_load.ResultCache(self.cache_dir_path)
+        cache.put('k0', df)
+        size = os.path.getsize(os.path.join(self.cache_dir_path, 'k0.parquet'))
+        cache = google_pandas_load.ResultCache(
+            self.cache_dir_path, max_bytes=2 * size)
+        cache.put('k1', df)
+        os.utime(os.path.join(self.cache_dir_path, 'k1.parquet'), (0, 0))
+        cache.get('k0', 'pandas')
+        cache.put('k2', df)
+        self.assertEqual(
+            ['k0.parquet', 'k2.parquet'],
+            sorted(os.listdir(self.cache_dir_path)))
@@ -0,0 +1,59 @@
+import pyarrow
+from tests import utils
+
+
+class ResultTypeTest(utils.base_class.BaseClassTest):
+    def test_query_to_dataframe(self):
+        gpl = utils.loader.create_loader()
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, 'a' as y",
+            result_type='arrow')
+        expected = pyarrow.table({'x': [3], 'y': ['a']})
+        self.assertTrue(expected.equals(computed))
+
+    def test_local_to_dataframe(self):
+        utils.populate.populate_local()
+        gpl = utils.loader.create_loader(max_parse_workers=2)
+        computed = gpl.load(
+            source='local',
+            destination='dataframe',
+            data_name='a1',
+            result_type='arrow')
+        expected = pyarrow.table({'x': ['a10_local', 'a11_local']})
+        self.assertTrue(expected.equals(computed.combine_chunks()))
+        self.assertEqual(2, computed.column('x').num_chunks)
+
+    def test_dtype_and_parse_dates(self):
+        gpl = utils.loader.create_loader(format='parquet')
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, '2020-01-01' as y",
+            dtype={'x': 'float64'},
+            parse_dates=['y'],
+            result_type='arrow')
+        self.assertEqual(pyarrow.float64(), computed.schema.field('x').type)
+        self.assertEqual(
+            pyarrow.timestamp('ns'), computed.schema.field('y').type)
+
+    def test_parse_dates_of_csv_timestamp(self):
+        gpl = utils.loader.create_loader()
+        query = "select timestamp('2020-01-01 10:00:00') as t"
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query=query,
+            parse_dates=['t'],
+            result_type='arrow')
+        self.assertEqual(
+            pyarrow.timestamp('ns', tz='UTC'),
+            computed.schema.field('t').type)
+        expected = gpl.load(
+            source='query',
+            destination='dataframe',
+            query=query,
+            parse_dates=['t'])
+        self.assertEqual(expected['t'].dtype, computed.to_pandas()['t'].dtype)
+        self.assertEqual(expected['t'][0], computed.to_pandas()['t'][0])
@@ -0,0 +1,40 @@
+import pandas
+from tests import utils
+
+
+class SkipUnchangedUploadsTest(utils.base_class.BaseClassTest):
+    def setUp(self):
+        super().setUp()
+        utils.populate.populate_local()
+        self.gpl = utils.loader.create_loader(skip_unchanged_uploads=True)
+        self.local_file_path = utils.ids.build_local_file_path_0('a7')
+        self.blob_name = utils.ids.build_blob_name_0('a7')
+
+    def generation(self):
+        return utils.constants.bucket.get_blob(self.blob_name).generation
+
+    def test_unchanged_file_is_not_uploaded(self):
+        self.gpl.load(source='local', destination='bucket', data_name='a7')
+        generation = self.generation()
+        self.gpl.load(source='local', destination='bucket', data_name='a7')
+        self.assertEqual(generation, self.generation())
+
+    def test_changed_file_is_uploaded(self):
+        self.gpl.load(source='local', destination='bucket', data_name='a7')
+        expected = pandas.DataFrame(data={'x': ['a7_changed']})
+        utils.load.dataframe_to_local(expected, self.local_file_path)
+        self.gpl.load(source='local', destination='bucket', data_name='a7')
+        computed = utils.load.bucket_to_dataframe(
+            self.blob_name, decompress=False)
+        self.assert_pandas_equal(expected, computed)
+
+    def test_blob_without_local_file_is_deleted(self):
+        self.gpl.load(source='local', destination='bucket', data_name='a7')
+        utils.delete.delete_local_file(self.local_file_path)
+        extra_local_file_path = utils.ids.build_local_file_path_0('a7_bis')
+        utils.load.dataframe_to_local(
+            pandas.DataFrame(data={'x': ['a7_bis']}), extra_local_file_path)
+        self.gpl.load(source='local', destination='bucket', data_name='a7')
+        self.assertFalse(utils.exist.blob_exists(self.blob_name))
+        self.assertTrue(utils.exist.blob_exists(
+            utils.ids.build_blob_name_0('a7_bis')))
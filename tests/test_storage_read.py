@@ -0,0 +1,125 @@
+import unittest
+import pandas
+import pyarrow
+from argparse import Namespace
+from google_pandas_load import Loader
+from tests import utils
+
+
+class StorageReadTest(utils.base_class.BaseClassTest):
+    def test_query_to_dataframe(self):
+        gpl = utils.loader.create_loader(
+            gs_client=None, bucket_name=None, local_dir_path=None,
+            read_engine='storage', max_download_workers=2)
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query="select 3 as x, 'a' as y, date('2020-01-01') as z")
+        expected = pandas.DataFrame(
+            data={'x': [3], 'y': ['a'],
+                  'z': [pandas.Timestamp('2020-01-01').date()]})
+        self.assert_pandas_equal(expected, computed)
+
+    def test_dataset_to_dataframe(self):
+        utils.populate.populate_dataset()
+        gpl = utils.loader.create_loader(max_download_workers=2)
+        computed = gpl.load(
+            source='dataset',
+            destination='dataframe',
+            data_name='a10',
+            read_engine='storage')
+        expected = pandas.DataFrame(data={'x': ['a10_dataset']})
+        self.assert_pandas_equal(expected, computed)
+        self.assertTrue(gpl.exist_in_dataset('a10'))
+        self.assertFalse(gpl.exist_in_bucket('a10'))
+        self.assertFalse(gpl.exist_in_local('a10'))
+
+    def test_result_type(self):
+        gpl = utils.loader.create_loader(read_engine='storage')
+        computed = gpl.load(
+            source='query',
+            destination='dataframe',
+            query='select 3 as x limit 0',
+            dtype={'x': 'float64'},
+            result_type='arrow')
+        self.assertEqual(0, computed.num_rows)
+        self.assertEqual(pyarrow.float64(), computed.schema.field('x').type)
+
+
+class FakeBQClient:
+    project = 'p'
+
+    @staticmethod
+    def get_table(table_id):
+        return Namespace(table_id=table_id)
+
+
+class FakeReadRowsStream:
+    def __init__(self, table):
+        self._table = table
+
+    def to_arrow(self, session):
+        return self._table
+
+    def rows(self, session):
+        pages = [
+            Namespace(
+                to_arrow=lambda b=b: pyarrow.Table.from_batches([b]),
+                num_items=b.num_rows)
+            for b in self._table.to_batches(max_chunksize=1)]
+        return Namespace(pages=pages)
+
+
+class FakeBQStorageClient:
+    """Serves the tables of its streams, one stream per table."""
+    def __init__(self, tables, schema):
+        self._tables = tables
+        self._schema = schema
+        self.max_stream_counts = []
+
+    def create_read_session(self, parent, read_session, max_stream_count):
+        self.max_stream_counts.append(max_stream_count)
+        tables = self._tables[:max_stream_count]
+        serialized_schema = self._schema.serialize().to_pybytes()
+        return Namespace(
+            streams=[Namespace(name=str(i)) for i in range(len(tables))],
+            arrow_schema=Namespace(serialized_schema=serialized_schema))
+
+    def read_rows(self, name):
+        return FakeReadRowsStream(self._tables[int(name)])
+
+
+class StorageReadFakeClientTest(unittest.TestCase):
+    schema = pyarrow.schema([('x', pyarrow.int64())])
+
+    def load(self, tables, **kwargs):
+        bqstorage_client = FakeBQStorageClient(tables, self.schema)
+        gpl = Loader(
+            bq_client=FakeBQClient(), dataset_id='p.d',
+            bqstorage_client=bqstorage_client, read_engine='storage',
+            max_download_workers=2)
+        computed = gpl.load(
+            source='dataset', destination='dataframe', data_name='a10',
+            **kwargs)
+        return computed, bqstorage_client.max_stream_counts
+
+    def test_streams_are_concatenated_in_order(self):
+        tables = [pyarrow.table({'x': [1, 2]}, schema=self.schema),
+                  pyarrow.table({'x': [3]}, schema=self.schema)]
+        computed, max_stream_counts = self.load(tables)
+        expected = pandas.DataFrame(data={'x': [1, 2, 3]})
+        pandas.testing.assert_frame_equal(expected, computed)
+        self.assertEqual([2], max_stream_counts)
+
+    def test_empty_table_keeps_the_session_schema(self):
+        computed, _ = self.load([], result_type='arrow')
+        self.assertEqual(0, computed.num_rows)
+        self.assertEqual(self.schema, computed.schema)
+
+    def test_max_rows_reads_a_single_stream(self):
+        tables = [pyarrow.table({'x': [1, 2, 3]}, schema=self.schema),
+                  pyarrow.table({'x': [4]}, schema=self.schema)]
+        computed, max_stream_counts = self.load(tables, max_rows=2)
+        expected = pandas.DataFrame(data={'x': [1, 2]})
+        pandas.testing.assert_frame_equal(expected, computed)
+        self.assertEqual([1], max_stream_counts)
@@ -0,0 +1,77 @@
+import pandas
+import google.cloud.exceptions
+from tests import utils
+
+
+class StorageWriteTest(utils.base_class.BaseClassTest):
+    def test_dataframe_to_dataset(self):
+        df = pandas.DataFrame(data={'x': [3, 2], 'y': ['a', 'b']})
+        utils.populate.populate_dataset()
+        gpl = utils.loader.create_loader(
+            gs_client=None, bucket_name=None, local_dir_path=None,
+            write_engine='storage')
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            data_name='a10',
+            dataframe=df)
+        computed = utils.load.dataset_to_dataframe('a10')
+        self.assert_pandas_equal(df, computed)
+
+    def test_write_append(self):
+        df = pandas.DataFrame(data={'x': ['a10_dataframe']})
+        utils.populate.populate_dataset()
+        gpl = utils.loader.create_loader(write_engine='storage')
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            data_name='a10',
+            dataframe=df,
+            write_disposition='WRITE_APPEND')
+        expected = pandas.DataFrame(
+            data={'x': ['a10_dataframe', 'a10_dataset']})
+        computed = utils.load.dataset_to_dataframe('a10')
+        computed = computed.sort_values('x').reset_index(drop=True)
+        self.assert_pandas_equal(expected, computed)
+        self.assertFalse(gpl.exist_in_bucket('a10'))
+        self.assertFalse(gpl.exist_in_local('a10'))
+
+    def test_write_truncate_replaces_the_schema(self):
+        df = pandas.DataFrame(data={'y': [3]})
+        utils.populate.populate_dataset()
+        gpl = utils.loader.create_loader(write_engine='storage')
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            data_name='a10',
+            dataframe=df,
+            write_disposition='WRITE_TRUNCATE')
+        computed = utils.load.dataset_to_dataframe('a10')
+        self.assert_pandas_equal(df, computed)
+
+    def test_timestamp_cols(self):
+        df = pandas.DataFrame(data={
+            'x': pandas.to_datetime(['2020-01-01 12:00:00'], utc=True)})
+        gpl = utils.loader.create_loader(write_engine='storage')
+        gpl.load(
+            source='dataframe',
+            destination='dataset',
+            data_name='a10',
+            dataframe=df,
+            timestamp_cols=['x'])
+        computed = utils.load.dataset_to_dataframe('a10')
+        self.assertEqual(df['x'][0], computed['x'][0])
+
+    def test_raise_error_if_write_empty_and_not_empty(self):
+        df = pandas.DataFrame(data={'x': ['a10_dataframe']})
+        utils.populate.populate_dataset()
+        with self.assertRaises(google.cloud.exceptions.Conflict) as cm:
+            utils.loader.create_loader(write_engine='storage').load(
+                source='dataframe',
+                destination='dataset',
+                data_name='a10',
+                dataframe=df,
+                write_disposition='WRITE_EMPTY')
+        self.assertEqual(
+            str(cm.exception),
+            '409 Already Exists: Table dmp-y-tests:test_gpl.a10')
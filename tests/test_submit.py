@@ -0,0 +1,47 @@
+import concurrent.futures
+import pandas
+import google_pandas_load
+from tests import utils
+
+
+class SubmitTest(utils.base_class.BaseClassTest):
+    def test_submit(self):
+        expected1 = pandas.DataFrame(data={'x': [3, 10]})
+        expected2 = pandas.DataFrame(data={'y': [4]})
+        utils.populate.populate()
+        config1 = google_pandas_load.LoadConfig(
+            source='dataframe',
+            destination='dataset',
+            dataframe=expected1,
+            data_name='a10')
+        config2 = google_pandas_load.LoadConfig(
+            source='query',
+            destination='dataframe',
+            query='select 4 as y')
+        gpl = utils.loader.create_loader(
+            bucket_dir_path=utils.constants.bucket_subdir_path)
+        handle = gpl.submit([config1, config2])
+        self.assertEqual(7, handle.nb_stages)
+        computed2 = handle.futures[1].result()
+        self.assert_pandas_equal(expected2, computed2)
+        load_results = handle.result()
+        self.assertTrue(handle.done())
+        self.assertEqual(7, handle.nb_ended_stages)
+        self.assertIsNone(handle.current_stage)
+        self.assertTrue(load_results[0] is None)
+        computed1 = utils.load.dataset_to_dataframe('a10')
+        self.assert_pandas_equal(expected1, computed1)
+
+    def test_cancel(self):
+        config = google_pandas_load.LoadConfig(
+            source='query',
+            destination='dataframe',
+            query='select 4 as y')
+        gpl = utils.loader.create_loader(
+            local_dir_path=utils.constants.local_subdir_path)
+        handle = gpl.submit([config])
+        self.assertTrue(handle.cancel())
+        with self.assertRaises(concurrent.futures.CancelledError):
+            handle.result()
+        self.assertTrue(handle.done())
+        self.assertFalse(handle.cancel())
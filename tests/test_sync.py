@@ -0,0 +1,48 @@
+import os
+import pandas
+from tests import utils
+
+
+class SyncTest(utils.base_class.BaseClassTest):
+    def setUp(self):
+        super().setUp()
+        utils.populate.populate_bucket()
+        self.gpl = utils.loader.create_loader(sync_downloads=True)
+        self.local_file_path = utils.ids.build_local_file_path_0('a7')
+        self.manifest_path = utils.ids.build_local_file_path_0(
+            '.a7.manifest.json')
+
+    def test_first_sync_writes_manifest(self):
+        self.gpl.load(source='bucket', destination='local', data_name='a7')
+        self.assertTrue(utils.exist.local_file_exists(self.local_file_path))
+        self.assertTrue(utils.exist.local_file_exists(self.manifest_path))
+
+    def test_unchanged_blob_is_not_downloaded(self):
+        self.gpl.load(source='bucket', destination='local', data_name='a7')
+        mtime_ns = os.stat(self.local_file_path).st_mtime_ns
+        self.gpl.load(source='bucket', destination='local', data_name='a7')
+        self.assertEqual(mtime_ns, os.stat(self.local_file_path).st_mtime_ns)
+
+    def test_changed_blob_is_downloaded(self):
+        self.gpl.load(source='bucket', destination='local', data_name='a7')
+        expected = pandas.DataFrame(data={'x': ['a7_changed']})
+        blob_name = utils.ids.build_blob_name_0('a7')
+        utils.load.dataframe_to_bucket(expected, blob_name)
+        self.gpl.load(source='bucket', destination='local', data_name='a7')
+        computed = utils.load.local_to_dataframe(self.local_file_path)
+        self.assert_pandas_equal(expected, computed)
+
+    def test_deleted_blob_is_removed_from_local(self):
+        self.gpl.load(source='bucket', destination='local', data_name='a7')
+        utils.delete.delete_blob(utils.ids.build_blob_name_0('a7'))
+        self.gpl.load(source='bucket', destination='local', data_name='a7')
+        self.assertFalse(utils.exist.local_file_exists(self.local_file_path))
+
+    def test_modified_local_file_is_downloaded(self):
+        self.gpl.load(source='bucket', destination='local', data_name='a7')
+        expected = utils.load.local_to_dataframe(self.local_file_path)
+        with open(self.local_file_path, 'a') as f:
+            f.write('extra\n')
+        self.gpl.load(source='bucket', destination='local', data_name='a7')
+        computed = utils.load.local_to_dataframe(self.local_file_path)
+        self.assert_pandas_equal(expected, computed)
@@ -12,5 +12,23 @@ credentials = None
 local_dir_path = '/tmp/dir_gpl'
 local_subdir_path = local_dir_path + '/subdir'
 separator = '|'
+format = 'csv'
+compression = None
+compression_level = None
 chunk_size = 2**28
 timeout = 60
+max_download_workers = 1
+max_upload_workers = 1
+max_upload_bytes_in_flight = None
+max_parse_workers = 1
+pipelined = False
+schedule = 'stage'
+max_direct_upload_bytes = None
+stream_uploads = False
+stream_downloads = False
+read_engine = 'extract'
+write_engine = 'load_job'
+result_cache = None
+sync_downloads = False
+skip_unchanged_uploads = False
+strict_schema_inference = False
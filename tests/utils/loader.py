@@ -10,8 +10,26 @@ def create_loader(
         bucket_dir_path=None,
         local_dir_path=utils.constants.local_dir_path,
         separator=utils.constants.separator,
+        format=utils.constants.format,
+        compression=utils.constants.compression,
+        compression_level=utils.constants.compression_level,
         chunk_size=utils.constants.chunk_size,
-        timeout=utils.constants.timeout):
+        timeout=utils.constants.timeout,
+        max_download_workers=utils.constants.max_download_workers,
+        max_upload_workers=utils.constants.max_upload_workers,
+        max_upload_bytes_in_flight=utils.constants.max_upload_bytes_in_flight,
+        max_parse_workers=utils.constants.max_parse_workers,
+        pipelined=utils.constants.pipelined,
+        schedule=utils.constants.schedule,
+        max_direct_upload_bytes=utils.constants.max_direct_upload_bytes,
+        stream_uploads=utils.constants.stream_uploads,
+        stream_downloads=utils.constants.stream_downloads,
+        read_engine=utils.constants.read_engine,
+        write_engine=utils.constants.write_engine,
+        result_cache=utils.constants.result_cache,
+        sync_downloads=utils.constants.sync_downloads,
+        skip_unchanged_uploads=utils.constants.skip_unchanged_uploads,
+        strict_schema_inference=utils.constants.strict_schema_inference):
     return google_pandas_load.Loader(
         bq_client=bq_client,
         dataset_id=dataset_id,
@@ -20,8 +38,26 @@ def create_loader(
         bucket_dir_path=bucket_dir_path,
         local_dir_path=local_dir_path,
         separator=separator,
+        format=format,
+        compression=compression,
+        compression_level=compression_level,
         chunk_size=chunk_size,
-        timeout=timeout)
+        timeout=timeout,
+        max_download_workers=max_download_workers,
+        max_upload_workers=max_upload_workers,
+        max_upload_bytes_in_flight=max_upload_bytes_in_flight,
+        max_parse_workers=max_parse_workers,
+        pipelined=pipelined,
+        schedule=schedule,
+        max_direct_upload_bytes=max_direct_upload_bytes,
+        stream_uploads=stream_uploads,
+        stream_downloads=stream_downloads,
+        read_engine=read_engine,
+        write_engine=write_engine,
+        result_cache=result_cache,
+        sync_downloads=sync_downloads,
+        skip_unchanged_uploads=skip_unchanged_uploads,
+        strict_schema_inference=strict_schema_inference)
 
 
 def create_loader_quick_setup(
@@ -32,8 +68,26 @@ def create_loader_quick_setup(
         credentials=utils.constants.credentials,
         local_dir_path=utils.constants.local_dir_path,
         separator=utils.constants.separator,
+        format=utils.constants.format,
+        compression=utils.constants.compression,
+        compression_level=utils.constants.compression_level,
         chunk_size=utils.constants.chunk_size,
-        timeout=utils.constants.timeout):
+        timeout=utils.constants.timeout,
+        max_download_workers=utils.constants.max_download_workers,
+        max_upload_workers=utils.constants.max_upload_workers,
+        max_upload_bytes_in_flight=utils.constants.max_upload_bytes_in_flight,
+        max_parse_workers=utils.constants.max_parse_workers,
+        pipelined=utils.constants.pipelined,
+        schedule=utils.constants.schedule,
+        max_direct_upload_bytes=utils.constants.max_direct_upload_bytes,
+        stream_uploads=utils.constants.stream_uploads,
+        stream_downloads=utils.constants.stream_downloads,
+        read_engine=utils.constants.read_engine,
+        write_engine=utils.constants.write_engine,
+        result_cache=utils.constants.result_cache,
+        sync_downloads=utils.constants.sync_downloads,
+        skip_unchanged_uploads=utils.constants.skip_unchanged_uploads,
+        strict_schema_inference=utils.constants.strict_schema_inference):
     return google_pandas_load.LoaderQuickSetup(
         project_id=project_id,
         dataset_name=dataset_name,
@@ -42,5 +96,41 @@ def create_loader_quick_setup(
         credentials=credentials,
         local_dir_path=local_dir_path,
         separator=separator,
+        format=format,
+        compression=compression,
+        compression_level=compression_level,
         chunk_size=chunk_size,
-        timeout=timeout)
+        timeout=timeout,
+        max_download_workers=max_download_workers,
+        max_upload_workers=max_upload_workers,
+        max_upload_bytes_in_flight=max_upload_bytes_in_flight,
+        max_parse_workers=max_parse_workers,
+        pipelined=pipelined,
+        schedule=schedule,
+        max_direct_upload_bytes=max_direct_upload_bytes,
+        stream_uploads=stream_uploads,
+        stream_downloads=stream_downloads,
+        read_engine=read_engine,
+        write_engine=write_engine,
+        result_cache=result_cache,
+        sync_downloads=sync_downloads,
+        skip_unchanged_uploads=skip_unchanged_uploads,
+        strict_schema_inference=strict_schema_inference)
+
+
+def create_async_loader(
+        bq_client=utils.constants.bq_client,
+        dataset_id=utils.constants.dataset_id,
+        gs_client=utils.constants.gs_client,
+        bucket_name=utils.constants.bucket_name,
+        bucket_dir_path=None,
+        local_dir_path=utils.constants.local_subdir_path,
+        schedule=utils.constants.schedule):
+    return google_pandas_load.AsyncLoader(
+        bq_client=bq_client,
+        dataset_id=dataset_id,
+        gs_client=gs_client,
+        bucket_name=bucket_name,
+        bucket_dir_path=bucket_dir_path,
+        local_dir_path=local_dir_path,
+        schedule=schedule)